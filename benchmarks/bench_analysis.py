@@ -0,0 +1,128 @@
+"""
+Benchmarks of the analysis path: loading a model, running it, and getting the results
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import os
+import shutil
+
+# =============================================================================
+# Extension modules
+# =============================================================================
+from optvl import OVLSolver
+
+from .common import geom_dir, geometries, scaled_wing_sizes, get_geometry_files, write_scaled_wing
+
+
+class Init:
+    params = list(geometries)
+    param_names = ["geometry"]
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        self.geo_file, self.mass_file = get_geometry_files(geometry)
+
+    def time_init(self, geometry):
+        OVLSolver(geo_file=self.geo_file, mass_file=self.mass_file)
+
+    def peakmem_init(self, geometry):
+        OVLSolver(geo_file=self.geo_file, mass_file=self.mass_file)
+
+
+class Analysis:
+    params = list(geometries)
+    param_names = ["geometry"]
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.ovl.set_variable("alpha", 3.0)
+
+    def time_execute_run(self, geometry):
+        # the AIC is rebuilt for each run because the geometry is updated
+        self.ovl.avl.update_surfaces()
+        self.ovl.execute_run()
+
+    def peakmem_execute_run(self, geometry):
+        self.ovl.execute_run()
+
+    def time_execute_run_reuse_aic(self, geometry):
+        # sequential runs on the same geometry reuse the factored AIC
+        self.ovl.execute_run()
+
+    def time_update_surfaces(self, geometry):
+        self.ovl.avl.update_surfaces()
+
+    def time_get_strip_forces(self, geometry):
+        self.ovl.get_strip_forces()
+
+    def time_get_total_forces(self, geometry):
+        self.ovl.get_total_forces()
+
+
+class ScaledWing:
+    params = scaled_wing_sizes
+    param_names = ["num_vortices"]
+    timeout = 600
+
+    def setup(self, num_vortices):
+        self.geo_file = write_scaled_wing(num_vortices)
+        self.ovl = OVLSolver(geo_file=self.geo_file)
+        self.ovl.set_variable("alpha", 3.0)
+
+    def teardown(self, num_vortices):
+        shutil.rmtree(os.path.dirname(self.geo_file))
+
+    def time_init(self, num_vortices):
+        OVLSolver(geo_file=self.geo_file)
+
+    def time_execute_run(self, num_vortices):
+        self.ovl.avl.update_surfaces()
+        self.ovl.execute_run()
+
+    def peakmem_execute_run(self, num_vortices):
+        self.ovl.execute_run()
+
+    def time_update_surfaces(self, num_vortices):
+        self.ovl.avl.update_surfaces()
+
+    def time_get_strip_forces(self, num_vortices):
+        self.ovl.get_strip_forces()
+
+
+class TrimSweep:
+    params = (["aircraft", "supra"], [False, True])
+    param_names = ["geometry", "warm_start"]
+    timeout = 600
+
+    def setup(self, geometry, warm_start):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.elevator = {"aircraft": "Elevator", "supra": "elevator"}[geometry]
+        self.ovl.execute_run()
+
+    def time_execute_run_batch(self, geometry, warm_start):
+        self.ovl.execute_run_batch(
+            {"alpha": ("CL", [0.4, 0.45, 0.5, 0.55, 0.6]), self.elevator: ("Cm", [0.0] * 5)}, warm_start=warm_start
+        )
+
+
+class ContinuationSweep:
+    params = ["aircraft", "supra"]
+    param_names = ["geometry"]
+    timeout = 600
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.ovl.set_constraint("alpha", "CL", 0.4)
+        self.ovl.set_constraint({"aircraft": "Elevator", "supra": "elevator"}[geometry], "Cm", 0.0)
+        self.ovl.execute_run()
+
+    def time_continuation_sweep(self, geometry):
+        self.ovl.continuation_sweep("CL", 0.4, 1.2)
@@ -0,0 +1,90 @@
+"""
+Benchmarks of the derivative and modal analysis paths
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import os
+import shutil
+
+# =============================================================================
+# Extension modules
+# =============================================================================
+from optvl import OVLSolver
+
+from .common import geom_dir, geometries, get_geometry_files, write_scaled_wing
+
+funcs = ["CL", "CD", "Cm"]
+stab_derivs = ["dCL/dalpha", "dCm/dalpha", "dCn'/dbeta"]
+
+# elevator of the models that have a mass file
+elevators = {"aircraft": "Elevator", "supra": "elevator"}
+
+
+class Sensitivities:
+    params = list(geometries)
+    param_names = ["geometry"]
+    timeout = 600
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+
+    def time_execute_run_sensitivities(self, geometry):
+        self.ovl.execute_run_sensitivities(funcs)
+
+    def time_execute_run_sensitivities_stab_derivs(self, geometry):
+        self.ovl.execute_run_sensitivities(funcs, stab_derivs=stab_derivs)
+
+    def peakmem_execute_run_sensitivities(self, geometry):
+        self.ovl.execute_run_sensitivities(funcs, stab_derivs=stab_derivs)
+
+
+class ScaledWingSensitivities:
+    # the derivative routines touch the _DIFF copies of the AIC matrices, so the largest size is left out
+    params = [500, 2000]
+    param_names = ["num_vortices"]
+    timeout = 600
+
+    def setup(self, num_vortices):
+        self.geo_file = write_scaled_wing(num_vortices)
+        self.ovl = OVLSolver(geo_file=self.geo_file)
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+
+    def teardown(self, num_vortices):
+        shutil.rmtree(os.path.dirname(self.geo_file))
+
+    def time_execute_run_sensitivities(self, num_vortices):
+        self.ovl.execute_run_sensitivities(funcs, stab_derivs=stab_derivs)
+
+    def peakmem_execute_run_sensitivities(self, num_vortices):
+        self.ovl.execute_run_sensitivities(funcs, stab_derivs=stab_derivs)
+
+
+class EigenModes:
+    params = list(elevators)
+    param_names = ["geometry"]
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.ovl.set_trim_condition("velocity", 10.0)
+        self.ovl.set_constraint(elevators[geometry], "Cm", 0.0)
+
+    def time_execute_eigen_mode_calc(self, geometry):
+        self.ovl.execute_eigen_mode_calc()
+
+    def time_execute_eigen_sweep(self, geometry):
+        self.ovl.execute_eigen_sweep({"velocity": [10.0, 12.0, 14.0, 16.0]})
+
+    def time_get_system_matrices(self, geometry):
+        self.ovl.get_system_matrices()
+
+    def time_get_system_matrices_batch(self, geometry):
+        self.ovl.get_system_matrices_batch({"velocity": [10.0, 12.0, 14.0, 16.0]}, in_body_axis=True)
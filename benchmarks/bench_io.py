@@ -0,0 +1,39 @@
+"""
+Benchmarks of writing the solution and geometry files
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import os
+import shutil
+import tempfile
+
+# =============================================================================
+# Extension modules
+# =============================================================================
+from optvl import OVLSolver
+
+from .common import geom_dir, geometries, get_geometry_files
+
+
+class Output:
+    params = list(geometries)
+    param_names = ["geometry"]
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+        self.ovl = OVLSolver(geo_file=geo_file, mass_file=mass_file)
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+        self.output_dir = tempfile.mkdtemp(prefix="optvl_bench_")
+
+    def teardown(self, geometry):
+        shutil.rmtree(self.output_dir)
+
+    def time_write_tecplot(self, geometry):
+        self.ovl.write_tecplot(os.path.join(self.output_dir, "sol"))
+
+    def time_write_geom_file(self, geometry):
+        self.ovl.write_geom_file(os.path.join(self.output_dir, "geom.avl"))
@@ -0,0 +1,53 @@
+"""
+Benchmarks of the OpenMDAO wrapper
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import os
+
+# =============================================================================
+# External Python modules
+# =============================================================================
+import openmdao.api as om
+
+# =============================================================================
+# Extension modules
+# =============================================================================
+from optvl import OVLGroup
+
+from .common import geom_dir, get_geometry_files
+
+
+class OMGroup:
+    params = ["aircraft", "supra"]
+    param_names = ["geometry"]
+    timeout = 600
+
+    def setup(self, geometry):
+        os.chdir(geom_dir)
+        geo_file, mass_file = get_geometry_files(geometry)
+
+        model = om.Group()
+        model.add_subsystem(
+            "ovlsolver",
+            OVLGroup(geom_file=geo_file, mass_file=mass_file, output_stability_derivs=True),
+        )
+        model.add_design_var("ovlsolver.alpha", lower=-10, upper=10)
+        model.add_constraint("ovlsolver.CL", equals=0.5)
+        model.add_objective("ovlsolver.CD")
+
+        self.prob = om.Problem(model, reports=False)
+        self.prob.setup(mode="rev")
+        self.prob.set_val("ovlsolver.alpha", 3.0)
+        self.prob.run_model()
+
+    def time_run_model(self, geometry):
+        self.prob.run_model()
+
+    def time_compute_totals(self, geometry):
+        self.prob.compute_totals()
+
+    def peakmem_compute_totals(self, geometry):
+        self.prob.compute_totals()
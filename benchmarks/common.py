@@ -0,0 +1,104 @@
+"""
+Geometries and helpers shared by the benchmarks
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import os
+import tempfile
+
+# =============================================================================
+# External Python modules
+# =============================================================================
+import numpy as np
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+geom_dir = os.path.abspath(os.path.join(base_dir, "..", "geom_files"))
+
+# geometry and mass files of the models in geom_files
+geometries = {
+    "aircraft": ("aircraft.avl", "aircraft.mass"),
+    "supra": ("supra.avl", "supra.mass"),
+    "rect_with_body": ("rect_with_body.avl", None),
+}
+
+# number of vortices of the synthetic wings
+scaled_wing_sizes = [500, 2000, 5000]
+
+scaled_wing_template = """Scaled Wing
+#Mach
+0.0
+#IYsym   IZsym   Zsym
+ 0       0       0
+#Sref    Cref    b_wing
+10.0     1.0     10.0
+#Xref    Yref    Zref
+0.25     0.0     0.0
+#
+SURFACE
+Wing
+#Nchordwise  Cspace   Nspan   Sspace
+{nchord}     1.0      {nspan}      -2.0
+YDUPLICATE
+0.0
+#
+SECTION
+#Xle    Yle    Zle     Chord   Ainc
+0.0     0.0    0.0     1.2     2.0
+NACA
+2412
+CONTROL
+#Cname   Cgain  Xhinge  HingeVec     SgnDup
+flap     1.0    0.75    0. 1. 0.     1.0
+#
+SECTION
+#Xle    Yle    Zle     Chord   Ainc
+0.3     5.0    0.4     0.6     0.0
+NACA
+2412
+CONTROL
+#Cname   Cgain  Xhinge  HingeVec     SgnDup
+flap     1.0    0.75    0. 1. 0.     1.0
+"""
+
+
+def get_geometry_files(geometry):
+    """Get the absolute paths of the geometry and mass files of one of the models in geom_files
+
+    The airfoil files of the models are given relative to geom_files, so the benchmarks
+    change to `geom_dir` in their setup before loading them.
+
+    Args:
+        geometry: key of the model in `geometries`
+
+    Returns:
+        geo_file: path of the geometry file
+        mass_file: path of the mass file, or None if the model does not have one
+    """
+    geo_file, mass_file = geometries[geometry]
+    geo_file = os.path.join(geom_dir, geo_file)
+    if mass_file is not None:
+        mass_file = os.path.join(geom_dir, mass_file)
+
+    return geo_file, mass_file
+
+
+def write_scaled_wing(num_vortices):
+    """Write the geometry file of a tapered wing (with its mirror image) meshed with about `num_vortices` vortices
+
+    Args:
+        num_vortices: target number of horseshoe vortices
+
+    Returns:
+        geo_file: path of the geometry file, which is in a temporary directory
+    """
+    # keep the aspect ratio of the panels roughly constant as the mesh is refined
+    nchord = max(int(np.sqrt(num_vortices / 8)), 1)
+    nspan = num_vortices // (2 * nchord)
+
+    geo_file = os.path.join(tempfile.mkdtemp(prefix="optvl_bench_"), f"scaled_wing_{num_vortices}.avl")
+    with open(geo_file, "w") as fid:
+        fid.write(scaled_wing_template.format(nchord=nchord, nspan=nspan))
+
+    return geo_file
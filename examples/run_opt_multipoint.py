@@ -1,7 +1,7 @@
 """A openmdao based optimization for an aicraft using optvl"""
 
 import openmdao.api as om
-from optvl import OVLSolver, OVLGroup
+from optvl import OVLMultipointGroup
 import argparse
 import numpy as np
 
@@ -15,86 +15,58 @@ class Top(om.Group):
     def setup(self):
         # add independent var comps to hold design variables
         self.add_subsystem("flt_cond_dvs", om.IndepVarComp())
-        self.add_subsystem("geom_dvs", om.IndepVarComp())
         self.add_subsystem("con_surf_dvs", om.IndepVarComp())
 
         self.add_subsystem("perturbed_flt_cond", om.ExecComp(["ptb_alpha=alpha+0.1"], units="deg"))
 
+        # both points share the geometry, so it is only loaded and factored once
+        # point_0 is the cruise condition and point_1 is the perturbed cruise condition
         self.add_subsystem(
-            "cruise_avl",
-            OVLGroup(
+            "avl",
+            OVLMultipointGroup(
                 geom_file="../geom_files/aircraft.avl",
                 mass_file="../geom_files/aircraft.mass",
+                num_points=2,
                 output_stability_derivs=True,
             ),
         )
-        self.add_subsystem(
-            "perturbed_cruise_avl",
-            OVLGroup(geom_file="../geom_files/aircraft.avl", mass_file="../geom_files/aircraft.mass"),
-        )
 
     def configure(self):
         # add the flight flt_condition inputs as possible design variables
-        # BUT perturb the alpha passed into perturbed_cruise_avl
+        # BUT perturb the alpha passed into the perturbed point
         self.flt_cond_dvs.add_output("alpha", val=0.0, units="deg")
         self.flt_cond_dvs.add_output("beta", val=0.0, units="deg")
-        self.connect("flt_cond_dvs.alpha", "cruise_avl.alpha")
-        self.connect("flt_cond_dvs.beta", ["cruise_avl.beta", "perturbed_cruise_avl.beta"])
+        self.connect("flt_cond_dvs.alpha", "avl.point_0:alpha")
+        self.connect("flt_cond_dvs.beta", ["avl.point_0:beta", "avl.point_1:beta"])
 
         self.connect("flt_cond_dvs.alpha", "perturbed_flt_cond.alpha")
-        self.connect("perturbed_flt_cond.ptb_alpha", "perturbed_cruise_avl.alpha")
-
-        # add all the geometric inputs as possible design variables
-        # Connect the values of each cruise compoenent
-        geom_inputs = self.cruise_avl.solver.list_inputs(tags="geom", val=True, units=True, out_stream=None)
-        for geom_input in geom_inputs:
-            meta_data = geom_input[1]
-            units = meta_data["units"]
-            promoted_name = meta_data["prom_name"]
-            # get the initail values from the component otherwise it would be set to all 1's
-            val = meta_data["val"]
-            self.geom_dvs.add_output(promoted_name, val=val, units=units)
-
-            cruise_name = f"{self.cruise_avl.name}.{promoted_name}"
-            ptb_cruise_name = f"{self.perturbed_cruise_avl.name}.{promoted_name}"
-            self.connect(f"geom_dvs.{promoted_name}", cruise_name)
-            self.connect(f"geom_dvs.{promoted_name}", ptb_cruise_name)
+        self.connect("perturbed_flt_cond.ptb_alpha", "avl.point_1:alpha")
+
+        # the geometric inputs are shared by the points, so they can be used directly as design variables
 
         # add all the control surface inputs as possible design variables
-        # Connect the values of each cruise compoenent
-        con_surf_inputs = self.cruise_avl.solver.list_inputs(tags="con_surf", val=True, units=True, out_stream=None)
-        for con_surf_input in con_surf_inputs:
-            meta_data = con_surf_input[1]
-            units = meta_data["units"]
-            promoted_name = meta_data["prom_name"]
-            # get the initail values from the component otherwise it would be set to all 1's
-            val = meta_data["val"]
-            self.con_surf_dvs.add_output(promoted_name, val=val, units=units)
-
-            cruise_name = f"{self.cruise_avl.name}.{promoted_name}"
-            ptb_cruise_name = f"{self.perturbed_cruise_avl.name}.{promoted_name}"
-            self.connect(f"con_surf_dvs.{promoted_name}", cruise_name)
-            self.connect(f"con_surf_dvs.{promoted_name}", ptb_cruise_name)
+        # Connect the values of each point
+        for con_surf in self.avl.ovl.get_control_names():
+            self.con_surf_dvs.add_output(con_surf, val=0.0, units="deg")
+            self.connect(f"con_surf_dvs.{con_surf}", [f"avl.point_0:{con_surf}", f"avl.point_1:{con_surf}"])
 
 
 model = Top()
 
 # look at vlm_mp_opt.html to see all the design variables and add them here
 idx_sec = 4  # idx of the last section
-model.add_design_var("geom_dvs.Wing:zles", indices=[idx_sec], lower=0, upper=1)  # tip dihedral
-model.add_design_var("geom_dvs.Wing:aincs", lower=-10, upper=10)
+model.add_design_var("avl.Wing:zles", indices=[idx_sec], lower=0, upper=1)  # tip dihedral
+model.add_design_var("avl.Wing:aincs", lower=-10, upper=10)
 model.add_design_var("flt_cond_dvs.alpha", lower=-10, upper=10)
 model.add_design_var("con_surf_dvs.Elevator", lower=-10, upper=10)
 
 # the outputs of AVL can be used as contraints
-model.add_constraint("cruise_avl.CL", equals=1.5)
-model.add_constraint("cruise_avl.Cm", equals=0.0)
+model.add_constraint("avl.point_0:CL", equals=1.5)
+model.add_constraint("avl.point_0:Cm", equals=0.0)
 
-model.add_constraint(
-    "perturbed_cruise_avl.Cm", upper=-1e-3
-)  # make sure that dCM_dAlpha is less than 0 for static stability
+model.add_constraint("avl.point_1:Cm", upper=-1e-3)  # make sure that dCM_dAlpha is less than 0 for static stability
 
-model.add_objective("cruise_avl.CD", ref=1e-2)
+model.add_objective("avl.point_0:CD", ref=1e-2)
 # Some variables (like chord, dihedral, x and z leading edge position) can lead to local minimum.
 # To help fix this add a contraint that keeps the variable monotonic
 
@@ -125,7 +97,7 @@ prob.run_driver()
 # prob.run_model()
 # prob.check_totals()
 
-prob.model.cruise_avl.solver.ovl.write_geom_file("opt_airplane_mp.avl")
+prob.model.avl.ovl.write_geom_file("opt_airplane_mp.avl")
 
 if args.plot_opt_hist and args.record:
     import matplotlib.pyplot as plt
@@ -0,0 +1,20 @@
+from optvl.parallel import SweepExecutor
+import numpy as np
+
+# the workers are separate processes, so the sweep must be started under a main guard
+if __name__ == "__main__":
+    alphas = np.linspace(0.0, 10.0, 41)
+    machs = np.repeat([0.0, 0.3, 0.5], alphas.size)
+
+    # each worker loads the geometry once and is reused for all the cases sent to it
+    with SweepExecutor(geo_file="../geom_files/aircraft.avl") as executor:
+        # set the deflection of the elevator to trim the pitching moment at each case
+        conditions = {"alpha": np.tile(alphas, 3), "Elevator": ("Cm", np.zeros(machs.size))}
+        sweep_data = executor.run(conditions, parameters={"Mach": machs})
+
+    print("----------------- alpha-Mach sweep ----------------")
+    print("    Mach       Angle        Cl           Cd          Elevator")
+    for mach, case_data in zip(machs, sweep_data):
+        print(
+            f' {mach:10.6f}   {case_data["alpha"]:10.6f}   {case_data["CL"]:10.6f}   {case_data["CD"]:10.6f}   {case_data["Elevator"]:10.6f}'
+        )
@@ -1,10 +1,12 @@
 import os
+import hashlib
 import openmdao.api as om
 from optvl import OVLSolver
 import numpy as np
 import copy
 import time
 from warnings import warn
+from itertools import chain
 
 
 class OVLGroup(om.Group):
@@ -21,6 +23,10 @@ class OVLGroup(om.Group):
         output_stability_derivs: flag to turn on the output of stability derivatives
         output_body_axis_derivs: flag to turn on the output of body axis derivatives
         output_con_surf_derivs: flag to turn on the output of control surface deflections
+        output_eig_funcs: indices of the eigenvalues (see `OVLSolver.get_eigenvalues`) to output the real and imaginary parts of.
+            Their partials by the flight condition, parameters, and reference values are finite differences of the
+            system matrix (see `OVLSolver.execute_run_sensitivities`), and repeated eigenvalues are not supported
+        assemble_partials: flag to assemble the partials of the solver instead of using matrix-vector products
     """
 
     def initialize(self):
@@ -37,6 +43,9 @@ class OVLGroup(om.Group):
         self.options.declare("output_stability_derivs", types=bool, default=False)
         self.options.declare("output_body_axis_derivs", types=bool, default=False)
         self.options.declare("output_con_surf_derivs", types=bool, default=False)
+        self.options.declare("output_eig_funcs", types=list, default=[])
+
+        self.options.declare("assemble_partials", types=bool, default=False)
 
     def setup(self):
         geom_file = self.options["geom_file"]
@@ -59,6 +68,7 @@ class OVLGroup(om.Group):
                 input_param_vals=input_param_vals,
                 input_ref_vals=input_ref_vals,
                 input_airfoil_geom=input_airfoil_geom,
+                assemble_partials=self.options["assemble_partials"],
             ),
             promotes=["*"],
         )
@@ -72,6 +82,7 @@ class OVLGroup(om.Group):
                 output_stability_derivs=output_stability_derivs,
                 output_body_axis_derivs=output_body_axis_derivs,
                 output_con_surf_derivs=output_con_surf_derivs,
+                output_eig_funcs=self.options["output_eig_funcs"],
             ),
             promotes=["*"],
         )
@@ -90,21 +101,110 @@ class OVLGroup(om.Group):
             )
 
 
+class OVLMultipointGroup(om.Group):
+    """Group for analyzing several flight conditions of the same geometry with one OVLSolver.
+
+    The geometry is only loaded and factored once, and the points with the same Mach number share the factored AIC.
+    The geometric variables (and the reference values) are inputs shared by all the points.
+    The flight conditions, control surface deflections, circulations, and outputs of each point are named
+    `point_<i>:<variable>`, e.g. `point_0:alpha` and `point_0:CL`.
+
+    Args:
+        geom_file: the input geometry file
+        mass_file: the optional mass file
+        num_points: the number of flight conditions
+        input_param_vals: flag to turn on the flght parameters (Mach, Velocity, etc.) as inputs of each point
+        input_ref_val: flag to turn on the geometric reference values (Sref, Cref, Bref) as inputs
+        output_stability_derivs: flag to turn on the output of stability derivatives
+        output_body_axis_derivs: flag to turn on the output of body axis derivatives
+        output_con_surf_derivs: flag to turn on the output of control surface deflections
+    """
+
+    def initialize(self):
+        self.options.declare("geom_file", types=str)
+        self.options.declare("mass_file", default=None)
+        self.options.declare("num_points", types=int, lower=1)
+
+        self.options.declare("input_param_vals", types=bool, default=False)
+        self.options.declare("input_ref_vals", types=bool, default=False)
+        self.options.declare("input_airfoil_geom", types=bool, default=False)
+
+        self.options.declare("output_stability_derivs", types=bool, default=False)
+        self.options.declare("output_body_axis_derivs", types=bool, default=False)
+        self.options.declare("output_con_surf_derivs", types=bool, default=False)
+
+    def setup(self):
+        geom_file = self.options["geom_file"]
+        mass_file = self.options["mass_file"]
+        num_points = self.options["num_points"]
+
+        input_param_vals = self.options["input_param_vals"]
+        input_ref_vals = self.options["input_ref_vals"]
+        input_airfoil_geom = self.options["input_airfoil_geom"]
+
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, debug=False)
+        self.point_names = om_point_names(num_points)
+
+        self.add_subsystem(
+            "solver",
+            OVLMultipointSolverComp(
+                ovl=self.ovl,
+                num_points=num_points,
+                input_param_vals=input_param_vals,
+                input_ref_vals=input_ref_vals,
+                input_airfoil_geom=input_airfoil_geom,
+            ),
+            promotes=["*"],
+        )
+        for point in self.point_names:
+            self.add_subsystem(
+                f"{point}_funcs",
+                OVLFuncsComp(
+                    ovl=self.ovl,
+                    input_param_vals=input_param_vals,
+                    input_ref_vals=input_ref_vals,
+                    input_airfoil_geom=input_airfoil_geom,
+                    output_stability_derivs=self.options["output_stability_derivs"],
+                    output_body_axis_derivs=self.options["output_body_axis_derivs"],
+                    output_con_surf_derivs=self.options["output_con_surf_derivs"],
+                ),
+            )
+
+    def configure(self):
+        # the variables of each point are promoted with the name of the point,
+        # except for the shared geometric and reference values
+        for point in self.point_names:
+            funcs_name = f"{point}_funcs"
+            inputs = []
+            for name, meta in getattr(self, funcs_name).get_io_metadata("input", ["tags"]).items():
+                if meta["tags"] & {"geom", "ref_val"}:
+                    inputs.append(name)
+                else:
+                    inputs.append((name, f"{point}:{name}"))
+
+            outputs = []
+            for name in getattr(self, funcs_name).get_io_metadata("output"):
+                outputs.append((name, f"{point}:{name}"))
+
+            self.promotes(funcs_name, inputs=inputs, outputs=outputs)
+
+
 AIRFOIL_GEOM_VARS = ["xasec", "casec", "tasec"]
 
 
 # helper functions used by the AVL components
-def add_ovl_controls_as_inputs(self, ovl):
+def add_ovl_controls_as_inputs(self, ovl, prefix=""):
     # add the control surfaces as inputs
     self.control_names = ovl.get_control_names()
     for c_name in self.control_names:
-        self.add_input(c_name, val=0.0, units="deg", tags="con_surf")
+        self.add_input(prefix + c_name, val=0.0, units="deg", tags="con_surf")
     return self.control_names
 
 
 def add_ovl_geom_vars(self, ovl, add_as="inputs", include_airfoil_geom=False):
     # add the geometric parameters as inputs
     surf_data = ovl.get_surface_params()
+    self.geom_vars = []
 
     for surf in surf_data:
         for key in surf_data[surf]:
@@ -112,6 +212,7 @@ def add_ovl_geom_vars(self, ovl, add_as="inputs", include_airfoil_geom=False):
                 if not include_airfoil_geom:
                     continue
             geom_key = f"{surf}:{key}"
+            self.geom_vars.append(geom_key)
             if add_as == "inputs":
                 self.add_input(geom_key, val=surf_data[surf][key], tags="geom")
             elif add_as == "outputs":
@@ -127,20 +228,20 @@ def add_ovl_mesh_out_as_output(self, ovl):
         out_name = f"{surf}:mesh"
         self.add_output(out_name, val=meshes[idx_surf], tags="geom_mesh")
           
-def add_ovl_conditions_as_inputs(sys, ovl):
+def add_ovl_conditions_as_inputs(sys, ovl, prefix=""):
     # TODO: add all the condition constraints
 
-    sys.add_input("alpha", val=0.0, units="deg", tags="flt_cond")
-    sys.add_input("beta", val=0.0, units="deg", tags="flt_cond")
+    sys.add_input(prefix + "alpha", val=0.0, units="deg", tags="flt_cond")
+    sys.add_input(prefix + "beta", val=0.0, units="deg", tags="flt_cond")
 
 
-def add_ovl_params_as_inputs(sys, ovl):
+def add_ovl_params_as_inputs(sys, ovl, prefix=""):
     # TODO: add all par vals with the analysis is supported
 
     # only adding the ones people would use for now
     for param in ["velocity", "CD0", "Mach", "X cg", "Y cg", "Z cg"]:
         val = ovl.get_parameter(param)
-        sys.add_input(param, val=val, tags="param")
+        sys.add_input(prefix + param, val=val, tags="param")
 
 
 def add_ovl_refs_as_inputs(sys, ovl):
@@ -151,9 +252,8 @@ def add_ovl_refs_as_inputs(sys, ovl):
 
 
 def om_input_to_surf_dict(sys, inputs):
-    geom_inputs = sys.list_inputs(tags="geom", val=False, out_stream=None)
-    # convert to a list witout tuples
-    geom_inputs = [x[0] for x in geom_inputs]
+    # the names of the geometric inputs are stored by add_ovl_geom_vars
+    geom_inputs = set(sys.geom_vars)
 
     surf_data = {}
     for input_var in inputs:
@@ -172,6 +272,10 @@ def om_input_to_surf_dict(sys, inputs):
     return surf_data
 
 
+def om_point_names(num_points):
+    return [f"point_{idx_point}" for idx_point in range(num_points)]
+
+
 def om_surf_dict_to_input(surf_dict):
     input_data = {}
     for surf_key in surf_dict:
@@ -206,9 +310,286 @@ def om_set_avl_inputs(sys, inputs):
             sys.ovl.set_reference_data({ref: val})
 
 
+GAMMA_VARS = ["gamma", "gamma_d", "gamma_u"]
+
+
+def om_state_hash(inputs, gammas):
+    """Hash the inputs of a component together with the circulations.
+
+    OVLSolverComp and OVLFuncsComp share an OVLSolver. After one of them evaluates the full
+    state for some inputs (a converged solve or the force calculation), it stores this hash
+    on the solver. The other component can then reuse that state if its own inputs give the
+    same hash.
+
+    Args:
+        inputs: OpenMDAO inputs of the component. The circulations among them are skipped
+        gammas: values of "gamma", "gamma_d", and "gamma_u" in the state
+
+    Returns:
+        state_hash: digest of the names and values
+    """
+    hasher = hashlib.sha1()
+    for name in sorted(inputs.keys()):
+        if name in GAMMA_VARS:
+            continue
+        hasher.update(name.encode())
+        hasher.update(np.ascontiguousarray(inputs[name]).tobytes())
+
+    for name in GAMMA_VARS:
+        hasher.update(name.encode())
+        hasher.update(np.ascontiguousarray(gammas[name]).tobytes())
+
+    return hasher.hexdigest()
+
+
+def om_geom_hash(sys, inputs):
+    """Hash the geometric inputs of a component.
+
+    Args:
+        sys: component with the geometric inputs added by add_ovl_geom_vars
+        inputs: OpenMDAO inputs of the component
+
+    Returns:
+        geom_hash: digest of the names and values
+    """
+    hasher = hashlib.sha1()
+    for name in sys.geom_vars:
+        hasher.update(name.encode())
+        hasher.update(np.ascontiguousarray(inputs[name]).tobytes())
+
+    return hasher.hexdigest()
+
+
+def om_set_surface_params(sys, inputs):
+    """Set the geometric inputs of a component on its OVLSolver.
+
+    In an OVLGroup the solver, functions, and post-processing components push the same
+    geometry to the shared OVLSolver, and a multipoint model does so for each point. The hash
+    of the last geometry that was set is stored on the solver, so unchanged geometry is not
+    converted and compared again. The geometry of a solver used this way should only be
+    changed through the components.
+
+    Args:
+        sys: component with the geometric inputs added by add_ovl_geom_vars
+        inputs: OpenMDAO inputs of the component
+    """
+    geom_hash = om_geom_hash(sys, inputs)
+    if geom_hash == getattr(sys.ovl, "_om_geom_hash", None):
+        return
+
+    surf_data = om_input_to_surf_dict(sys, inputs)
+    sys.ovl.set_surface_params(surf_data)
+    sys.ovl._om_geom_hash = geom_hash
+
+
+def om_set_state_hash(sys, state_hash):
+    """Record which state (see om_state_hash) the forces held by the OVLSolver of a component belong to.
+
+    A converged run computes the forces of its state, so the solver components store the hash after
+    each solve and OVLFuncsComp can use the forces directly. Anything that changes the circulations
+    or the forces of the solver without recomputing them for one state must set the hash to None.
+    This includes the residual evaluations and the forward matrix-vector products; only the reverse
+    sweep is known to leave the forces in place.
+
+    Args:
+        sys: component with an OVLSolver
+        state_hash: hash of the state of the forces, or None if they may not match any state
+    """
+    sys.ovl._om_state_hash = state_hash
+
+
+def om_get_state_hash(sys):
+    return getattr(sys.ovl, "_om_state_hash", None)
+
+
+def om_set_gammas(sys, gammas):
+    # TODO-api: this should probably be an API level call to set gamma
+    sys.ovl.set_avl_fort_arr("VRTX_R", "GAM", gammas["gamma"], slicer=sys.res_slice)
+    sys.ovl.set_avl_fort_arr("VRTX_R", "GAM_D", gammas["gamma_d"], slicer=sys.res_d_slice)
+    sys.ovl.set_avl_fort_arr("VRTX_R", "GAM_U", gammas["gamma_u"], slicer=sys.res_u_slice)
+
+
+def om_set_state(sys, inputs, gammas):
+    """Set the inputs and circulations of a component on its OVLSolver and compute the forces.
+
+    Nothing is done if the solver already holds the forces of this state (see om_state_hash),
+    which is the case right after the converged solve of the same point.
+
+    Args:
+        sys: component with the inputs added by the add_ovl_*_as_inputs functions
+        inputs: OpenMDAO inputs of the component (or of one point of a multipoint component)
+        gammas: values of "gamma", "gamma_d", and "gamma_u" in the state
+    """
+    state_hash = om_state_hash(inputs, gammas)
+    if state_hash == om_get_state_hash(sys):
+        return
+
+    om_store_aic(sys)
+    om_set_avl_inputs(sys, inputs)
+    om_set_surface_params(sys, inputs)
+    om_load_aic(sys)
+    om_set_gammas(sys, gammas)
+
+    # the residuals do not need to be calculated, so the AIC is only rebuilt if it is no longer valid
+    # (set_surface_params has already remade the surfaces that changed)
+    sys.ovl.avl.set_operating_point()
+    sys.ovl.avl.velsum()
+    sys.ovl.avl.aero()
+    om_set_state_hash(sys, state_hash)
+
+
+def om_store_aic(sys):
+    """Put the factored AIC and induced-velocity matrices of the OVLSolver of a component in the store of the solver,
+    if it has one (see OVLMultipointSolverComp). The store keeps those of each Mach number, so the points of a
+    multipoint component can switch between Mach numbers without building and factoring the AIC again.
+    This is called before the inputs of another point are set, and om_load_aic after.
+
+    Args:
+        sys: component with an OVLSolver
+    """
+    aic_store = getattr(sys.ovl, "_om_aic_store", None)
+    if aic_store is None or not sys.ovl._is_aic_valid():
+        return
+
+    mach = sys.ovl.get_parameter("Mach")
+    cache_key = sys.ovl._get_aic_cache_key()
+    if mach not in aic_store or aic_store[mach][0] != cache_key:
+        aic_store[mach] = (cache_key, sys.ovl._get_aic_data())
+
+
+def om_load_aic(sys):
+    """Set the AIC and induced-velocity matrices of the OVLSolver of a component from the store of the solver
+    (see om_store_aic), if they are out of date and were stored for the current lattice and Mach number.
+    Besides a change of the Mach number, this also covers the forward jacobian-vector products, which mark the
+    AIC as out of date without changing it.
+
+    Args:
+        sys: component with an OVLSolver
+    """
+    aic_store = getattr(sys.ovl, "_om_aic_store", None)
+    mach = sys.ovl.get_parameter("Mach")
+    if aic_store is None or mach not in aic_store or sys.ovl._is_aic_valid():
+        return
+
+    cache_key, aic_data = aic_store[mach]
+    if cache_key == sys.ovl._get_aic_cache_key():
+        sys.ovl._set_aic_data(aic_data)
+
+
+def om_solve_linear_mrhs(sys, rhs_vec, sol_vec, prefixes, mode):
+    """Solve the linear systems of the circulations of one or more points with one call to OptVL.
+
+    All the points must have the same Mach number, because they share the factored AIC.
+
+    Args:
+        sys: solver component
+        rhs_vec: OpenMDAO vector with the right-hand sides (d_residuals in fwd mode, d_outputs in rev mode)
+        sol_vec: OpenMDAO vector for the solutions (d_outputs in fwd mode, d_residuals in rev mode)
+        prefixes: the prefix of the "gamma", "gamma_d", and "gamma_u" variables of each point
+        mode: "fwd" to solve with the AIC or "rev" to solve with its transpose
+    """
+    num_cols = 1 + sys.num_cs + sys.num_vel
+    rhs = np.zeros((sys.num_states, num_cols * len(prefixes)), order="F")
+    for idx_point, prefix in enumerate(prefixes):
+        idx_col = idx_point * num_cols
+        rhs[:, idx_col] = rhs_vec[prefix + "gamma"]
+        rhs[:, idx_col + 1 : idx_col + 1 + sys.num_cs] = rhs_vec[prefix + "gamma_d"].T
+        rhs[:, idx_col + 1 + sys.num_cs : idx_col + num_cols] = rhs_vec[prefix + "gamma_u"].T
+
+    if mode == "fwd":
+        sol = sys.ovl.avl.solve_forward_mrhs(rhs)
+        sys.ovl._check_linear_solves("forward linear system")
+    else:
+        sol = sys.ovl.avl.solve_adjoint_mrhs(rhs)
+        sys.ovl._check_linear_solves("adjoint")
+
+    for idx_point, prefix in enumerate(prefixes):
+        idx_col = idx_point * num_cols
+        sol_vec[prefix + "gamma"] = sol[:, idx_col]
+        sol_vec[prefix + "gamma_d"] = sol[:, idx_col + 1 : idx_col + 1 + sys.num_cs].T
+        sol_vec[prefix + "gamma_u"] = sol[:, idx_col + 1 + sys.num_cs : idx_col + num_cols].T
+
+
+def om_solver_jac_vec_prod_fwd(sys, d_inputs, d_outputs, d_residuals):
+    con_seeds = {}
+    for con_key in ["alpha", "beta"]:
+        if con_key in d_inputs:
+            con_seeds[con_key] = d_inputs[con_key][0]
+    for con_key in sys.control_names:
+        if con_key in d_inputs:
+            con_seeds[con_key] = d_inputs[con_key][0]
+
+    geom_seeds = om_input_to_surf_dict(sys, d_inputs)
+
+    param_seeds = {}
+    for param in sys.ovl.param_idx_dict:
+        if param in d_inputs:
+            param_seeds[param] = d_inputs[param][0]
+
+    ref_seeds = {}
+    for ref in sys.ovl.ref_var_to_fort_var:
+        if ref in d_inputs:
+            if ref == "XYZref":
+                ref_seeds[ref] = d_inputs[ref][0:3]
+            else:
+                ref_seeds[ref] = d_inputs[ref][0]
+
+    gamma_seeds = {}
+    for gamma_key in GAMMA_VARS:
+        if gamma_key in d_outputs:
+            gamma_seeds[f"{gamma_key}_seeds"] = d_outputs[gamma_key]
+
+    _, res_seeds, _, _, _, res_d_seeds, res_u_seeds = sys.ovl._execute_jac_vec_prod_fwd(
+        con_seeds=con_seeds, geom_seeds=geom_seeds, param_seeds=param_seeds, ref_seeds=ref_seeds, **gamma_seeds
+    )
+
+    d_residuals["gamma"] += res_seeds
+    d_residuals["gamma_d"] += res_d_seeds
+    d_residuals["gamma_u"] += res_u_seeds
+
+
+def om_solver_jac_vec_prod_rev(sys, d_inputs, d_outputs, d_residuals):
+    if "gamma" in d_residuals:
+        sys.ovl.clear_ad_seeds_fast()
+        res_seeds = d_residuals["gamma"]
+        res_d_seeds = d_residuals["gamma_d"]
+        res_u_seeds = d_residuals["gamma_u"]
+
+        con_seeds, geom_seeds, mesh_seeds, gamma_seeds, gamma_d_seeds, gamma_u_seeds, param_seeds, ref_seeds = (
+            sys.ovl._execute_jac_vec_prod_rev(res_seeds=res_seeds, res_d_seeds=res_d_seeds, res_u_seeds=res_u_seeds)
+        )
+
+        if "gamma" in d_outputs:
+            d_outputs["gamma"] += gamma_seeds
+
+        if "gamma_d" in d_outputs:
+            d_outputs["gamma_d"] += gamma_d_seeds
+
+        if "gamma_u" in d_outputs:
+            d_outputs["gamma_u"] += gamma_u_seeds
+
+        d_input_geom = om_surf_dict_to_input(geom_seeds)
+
+        for d_input in d_inputs:
+            if d_input in d_input_geom:
+                d_inputs[d_input] += d_input_geom[d_input]
+            elif d_input in ["alpha", "beta"]:
+                d_inputs[d_input] += con_seeds[d_input]
+            elif d_input in sys.control_names:
+                d_inputs[d_input] += con_seeds[d_input]
+            elif d_input in param_seeds:
+                d_inputs[d_input] += param_seeds[d_input]
+            elif d_input in ref_seeds:
+                d_inputs[d_input] += ref_seeds[d_input]
+
+
 class OVLSolverComp(om.ImplicitComponent):
     """
     OpenMDAO component that wraps optvl solver. This is added as part of the OVLgroup
+
+    By default the partials are only available as matrix-vector products (apply_linear).
+    With assemble_partials the dense partials are computed once per linearization instead and OpenMDAO
+    applies them from its Jacobian, which pays off when many products are taken at the same point.
     """
 
     def initialize(self):
@@ -216,6 +597,7 @@ class OVLSolverComp(om.ImplicitComponent):
         self.options.declare("input_param_vals", types=bool, default=False)
         self.options.declare("input_ref_vals", types=bool, default=False)
         self.options.declare("input_airfoil_geom", types=bool, default=False)
+        self.options.declare("assemble_partials", types=bool, default=False)
 
     def setup(self):
         self.ovl = self.options["ovl"]
@@ -246,23 +628,36 @@ class OVLSolverComp(om.ImplicitComponent):
         self.res_d_slice = (slice(0, self.num_cs), slice(0, self.num_states))
         self.res_u_slice = (slice(0, self.num_vel), slice(0, self.num_states))
 
+        # apply_linear is only used if the partials are not assembled
+        self.matrix_free = not self.options["assemble_partials"]
+
+    def setup_partials(self):
+        if self.matrix_free:
+            return
+
+        # each residual only depends on its own circulations through the AIC
+        self.declare_partials("gamma", "gamma")
+        for gamma_key, num_rhs in [("gamma_d", self.num_cs), ("gamma_u", self.num_vel)]:
+            if num_rhs == 0:
+                continue
+            idx_block = np.arange(self.num_states * self.num_states)
+            rows = np.concatenate([idx_block // self.num_states + idx * self.num_states for idx in range(num_rhs)])
+            cols = np.concatenate([idx_block % self.num_states + idx * self.num_states for idx in range(num_rhs)])
+            self.declare_partials(gamma_key, gamma_key, rows=rows, cols=cols)
+
+        self.input_names = list(self.get_io_metadata(iotypes="input"))
+        self.declare_partials(GAMMA_VARS, self.input_names)
+
     def apply_nonlinear(self, inputs, outputs, residuals):
+        om_set_state_hash(self, None)
         om_set_avl_inputs(self, inputs)
 
-        surf_data = om_input_to_surf_dict(self, inputs)
-        self.ovl.set_surface_params(surf_data)
+        om_set_surface_params(self, inputs)
 
-        gam_arr = outputs["gamma"]
-        gam_d_arr = outputs["gamma_d"]
-        gam_u_arr = outputs["gamma_u"]
-
-        # TODO-api: this should probably be an API level call to set gamma
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM", gam_arr, slicer=self.res_slice)
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM_D", gam_d_arr, slicer=self.res_d_slice)
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM_U", gam_u_arr, slicer=self.res_u_slice)
+        om_set_gammas(self, outputs)
 
         # propogate the seeds through without resolving
-        self.ovl.avl.update_surfaces()
+        # (set_surface_params has already remade the surfaces that changed)
         self.ovl.avl.get_res()
 
         res = copy.deepcopy(self.ovl.get_avl_fort_arr("VRTX_R", "RES", slicer=self.res_slice))
@@ -279,8 +674,7 @@ class OVLSolverComp(om.ImplicitComponent):
         om_set_avl_inputs(self, inputs)
 
         # update the surface parameters
-        surf_data = om_input_to_surf_dict(self, inputs)
-        self.ovl.set_surface_params(surf_data)
+        om_set_surface_params(self, inputs)
 
         # def_dict = self.ovl.get_control_deflections()
         print("executing ovl run")
@@ -296,6 +690,8 @@ class OVLSolverComp(om.ImplicitComponent):
         gam_u_arr = self.ovl.get_avl_fort_arr("VRTX_R", "GAM_U", slicer=self.res_u_slice)
         outputs["gamma_u"] = copy.deepcopy(gam_u_arr)
 
+        om_set_state_hash(self, om_state_hash(inputs, outputs))
+
         # run_data = self.ovl.get_total_forces()
         # for func_key in run_data:
         #     print(func_key, run_data[func_key])
@@ -304,87 +700,51 @@ class OVLSolverComp(om.ImplicitComponent):
         # print("AVL solve time: ", time.time() - start_time)
 
     def apply_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        # the partials are taken at the state of these inputs and outputs
+        om_set_state(self, inputs, outputs)
         if mode == "fwd":
-            con_seeds = {}
-            for con_key in ["alpha", "beta"]:
-                if con_key in d_inputs:
-                    con_seeds[con_key] = d_inputs[con_key]
-            for con_key in self.control_names:
-                if con_key in d_inputs:
-                    con_seeds[con_key] = d_inputs[con_key]
-
-            geom_seeds = om_input_to_surf_dict(self, d_inputs)
-
-            param_seeds = {}
-            for param in self.ovl.param_idx_dict:
-                if param in d_inputs:
-                    param_seeds[param] = d_inputs[param]
-
-            ref_seeds = {}
-            for ref in self.ovl.ref_var_to_fort_var:
-                if ref in d_inputs:
-                    ref_seeds[ref] = d_inputs[ref]
-
-            _, res_seeds, _, _, res_d_seeds, res_u_seeds = self.ovl._execute_jac_vec_prod_fwd(
-                con_seeds=con_seeds, geom_seeds=geom_seeds, param_seeds=param_seeds, ref_seeds=ref_seeds
-            )
-
-            d_residuals["gamma"] += res_seeds
-            d_residuals["gamma_d"] += res_d_seeds
-            d_residuals["gamma_u"] += res_u_seeds
+            om_set_state_hash(self, None)
+            om_solver_jac_vec_prod_fwd(self, d_inputs, d_outputs, d_residuals)
 
         if mode == "rev":
-            if "gamma" in d_residuals:
-                self.ovl.clear_ad_seeds_fast()
-                res_seeds = d_residuals["gamma"]
-                res_d_seeds = d_residuals["gamma_d"]
-                res_u_seeds = d_residuals["gamma_u"]
-
-                con_seeds, geom_seeds, mesh_seeds, gamma_seeds, gamma_d_seeds, gamma_u_seeds, param_seeds, ref_seeds = (
-                    self.ovl._execute_jac_vec_prod_rev(
-                        res_seeds=res_seeds, res_d_seeds=res_d_seeds, res_u_seeds=res_u_seeds
-                    )
-                )
-
-                if "gamma" in d_outputs:
-                    d_outputs["gamma"] += gamma_seeds
-
-                if "gamma_d" in d_outputs:
-                    d_outputs["gamma_d"] += gamma_d_seeds
-
-                if "gamma_u" in d_outputs:
-                    d_outputs["gamma_u"] += gamma_u_seeds
-
-                d_input_geom = om_surf_dict_to_input(geom_seeds)
-
-                for d_input in d_inputs:
-                    if d_input in d_input_geom:
-                        d_inputs[d_input] += d_input_geom[d_input]
-                    elif d_input in ["alpha", "beta"]:
-                        d_inputs[d_input] += con_seeds[d_input]
-                    elif d_input in self.control_names:
-                        d_inputs[d_input] += con_seeds[d_input]
-                    elif d_input in param_seeds:
-                        d_inputs[d_input] += param_seeds[d_input]
-                    elif d_input in ref_seeds:
-                        d_inputs[d_input] += ref_seeds[d_input]
+            om_solver_jac_vec_prod_rev(self, d_inputs, d_outputs, d_residuals)
+
+    def linearize(self, inputs, outputs, partials):
+        if self.matrix_free:
+            return
+
+        om_set_state(self, inputs, outputs)
+        aic = self.ovl.avl.get_aic(self.num_states)
+        partials["gamma", "gamma"] = aic
+        if self.num_cs > 0:
+            partials["gamma_d", "gamma_d"] = np.tile(aic.ravel(), self.num_cs)
+        partials["gamma_u", "gamma_u"] = np.tile(aic.ravel(), self.num_vel)
+
+        # the columns of the inputs are the forward products with each unit seed
+        for input_name in self.input_names:
+            d_input = np.zeros(inputs[input_name].size)
+            jac = {gamma_key: np.zeros((outputs[gamma_key].size, d_input.size)) for gamma_key in GAMMA_VARS}
+            for idx in range(d_input.size):
+                d_input[idx] = 1.0
+                d_residuals = {gamma_key: np.zeros_like(outputs[gamma_key]) for gamma_key in GAMMA_VARS}
+                om_solver_jac_vec_prod_fwd(self, {input_name: d_input.reshape(inputs[input_name].shape)}, {}, d_residuals)
+                for gamma_key in GAMMA_VARS:
+                    jac[gamma_key][:, idx] = d_residuals[gamma_key].ravel()
+                d_input[idx] = 0.0
+
+            for gamma_key in GAMMA_VARS:
+                partials[gamma_key, input_name] = jac[gamma_key]
+
+        om_set_state_hash(self, None)
 
     def solve_linear(self, d_outputs, d_residuals, mode):
+        # the circulations, their control surface derivatives, and their flight condition derivatives
+        # all share the factored AIC, so they are solved together
         if mode == "rev":
-            self.ovl.set_gamma_ad_seeds(d_outputs["gamma"])
-            self.ovl.set_gamma_d_ad_seeds(d_outputs["gamma_d"])
-            self.ovl.set_gamma_u_ad_seeds(d_outputs["gamma_u"])
-            # start_time = time.time()
-            solve_stab_deriv_adj = True
-            solve_con_surf_adj = True
-            self.ovl.avl.solve_adjoint(solve_stab_deriv_adj, solve_con_surf_adj)
-            # print("OM Solve adjoint time: ", time.time() - start_time)
-            d_residuals["gamma"] = self.ovl.get_residual_ad_seeds()
-            d_residuals["gamma_d"] = self.ovl.get_residual_d_ad_seeds()
-            d_residuals["gamma_u"] = self.ovl.get_residual_u_ad_seeds()
+            om_solve_linear_mrhs(self, d_outputs, d_residuals, [""], mode)
 
         elif mode == "fwd":
-            raise NotImplementedError("only reverse mode derivaties implemented. Use prob.setup(mode='rev')")
+            om_solve_linear_mrhs(self, d_residuals, d_outputs, [""], mode)
 
 
 class OVLFuncsComp(om.ExplicitComponent):
@@ -399,6 +759,7 @@ class OVLFuncsComp(om.ExplicitComponent):
         self.options.declare("output_stability_derivs", types=bool, default=False)
         self.options.declare("output_body_axis_derivs", types=bool, default=False)
         self.options.declare("output_con_surf_derivs", types=bool, default=False)
+        self.options.declare("output_eig_funcs", types=list, default=[])
         self.options.declare("input_param_vals", types=bool, default=False)
         self.options.declare("input_ref_vals", types=bool, default=False)
         self.options.declare("input_airfoil_geom", types=bool, default=False)
@@ -445,6 +806,13 @@ class OVLFuncsComp(om.ExplicitComponent):
             for func_key in deriv_dict:
                 self.add_output(func_key)
 
+        self.eig_func_keys = {}
+        for idx_eig in self.options["output_eig_funcs"]:
+            for part in ["real", "imag"]:
+                func_key = self.ovl._get_eig_func_key(idx_eig, part)
+                self.eig_func_keys[func_key] = (idx_eig, part)
+                self.add_output(func_key)
+
         # TODO-refactor: push these slices down into the ovl class?
         self.res_slice = (slice(0, self.num_states),)
         self.res_d_slice = (slice(0, self.num_cs), slice(0, self.num_states))
@@ -455,27 +823,9 @@ class OVLFuncsComp(om.ExplicitComponent):
 
         # TODO: set_constraint does not correctly do derives yet
         start_time = time.time()
-        om_set_avl_inputs(self, inputs)
 
-        # update the surface parameters
-        surf_data = om_input_to_surf_dict(self, inputs)
-        self.ovl.set_surface_params(surf_data)
-
-        gam_arr = inputs["gamma"]
-        gam_d_arr = inputs["gamma_d"]
-        gam_u_arr = inputs["gamma_u"]
-
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM", gam_arr, slicer=self.res_slice)
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM_D", gam_d_arr, slicer=self.res_d_slice)
-        self.ovl.set_avl_fort_arr("VRTX_R", "GAM_U", gam_u_arr, slicer=self.res_u_slice)
-
-        # TODO: only update what you need to.
-        # residuals (and AIC?) do not need to be calculated
-        # but in get_res, alpha and beta are set
-        self.ovl.avl.update_surfaces()
-        self.ovl.avl.get_res()
-        self.ovl.avl.velsum()
-        self.ovl.avl.aero()
+        # after a converged solve with the same inputs the solver already holds the forces
+        om_set_state(self, inputs, inputs)
 
         run_data = self.ovl.get_total_forces()
 
@@ -500,18 +850,34 @@ class OVLFuncsComp(om.ExplicitComponent):
             for func_key in body_axis_derivs:
                 outputs[func_key] = body_axis_derivs[func_key]
 
+        if self.eig_func_keys:
+            self.ovl.execute_eigen_mode_calc(run=False)
+            eig_vals = self.ovl.get_eigenvalues()
+            for func_key, (idx_eig, part) in self.eig_func_keys.items():
+                outputs[func_key] = getattr(eig_vals[idx_eig], part)
+
         # print("Funcs Compute time: ", time.time() - start_time)
 
     def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        # the partials are taken at the state of these inputs
+        om_set_state(self, inputs, inputs)
+
+        # the eigenvalues depend on the aerodynamics through the body axis derivatives
+        eig_partials = {}
+        if self.eig_func_keys:
+            self.ovl.execute_eigen_mode_calc(run=False)
+            eig_partials = self.ovl._get_eig_partials(self.options["output_eig_funcs"])
+
         if mode == "fwd":
+            om_set_state_hash(self, None)
             con_seeds = {}
             for con_key in ["alpha", "beta"]:
                 if con_key in d_inputs:
-                    con_seeds[con_key] = d_inputs[con_key]
+                    con_seeds[con_key] = d_inputs[con_key][0]
 
             for con_key in self.control_names:
                 if con_key in d_inputs:
-                    con_seeds[con_key] = d_inputs[con_key]
+                    con_seeds[con_key] = d_inputs[con_key][0]
 
             if "gamma" in d_inputs:
                 gamma_seeds = d_inputs["gamma"]
@@ -531,14 +897,17 @@ class OVLFuncsComp(om.ExplicitComponent):
             param_seeds = {}
             for param in self.ovl.param_idx_dict:
                 if param in d_inputs:
-                    param_seeds[param] = d_inputs[param]
+                    param_seeds[param] = d_inputs[param][0]
 
             ref_seeds = {}
             for ref in self.ovl.ref_var_to_fort_var:
                 if ref in d_inputs:
-                    ref_seeds[ref] = d_inputs[ref]
+                    if ref == "XYZref":
+                        ref_seeds[ref] = d_inputs[ref][0:3]
+                    else:
+                        ref_seeds[ref] = d_inputs[ref][0]
 
-            geom_seeds = self.om_input_to_surf_dict(self, d_inputs)
+            geom_seeds = om_input_to_surf_dict(self, d_inputs)
 
             func_seeds, _, csd_seeds, stab_derivs_seeds, body_axis_seeds, _, _ = self.ovl._execute_jac_vec_prod_fwd(
                 con_seeds=con_seeds,
@@ -550,23 +919,20 @@ class OVLFuncsComp(om.ExplicitComponent):
                 ref_seeds=ref_seeds,
             )
 
-            for func_key in func_seeds:
-                d_outputs[func_key] += func_seeds[func_key]
+            # the seeds are keyed by the names of the outputs, which are only added if they were turned on
+            for seeds in [func_seeds, csd_seeds, stab_derivs_seeds, body_axis_seeds]:
+                for func_key in seeds:
+                    if func_key in d_outputs:
+                        d_outputs[func_key] += seeds[func_key]
 
-            for func_key in csd_seeds:
-                for con_name in csd_seeds[func_key]:
-                    var_name = f"d{func_key}_d{con_name}"
-                    d_outputs[var_name] = csd_seeds[func_key][con_name]
-
-            for func_key in stab_derivs_seeds:
-                for var in stab_derivs_seeds[func_key]:
-                    var_name = f"d{func_key}_d{var}"
-                    d_outputs[var_name] = stab_derivs_seeds[func_key][var]
-
-            for func_key in body_axis_seeds:
-                for var in body_axis_seeds[func_key]:
-                    var_name = f"d{func_key}_d{var}"
-                    d_outputs[var_name] = body_axis_seeds[func_key][var]
+            for func_key, partials in eig_partials.items():
+                if func_key in d_outputs:
+                    for deriv_key, val in partials["body_axis_derivs"].items():
+                        d_outputs[func_key] += val * body_axis_seeds[deriv_key]
+                    for kind, kind_seeds in [("con", con_seeds), ("param", param_seeds), ("ref", ref_seeds)]:
+                        for key, val in partials[kind].items():
+                            if key in kind_seeds:
+                                d_outputs[func_key] += val * kind_seeds[key]
 
         if mode == "rev":
             self.ovl.clear_ad_seeds_fast()
@@ -610,6 +976,11 @@ class OVLFuncsComp(om.ExplicitComponent):
                         # print(var_name, body_axis_seeds[func_key])
                         print(f"  running rev mode derivs for {func_key}")
 
+            for func_key, partials in eig_partials.items():
+                if func_key in d_outputs:
+                    for deriv_key, val in partials["body_axis_derivs"].items():
+                        body_axis_seeds[deriv_key] = body_axis_seeds.get(deriv_key, 0.0) + val * d_outputs[func_key]
+
             con_seeds, geom_seeds, mesh_seeds, gamma_seeds, gamma_d_seeds, gamma_u_seeds, param_seeds, ref_seeds = (
                 self.ovl._execute_jac_vec_prod_rev(
                     func_seeds=func_seeds,
@@ -630,6 +1001,13 @@ class OVLFuncsComp(om.ExplicitComponent):
 
             d_input_geom = om_surf_dict_to_input(geom_seeds)
 
+            # add the dependence of the eigenvalues that does not go through the aerodynamics
+            for func_key, partials in eig_partials.items():
+                if func_key in d_outputs:
+                    for kind, kind_seeds in [("con", con_seeds), ("param", param_seeds), ("ref", ref_seeds)]:
+                        for key, val in partials[kind].items():
+                            kind_seeds[key] = kind_seeds.get(key, 0.0) + val * d_outputs[func_key]
+
             for d_input in d_inputs:
                 if d_input in d_input_geom:
                     d_inputs[d_input] += d_input_geom[d_input]
@@ -641,6 +1019,176 @@ class OVLFuncsComp(om.ExplicitComponent):
                     d_inputs[d_input] += ref_seeds[d_input]
 
 
+class OVLMultipointSolverComp(om.ImplicitComponent):
+    """
+    OpenMDAO component that solves for the circulations of each point of the OVLMultipointGroup with one OptVL solver.
+    The points are solved in order of their Mach number, and the factored AIC of each Mach number is kept in a store
+    of the solver (see om_store_aic), so the components of the group can switch between the points without
+    building and factoring it again.
+    """
+
+    def initialize(self):
+        self.options.declare("ovl", types=OVLSolver, recordable=False)
+        self.options.declare("num_points", types=int, lower=1)
+        self.options.declare("input_param_vals", types=bool, default=False)
+        self.options.declare("input_ref_vals", types=bool, default=False)
+        self.options.declare("input_airfoil_geom", types=bool, default=False)
+
+    def setup(self):
+        self.ovl = self.options["ovl"]
+        input_param_vals = self.options["input_param_vals"]
+        input_ref_vals = self.options["input_ref_vals"]
+        input_airfoil_geom = self.options["input_airfoil_geom"]
+
+        self.num_states = self.ovl.get_mesh_size()
+        self.num_cs = self.ovl.get_num_control_surfs()
+        self.num_vel = self.ovl.NUMAX
+
+        self.point_names = om_point_names(self.options["num_points"])
+        for point in self.point_names:
+            prefix = f"{point}:"
+            self.add_output(prefix + "gamma", val=np.zeros(self.num_states))
+            self.add_output(prefix + "gamma_d", val=np.zeros((self.num_cs, self.num_states)))
+            self.add_output(prefix + "gamma_u", val=np.zeros((self.num_vel, self.num_states)))
+
+            add_ovl_conditions_as_inputs(self, self.ovl, prefix=prefix)
+
+            if input_param_vals:
+                add_ovl_params_as_inputs(self, self.ovl, prefix=prefix)
+
+            self.control_names = add_ovl_controls_as_inputs(self, self.ovl, prefix=prefix)
+
+        if input_ref_vals:
+            add_ovl_refs_as_inputs(self, self.ovl)
+
+        add_ovl_geom_vars(self, self.ovl, add_as="inputs", include_airfoil_geom=input_airfoil_geom)
+
+        self.res_slice = (slice(0, self.num_states),)
+        self.res_d_slice = (slice(0, self.num_cs), slice(0, self.num_states))
+        self.res_u_slice = (slice(0, self.num_vel), slice(0, self.num_states))
+
+        # the inputs and circulations of each point at the last evaluation or linearization
+        self.point_states = {}
+
+        # the factored AIC of each Mach number, shared by all the components of the solver
+        self.ovl._om_aic_store = {}
+
+    def point_view(self, vec, point):
+        # the variables of one point (and the shared ones) under the names used by the single point components
+        view = {}
+        for name in vec:
+            point_name, _, var_name = name.partition(":")
+            if point_name == point:
+                view[var_name] = vec[name]
+            elif point_name not in self.point_names:
+                view[name] = vec[name]
+        return view
+
+    def get_mach_groups(self):
+        # the points that share the same factored AIC, in order of their Mach number
+        mach_groups = {}
+        for point in self.point_names:
+            point_inputs = self.point_states[point][0]
+            if "Mach" in point_inputs:
+                mach = point_inputs["Mach"][0]
+            else:
+                mach = self.ovl.get_parameter("Mach")
+            mach_groups.setdefault(mach, []).append(point)
+
+        return [mach_groups[mach] for mach in sorted(mach_groups)]
+
+    def store_point_states(self, inputs, outputs):
+        # keep copies of the inputs and circulations of each point, the solver only holds the state of the last point
+        for point in self.point_names:
+            point_inputs = {name: np.copy(val) for name, val in self.point_view(inputs, point).items()}
+            gammas = {name: np.copy(outputs[f"{point}:{name}"]) for name in GAMMA_VARS}
+            self.point_states[point] = (point_inputs, gammas)
+
+        # only the AIC of the Mach numbers of the points are kept
+        machs = {
+            float(point_inputs["Mach"][0]) for point_inputs, _ in self.point_states.values() if "Mach" in point_inputs
+        }
+        for mach in list(self.ovl._om_aic_store):
+            if mach not in machs:
+                del self.ovl._om_aic_store[mach]
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        # a Newton solver of a parent group only calls apply_nonlinear and linearize, not solve_nonlinear
+        self.store_point_states(inputs, outputs)
+
+        om_set_state_hash(self, None)
+        for point in self.point_names:
+            point_inputs = self.point_view(inputs, point)
+            om_set_avl_inputs(self, point_inputs)
+            om_set_surface_params(self, point_inputs)
+            om_set_gammas(self, self.point_view(outputs, point))
+
+            self.ovl.avl.get_res()
+
+            residuals[f"{point}:gamma"] = self.ovl.get_avl_fort_arr("VRTX_R", "RES", slicer=self.res_slice)
+            residuals[f"{point}:gamma_d"] = self.ovl.get_avl_fort_arr("VRTX_R", "RES_D", slicer=self.res_d_slice)
+            residuals[f"{point}:gamma_u"] = self.ovl.get_avl_fort_arr("VRTX_R", "RES_U", slicer=self.res_u_slice)
+
+    def solve_nonlinear(self, inputs, outputs):
+        self.store_point_states(inputs, outputs)
+
+        for mach_group in self.get_mach_groups():
+            for point in mach_group:
+                point_inputs = self.point_view(inputs, point)
+                om_store_aic(self)
+                om_set_avl_inputs(self, point_inputs)
+                om_set_surface_params(self, point_inputs)
+                om_load_aic(self)
+
+                self.ovl.execute_run()
+
+                outputs[f"{point}:gamma"] = self.ovl.get_avl_fort_arr("VRTX_R", "GAM", slicer=self.res_slice)
+                outputs[f"{point}:gamma_d"] = self.ovl.get_avl_fort_arr("VRTX_R", "GAM_D", slicer=self.res_d_slice)
+                outputs[f"{point}:gamma_u"] = self.ovl.get_avl_fort_arr("VRTX_R", "GAM_U", slicer=self.res_u_slice)
+
+                om_set_state_hash(self, om_state_hash(point_inputs, self.point_view(outputs, point)))
+
+        self.store_point_states(inputs, outputs)
+
+    def apply_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        # the points are taken in order of their Mach number, so the AIC is switched once per Mach number
+        for point in chain.from_iterable(self.get_mach_groups()):
+            point_d_residuals = self.point_view(d_residuals, point)
+            if mode == "rev" and not any(np.any(seeds) for seeds in point_d_residuals.values()):
+                # nothing to propagate for this point
+                continue
+
+            # the partials are taken at the state of this point
+            om_set_state(self, self.point_view(inputs, point), self.point_view(outputs, point))
+            if mode == "fwd":
+                om_set_state_hash(self, None)
+                om_solver_jac_vec_prod_fwd(
+                    self, self.point_view(d_inputs, point), self.point_view(d_outputs, point), point_d_residuals
+                )
+
+            if mode == "rev":
+                om_solver_jac_vec_prod_rev(
+                    self, self.point_view(d_inputs, point), self.point_view(d_outputs, point), point_d_residuals
+                )
+
+    def linearize(self, inputs, outputs, partials):
+        # solve_linear factors the AIC at the state of this linearization
+        self.store_point_states(inputs, outputs)
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        # the linear systems of all the points with the same Mach number are solved together
+        for mach_group in self.get_mach_groups():
+            # set the Mach number of the group, with its factored AIC if it is in the store
+            om_set_state(self, *self.point_states[mach_group[-1]])
+
+            prefixes = [f"{point}:" for point in mach_group]
+            if mode == "rev":
+                om_solve_linear_mrhs(self, d_outputs, d_residuals, prefixes, mode)
+
+            elif mode == "fwd":
+                om_solve_linear_mrhs(self, d_residuals, d_outputs, prefixes, mode)
+
+
 # Optional components
 class OVLPostProcessComp(om.ExplicitComponent):
     """This component writes out data files for postprocessing. It is optionally added as part of the OVLGroup"""
@@ -688,11 +1236,11 @@ class OVLPostProcessComp(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         # self.ovl.set_gamma(inputs['gamma'])
 
+        om_set_state_hash(self, None)
         om_set_avl_inputs(self, inputs)
 
         # update the surface parameters
-        surf_data = om_input_to_surf_dict(self, inputs)
-        self.ovl.set_surface_params(surf_data)
+        om_set_surface_params(self, inputs)
 
         gam_arr = inputs["gamma"]
         gam_d_arr = inputs["gamma_d"]
@@ -8,13 +8,16 @@ This module contains the OVLSolver, which is the main wrapper for the Fortran le
 import os
 import time
 import copy
-from typing import Dict, List, Tuple, Any, TextIO
+import hashlib
+import shutil
+import tempfile
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple, Any, TextIO, Union
 import warnings
 import glob
 from typing import Optional
 import platform
 from collections import OrderedDict
-import operator
 from itertools import chain
 import importlib.metadata
 
@@ -34,6 +37,9 @@ from .utils.airfoil_utils import read_coordinates_files
 # import the version of the package to include in some io and help messages
 __version__ = importlib.metadata.version(__package__ or __name__)
 
+# version of the layout of the AIC cache entries, which is part of their key
+AIC_CACHE_VERSION = 1
+
 class OVLSolver(object):
     # these at technically parameters, but they are also specified as contraints
     # These are not included in the derivatives but you can set and get them still
@@ -219,6 +225,64 @@ class OVLSolver(object):
 
     # fmt: on
 
+    # phases timed by the Fortran routines, in the order of the IT* indices in AINDEX.INC
+    fort_timed_phases = [
+        "setup",
+        "build_aic",
+        "source_doublet",
+        "velocity_matrix",
+        "factor_aic",
+        "gucalc",
+        "gamsum",
+        "velsum",
+        "aero",
+        "trim_solve",
+        "adjoint_solve",
+        "exec",
+    ]
+
+    # phases of execute_run_sensitivities timed in python
+    py_timed_phases = ["sens_rhs", "sens_adjoint", "sens_combine"]
+
+    # trim condition variables and their commands in the C1 menu of AVL
+    trim_var_to_avl_cmd = {
+        "bankAng": "B",
+        "CL": "C",
+        "velocity": "V",
+        "mass": "M",
+        "dens": "D",
+        "G": "G",
+        "X cg": "X",
+        "Y cg": "Y",
+        "Z cg": "Z",
+    }
+
+    # variables of the run case, in the order of the trim solve (the control surfaces follow)
+    run_variables = ["alpha", "beta", "roll rate", "pitch rate", "yaw rate"]
+
+    # constraints of the run case and their index in AVL (the control surfaces follow)
+    con_var_to_icon = {
+        "alpha": 1,
+        "beta": 2,
+        "roll rate": 3,
+        "pitch rate": 4,
+        "yaw rate": 5,
+        "CL": 6,
+        "CY": 7,
+        "Cl": 8,
+        "Cm": 9,
+        "Cn": 10,
+    }
+
+    # the moment constraints are applied in stability axes
+    con_var_to_stab_func = {
+        "CL": "CL",
+        "CY": "CY",
+        "Cl": "Cl'",
+        "Cm": "Cm",
+        "Cn": "Cn'",
+    }
+
     ad_suffix = "_DIFF"
 
 
@@ -229,6 +293,10 @@ class OVLSolver(object):
         input_dict: Optional[dict] = None,
         debug: Optional[bool] = False,
         timing: Optional[bool] = False,
+        low_memory: Optional[bool] = False,
+        linear_solver: Optional[str] = "direct",
+        num_threads: Optional[int] = None,
+        cache_dir: Optional[str] = None,
     ):
         """Initalize the python and fortran libary from the given objects
 
@@ -237,6 +305,17 @@ class OVLSolver(object):
             mass_file: AVL mass file
             debug: flag for debug printing
             timing: flag for timing printing
+            low_memory: flag to compute the induced velocities on the fly instead of storing the dense
+                velocity influence matrices. This uses about a quarter of the memory for large meshes, but
+                each solve is slower and the derivative routines are not available.
+            linear_solver: solver of the vortex lattice systems, "direct" for a dense LU factorization or
+                "gmres" for preconditioned GMRES (see `set_linear_solver`)
+            num_threads: number of threads of the BLAS/LAPACK library used for the AIC factorization and solves
+                (see `set_num_threads`). By default the library's own setting is kept
+            cache_dir: directory of the AIC cache. If given, the AIC matrix, its factors, and the induced-velocity
+                matrices are written there the first time they are built for a lattice and Mach number, and any
+                later solver with the same lattice, Mach number, and symmetry settings reads them back instead
+                of rebuilding them (see `execute_run`)
 
         """
 
@@ -272,6 +351,7 @@ class OVLSolver(object):
         
 
         self.avl = MExt.MExt("libavl", module_name, "optvl", lib_so_file=avl_lib_so_file, debug=debug)._module
+        self.__set_fort_arr_registry()
 
         # Initialize AVL
         self.avl.avl()
@@ -280,6 +360,25 @@ class OVLSolver(object):
 
         if timing:
             self.set_avl_fort_arr("CASE_L", "LTIMING", True)
+
+        self.reset_timings()
+
+        # must be set before the geometry is loaded because it controls which matrices are allocated
+        self.low_memory = low_memory
+        if low_memory:
+            self.set_avl_fort_arr("CASE_L", "LLOWMEM", True)
+
+        self.set_linear_solver(linear_solver)
+        if num_threads is not None:
+            self.set_num_threads(num_threads)
+
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # shared memory the AIC matrices point to (see `share_aic`)
+        self._shared_aic_mem = None
+        self._owns_shared_aic_mem = False
         
         self.__set_avl_size_info()
 
@@ -404,6 +503,23 @@ class OVLSolver(object):
         if timing:
             print(f"AVL init took {time.time() - start_time} seconds")
 
+    def __set_fort_arr_registry(self):
+        # Each attribute lookup on the f2py module creates a new array object, so the arrays of all
+        # the common block variables are looked up once here. The common blocks are static memory,
+        # so these arrays (and their transposes, which are in C ordering) stay valid for the life of the library
+        self._fort_arrs = {}
+        self._fort_arr_views = {}
+        for blk_name in dir(self.avl):
+            blk = getattr(self.avl, blk_name)
+            for var_name in dir(blk):
+                if var_name.startswith("__") and var_name.endswith("__"):
+                    continue
+
+                val = getattr(blk, var_name)
+                if isinstance(val, np.ndarray):
+                    self._fort_arrs[blk_name, var_name] = val
+                    self._fort_arr_views[blk_name, var_name] = val.T
+
     def __set_avl_size_info(self):
         # Primary array limits: These also need to updated in the Fortran layer if changed
         # its ugly, but it works 
@@ -1206,6 +1322,14 @@ class OVLSolver(object):
         # Flag surface as using mesh geometry
         self.avl.SURF_MESH_L.LSURFMSH[idx_surf] = True
 
+        # remake this surface on the next update of the modified surfaces
+        self.avl.SURF_GEOM_L.LSURFMOD[idx_surf] = True
+
+        # the stored AIC and induced velocity matrices no longer match the geometry
+        self.avl.CASE_L.LAIC = False
+        self.avl.CASE_L.LSRD = False
+        self.avl.CASE_L.LVEL = False
+
     def get_mesh(self, idx_surf: int, concat_dup_mesh: bool = False):
         """Returns the current set mesh coordinates from AVL as a numpy array.
         Note this is intended for 
@@ -1474,14 +1598,694 @@ class OVLSolver(object):
                 raise RuntimeError(f"Mismatch: NBODY = {self.avl.CASE_I.NBODY}, Dictionary: {len(inputDict['bodies'])}")
 
     # region -- analysis api
-    def execute_run(self, tol: float = 0.00002):
+    def execute_run(self, tol: float = 0.00002, warm_start: bool = False):
         """Run the analysis (equivalent to the AVL command `x` in the OPER menu)
 
+        If the solver has a cache directory and the AIC has to be rebuilt, it is read from the cache instead
+        if an entry for the current lattice and Mach number exists. Otherwise the rebuilt AIC is added to the cache.
+
         Args:
             tol: the tolerace of the Newton solver used for triming the aircraft
+            warm_start: start the Newton solver from the last converged run. Its forces and their derivatives
+                are reused for the first Newton step, which saves one force evaluation and predicts the change
+                of all the variables (e.g. the elevator deflection for a new alpha). It is only used if just the
+                constraint values or the parameters that do not change the forces (like the velocity) changed
+                since, otherwise the run starts from scratch as usual. This is meant for sweeps in small steps.
         """
         self.set_avl_fort_arr("CASE_R", "EXEC_TOL", tol)
+        self.set_avl_fort_arr("CASE_L", "LWARM", warm_start)
+
+        cache_key = None
+        if self.cache_dir is not None and not self._is_aic_valid():
+            cache_key = self._get_aic_cache_key()
+            if self._load_aic_cache(cache_key):
+                cache_key = None
+
         self.avl.oper()
+        self._check_linear_solves("run")
+
+        if cache_key is not None:
+            self._save_aic_cache(cache_key)
+
+    def _is_aic_valid(self) -> bool:
+        # the AIC is rebuilt by the next run if it is out of date or was built for another Mach number
+        if not self.get_avl_fort_arr("CASE_L", "LAIC"):
+            return False
+        return self.get_avl_fort_arr("SOLV_R", "AMACH") == self.get_parameter("Mach")
+
+    def _get_aic_cache_key(self) -> str:
+        """Get the key of the AIC cache entry of the current lattice and Mach number
+
+        The key is a hash of everything the AIC and the induced-velocity matrices depend on: the vortices and
+        control points of the lattice, the surfaces without a wake, the Mach number, the symmetry planes, the
+        vortex core sizes, and the kind of factors (linear solver) and matrices (low memory mode) that are stored.
+
+        Returns:
+            cache_key: hex digest of the hash
+        """
+        num_vor = self.get_mesh_size()
+        num_strips = self.get_num_strips()
+        num_surfs = self.get_num_surfaces()
+
+        key_vars = [
+            ("VRTX_R", "RV1", slice(0, num_vor)),
+            ("VRTX_R", "RV2", slice(0, num_vor)),
+            ("VRTX_R", "RV", slice(0, num_vor)),
+            ("VRTX_R", "RC", slice(0, num_vor)),
+            ("VRTX_R", "ENC", slice(0, num_vor)),
+            ("VRTX_R", "CHORDV", slice(0, num_vor)),
+            ("VRTX_I", "LVCOMP", slice(0, num_vor)),
+            ("STRP_I", "IJFRST", slice(0, num_strips)),
+            ("STRP_I", "NVSTRP", slice(0, num_strips)),
+            ("SURF_I", "JFRST", slice(0, num_surfs)),
+            ("SURF_I", "NJ", slice(0, num_surfs)),
+            ("SURF_L", "LFWAKE", slice(0, num_surfs)),
+            ("CASE_I", "IYSYM", None),
+            ("CASE_I", "IZSYM", None),
+            ("CASE_R", "YSYM", None),
+            ("CASE_R", "ZSYM", None),
+            ("CASE_R", "VRCOREC", None),
+            ("CASE_R", "VRCOREW", None),
+        ]
+
+        cache_hash = hashlib.sha1()
+        cache_hash.update(f"{AIC_CACHE_VERSION} {self.linear_solver} {self.low_memory} {num_vor}".encode())
+        for common_block, variable, slicer in key_vars:
+            val = np.ascontiguousarray(self.get_avl_fort_arr(common_block, variable, slicer=slicer))
+            cache_hash.update(val.tobytes())
+        cache_hash.update(np.float64(self.get_parameter("Mach")).tobytes())
+
+        return cache_hash.hexdigest()
+
+    def _load_aic_cache(self, cache_key: str) -> bool:
+        """Set the AIC, its factors, and the induced-velocity matrices from the cache entry, if it exists.
+        The arrays are memory-mapped, so they are only read once while they are copied into AVL.
+
+        Args:
+            cache_key: key of the entry (see `_get_aic_cache_key`)
+
+        Returns:
+            loaded: True if the entry was found and loaded
+        """
+        cache_path = os.path.join(self.cache_dir, cache_key)
+        if not os.path.isdir(cache_path):
+            return False
+
+        cache_data = {}
+        for file_name in os.listdir(cache_path):
+            name = os.path.splitext(file_name)[0]
+            cache_data[name] = np.load(os.path.join(cache_path, file_name), mmap_mode="r")
+
+        self._set_aic_data(cache_data)
+
+        return True
+
+    def _save_aic_cache(self, cache_key: str) -> None:
+        """Write the AIC, its factors, and the induced-velocity matrices of the last run to the cache.
+        The entry is written to a temporary directory first, so other processes never see a partial entry.
+
+        Args:
+            cache_key: key of the entry (see `_get_aic_cache_key`)
+        """
+        cache_path = os.path.join(self.cache_dir, cache_key)
+        if os.path.isdir(cache_path) or not self.get_avl_fort_arr("CASE_L", "LAIC"):
+            return
+
+        cache_data = self._get_aic_data()
+
+        tmp_path = tempfile.mkdtemp(prefix=f".{cache_key}_", dir=self.cache_dir)
+        for name, val in cache_data.items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), val)
+
+        try:
+            os.rename(tmp_path, cache_path)
+        except OSError:
+            # another process added the same entry in the meantime
+            shutil.rmtree(tmp_path)
+
+    def _get_aic_data(self) -> Dict[str, np.ndarray]:
+        """Get copies of the AIC, its factors, and the induced-velocity matrices of the last run
+
+        Returns:
+            aic_data: the arrays by the name of their Fortran variable
+        """
+        num_vor = self.get_mesh_size()
+        aic_data = {
+            "IAPIV": np.array(self.get_avl_fort_arr("SOLV_I", "IAPIV", slicer=slice(0, num_vor))),
+            "LVNC": np.array(self.get_avl_fort_arr("VRTX_L", "LVNC", slicer=slice(0, num_vor))),
+        }
+        aic_data["AICN"], aic_data["AICN_LU"] = self.avl.get_aic_data(num_vor)
+
+        # the induced-velocity matrices are not stored in low memory mode
+        if not self.low_memory:
+            aic_data["WC_GAM"], aic_data["WV_GAM"] = self.avl.get_vel_data(num_vor)
+
+        return aic_data
+
+    def _set_aic_data(self, aic_data: Dict[str, np.ndarray]) -> None:
+        """Set the AIC, its factors, and the induced-velocity matrices from `_get_aic_data`, which must have been
+        taken with the current lattice and Mach number (see `_get_aic_cache_key`)
+
+        Args:
+            aic_data: the arrays by the name of their Fortran variable
+        """
+        num_vor = self.get_mesh_size()
+        self.set_avl_fort_arr("SOLV_I", "IAPIV", aic_data["IAPIV"], slicer=slice(0, num_vor))
+        self.set_avl_fort_arr("VRTX_L", "LVNC", aic_data["LVNC"], slicer=slice(0, num_vor))
+        self.avl.set_aic_data(aic_data["AICN"], aic_data["AICN_LU"], self.get_parameter("Mach"))
+
+        if not self.low_memory:
+            self.avl.set_vel_data(aic_data["WC_GAM"], aic_data["WV_GAM"])
+
+    def share_aic(self) -> Dict[str, Any]:
+        """Move the AIC, its factors, and the induced-velocity matrices of the last run to shared memory, so
+        solvers of the same geometry in other processes (e.g. the workers of a `multiprocessing.Pool`) can
+        use them without building and factoring them again, and without a copy of their own.
+        The memory is only ever read by the solvers, a solver that has to change the matrices (e.g. after a
+        change of the geometry or the Mach number) makes a private copy of them first.
+        This solver owns the memory and frees it in `release_shared_aic`, which must not be called before
+        the solvers that are attached to it are done.
+
+        Returns:
+            shared_aic: description of the shared memory to pass to `attach_shared_aic`, it can be pickled
+        """
+        if not self._is_aic_valid():
+            raise RuntimeError("The AIC is not up to date, call `execute_run` before sharing it")
+
+        self.release_shared_aic()
+
+        num_vor = self.get_mesh_size()
+        shared_mem = shared_memory.SharedMemory(create=True, size=self._get_shared_aic_size(num_vor))
+        self._attach_shared_mem(shared_mem, num_vor, copy=True)
+        self._owns_shared_aic_mem = True
+
+        shared_aic = {
+            "name": shared_mem.name,
+            "cache_key": self._get_aic_cache_key(),
+            "Mach": self.get_parameter("Mach"),
+            "IAPIV": np.array(self.get_avl_fort_arr("SOLV_I", "IAPIV", slicer=slice(0, num_vor))),
+            "LVNC": np.array(self.get_avl_fort_arr("VRTX_L", "LVNC", slicer=slice(0, num_vor))),
+        }
+
+        return shared_aic
+
+    def attach_shared_aic(self, shared_aic: Dict[str, Any]) -> None:
+        """Use the AIC, its factors, and the induced-velocity matrices shared by another solver (see `share_aic`).
+        The solver must have the same lattice, Mach number, linear solver, and memory mode as the one that
+        shared them.
+
+        Args:
+            shared_aic: description of the shared memory returned by `share_aic`
+        """
+        if shared_aic["cache_key"] != self._get_aic_cache_key():
+            raise ValueError(
+                "The shared AIC was built for another lattice, Mach number, linear solver, or memory mode"
+            )
+
+        self.release_shared_aic()
+
+        num_vor = self.get_mesh_size()
+        shared_mem = shared_memory.SharedMemory(name=shared_aic["name"])
+        self.set_avl_fort_arr("SOLV_I", "IAPIV", shared_aic["IAPIV"], slicer=slice(0, num_vor))
+        self.set_avl_fort_arr("VRTX_L", "LVNC", shared_aic["LVNC"], slicer=slice(0, num_vor))
+        self._attach_shared_mem(shared_mem, num_vor, copy=False, mach=shared_aic["Mach"])
+
+    def release_shared_aic(self) -> None:
+        """Stop using the shared memory of `share_aic` or `attach_shared_aic`. The AIC matrices get private
+        copies of it, and the memory is freed if this solver shared it.
+        """
+        if self._shared_aic_mem is None:
+            return
+
+        self.avl.unshare_aic_data()
+        self._shared_aic_mem.close()
+        if self._owns_shared_aic_mem:
+            self._shared_aic_mem.unlink()
+
+        self._shared_aic_mem = None
+        self._owns_shared_aic_mem = False
+
+    def _get_shared_aic_size(self, num_vor: int) -> int:
+        # AICN and AICN_LU and, if stored, the 3 components of WC_GAM and WV_GAM
+        num_mat = 2 if self.low_memory else 8
+        return num_mat * num_vor**2 * np.dtype(np.float64).itemsize
+
+    def _attach_shared_mem(
+        self, shared_mem: shared_memory.SharedMemory, num_vor: int, copy: bool, mach: float = 0.0
+    ) -> None:
+        """Point the AIC matrices to the shared memory, which holds them one after another
+
+        Args:
+            shared_mem: memory of the matrices
+            num_vor: number of vortices
+            copy: copy the current matrices into the memory
+            mach: Mach number of the matrices in the memory, if they are not copied
+        """
+        if shared_mem.size < self._get_shared_aic_size(num_vor):
+            shared_mem.close()
+            raise ValueError("The shared memory is too small for the AIC matrices of this solver")
+
+        # only the address is kept, a view of the buffer would keep the memory from being closed
+        mem_view = np.frombuffer(shared_mem.buf, dtype=np.float64)
+        addr = mem_view.ctypes.data
+        del mem_view
+
+        mat_size = num_vor**2 * np.dtype(np.float64).itemsize
+        aic_addr = addr
+        aic_lu_addr = addr + mat_size
+        if self.low_memory:
+            wc_addr = wv_addr = 0
+        else:
+            wc_addr = addr + 2 * mat_size
+            wv_addr = addr + 5 * mat_size
+
+        self.avl.attach_aic_data(aic_addr, aic_lu_addr, wc_addr, wv_addr, num_vor, mach, copy)
+        self._shared_aic_mem = shared_mem
+
+    def set_linear_solver(self, solver: str, tol: float = 1e-10, maxiter: int = 500) -> None:
+        """Set how the vortex lattice systems of the analysis, the stability derivatives, and the adjoints are solved
+
+        The "direct" solver factors the dense AIC once per geometry, which is O(N^3) in the number of vortices.
+        The "gmres" solver only factors the diagonal blocks of groups of adjacent strips of the same surface,
+        with up to 200 vortices per block (a single strip with more vortices is its own block), and uses them
+        to precondition GMRES.
+        Each solve is then O(N^2) per iteration, which is faster for meshes with many thousands of vortices.
+
+        Args:
+            solver: "direct" or "gmres"
+            tol: GMRES tolerance on the residual relative to the right-hand side
+            maxiter: maximum number of GMRES iterations per solve
+        """
+        if solver not in ["direct", "gmres"]:
+            raise ValueError(f"linear solver must be 'direct' or 'gmres', not '{solver}'")
+
+        self.linear_solver = solver
+        self.set_avl_fort_arr("GMRES_R", "GMRES_TOL", tol)
+        self.set_avl_fort_arr("GMRES_I", "GMRES_MAXIT", maxiter)
+
+        use_gmres = solver == "gmres"
+        if self.get_avl_fort_arr("CASE_L", "LITSOLV") != use_gmres:
+            self.set_avl_fort_arr("CASE_L", "LITSOLV", use_gmres)
+            # the stored factors are of the other kind
+            self.set_avl_fort_arr("CASE_L", "LAIC", False)
+
+    def _check_linear_solves(self, solves: str) -> None:
+        """Warn if some GMRES solves of the last run or linear solve call did not converge
+
+        A run with unconverged solves is also not marked as converged (see `CASE_L.LSOL`).
+
+        Args:
+            solves: what the solves were for, used in the warning
+        """
+        num_fail = self.get_avl_fort_arr("GMRES_I", "GMRES_NFAIL")
+        if num_fail > 0:
+            maxiter = self.get_avl_fort_arr("GMRES_I", "GMRES_MAXIT")
+            warnings.warn(
+                f"OptVL WARNING - {num_fail} GMRES solve(s) of the {solves} did not converge in {maxiter} iterations. "
+                "Increase maxiter with set_linear_solver.",
+                stacklevel=3,
+            )
+
+    def set_num_threads(self, num_threads: int) -> None:
+        """Set the number of threads of the BLAS/LAPACK library used for the AIC factorization and solves
+
+        This only has an effect if OptVL was built against a threaded library such as OpenBLAS or MKL
+        (see the `blas` and `lapack` meson options). The library is shared by the process,
+        so the setting applies to all the OVLSolver instances.
+
+        Args:
+            num_threads: number of threads
+        """
+        if num_threads < 1:
+            raise ValueError(f"the number of threads must be at least 1, not {num_threads}")
+
+        self.avl.set_blas_threads(num_threads)
+
+    def get_num_threads(self) -> int:
+        """Get the number of threads of the BLAS/LAPACK library
+
+        Returns:
+            num_threads: number of threads, which is 1 for the reference LAPACK routines
+        """
+        return int(self.avl.get_blas_threads())
+
+    def is_blas_threaded(self) -> bool:
+        """Check if OptVL was built against a threaded BLAS/LAPACK library, whose number of threads can be set
+
+        Returns:
+            threaded: False for the reference LAPACK routines
+        """
+        return bool(self.avl.get_blas_threaded())
+
+    def execute_run_batch(
+        self,
+        conditions: Union[Dict[str, Any], np.ndarray],
+        tol: float = 0.00002,
+        stab_derivs: bool = False,
+        strip_forces: Optional[List[str]] = None,
+        warm_start: bool = False,
+    ) -> np.ndarray:
+        """Run the analysis for a batch of operating points and collect the results in one array.
+
+        The AIC matrix is only factored once and the unit freestream, rotation, and control
+        solutions are only computed once for the whole batch. Each point is then formed by
+        superposition of the stored solutions. Trimmed points run their Newton iterations one
+        after the other, each starting from the converged state of the previous point.
+        The run case is left at the state of the last point.
+
+        Args:
+            conditions: the operating points. Either a structured array or a dictionary whose keys are
+                variables ["alpha", "beta", "roll rate", "pitch rate", "yaw rate"] or control surface names.
+                A dictionary value is an array of values for that variable, or a tuple `(con_var, values)` to
+                drive the variable so that `con_var` (e.g. "CL" or "Cm") takes the given values (see `set_constraint`)
+            tol: the tolerace of the Newton solver used for triming the aircraft
+            stab_derivs: if True, the stability and control surface derivatives are included in the output
+            strip_forces: keys of `get_strip_forces` to include in the output for each strip of all the surfaces
+            warm_start: start the Newton solver of each point from the forces and derivatives of the previous
+                point (see `execute_run`). This saves force evaluations for finely spaced trimmed points
+
+        Returns:
+            batch_data: structured array with one entry per operating point. The fields are the variables,
+                the control deflections, the keys of `get_total_forces`, a "converged" flag, the
+                keys of `get_stab_derivs` and `get_control_stab_derivs` (if requested), and a
+                nested "strips" field with an array over the strips for each requested strip key
+        """
+        cons, num_points = self._get_batch_points(
+            conditions, "conditions", self.run_variables + self.get_control_names(), allow_con_var=True
+        )
+
+        batch_data = np.zeros(num_points, dtype=self._get_run_data_dtype(stab_derivs, strip_forces))
+
+        for idx_point in range(num_points):
+            for var, (con_var, vals) in cons.items():
+                self.set_constraint(var, con_var, vals[idx_point])
+
+            self.execute_run(tol=tol, warm_start=warm_start)
+            self._set_run_data(batch_data[idx_point], stab_derivs, strip_forces)
+
+        return batch_data
+
+    @staticmethod
+    def _get_batch_points(
+        points: Union[Dict[str, Any], np.ndarray],
+        name: str,
+        valid_keys: Optional[List[str]] = None,
+        allow_con_var: bool = False,
+    ) -> Tuple[Dict[str, Any], int]:
+        """Check the points of a batch method and convert their values to arrays of the same length
+
+        Args:
+            points: either a structured array or a dictionary of the values of each variable at the points
+            name: name of the argument, used in the error messages
+            valid_keys: the allowed variables, or None to allow any variable
+            allow_con_var: allow a tuple `(con_var, values)` as the values of a variable (see `execute_run_batch`)
+
+        Returns:
+            point_vals: dictionary of the arrays of values of each variable, or of the tuples `(con_var, values)`
+                if allow_con_var is True. Variables given directly then have a con_var of None
+            num_points: the number of points
+        """
+        if isinstance(points, np.ndarray):
+            if points.dtype.names is None:
+                raise TypeError(f"{name} must be a structured array if an np.ndarray is given")
+            points = {key: points[key] for key in points.dtype.names}
+
+        point_vals = {}
+        num_points = None
+        for var, spec in points.items():
+            if valid_keys is not None and var not in valid_keys:
+                raise ValueError(f"`{var}` in {name} is not a valid option. Must be one of {valid_keys}")
+
+            con_var, vals = spec if allow_con_var and isinstance(spec, tuple) else (None, spec)
+            vals = np.atleast_1d(np.asarray(vals, dtype=float))
+            if num_points is None:
+                num_points = vals.size
+            elif vals.size != num_points:
+                raise ValueError(f"all {name} must have the same number of points. `{var}` has {vals.size}, not {num_points}")
+
+            point_vals[var] = (con_var, vals) if allow_con_var else vals
+
+        if num_points is None:
+            raise ValueError(f"{name} must have at least one variable")
+
+        return point_vals, num_points
+
+    def _get_run_data_dtype(self, stab_derivs: bool, strip_forces: Optional[List[str]]) -> List[tuple]:
+        """Get the fields of the structured array of the results of several runs (see `execute_run_batch`)
+
+        Args:
+            stab_derivs: if True, the stability and control surface derivatives are included
+            strip_forces: keys of `get_strip_forces` to include for each strip of all the surfaces
+
+        Returns:
+            fields: the fields of the structured array
+        """
+        control_names = self.get_control_names()
+        fields = [(key, float) for key in self.run_variables + control_names]
+        fields += [(key, float) for key in self.case_var_to_fort_var]
+        fields += [("converged", bool)]
+        if stab_derivs:
+            fields += [(key, float) for key in self.case_stab_derivs_to_fort_var]
+            fields += [
+                (self._get_deriv_key(control, func), float)
+                for func in self.case_derivs_to_fort_var
+                for control in control_names
+            ]
+        if strip_forces:
+            num_strips = int(self.get_num_strips())
+            fields += [("strips", [(key, float, (num_strips,)) for key in strip_forces])]
+
+        return fields
+
+    def _set_run_data(self, point_data: np.void, stab_derivs: bool, strip_forces: Optional[List[str]]) -> None:
+        """Copy the results of the last run into one entry of the array from `_get_run_data_dtype`
+
+        Args:
+            point_data: the entry of the structured array
+            stab_derivs: if True, the stability and control surface derivatives are included
+            strip_forces: keys of `get_strip_forces` to include for each strip of all the surfaces
+        """
+        for var in self.run_variables:
+            point_data[var] = self.get_variable(var)
+        for control, val in self.get_control_deflections().items():
+            point_data[control] = val
+        for key, val in self.get_total_forces().items():
+            point_data[key] = val
+        point_data["converged"] = self.get_avl_fort_arr("CASE_L", "LSOL")
+
+        if stab_derivs:
+            for key, val in chain(self.get_stab_derivs().items(), self.get_control_stab_derivs().items()):
+                point_data[key] = val
+
+        if strip_forces:
+            strip_data = self.get_strip_forces()
+            for key in strip_forces:
+                point_data["strips"][key] = np.concatenate([strip_data[surf][key] for surf in self.surface_names])
+
+    def continuation_sweep(
+        self,
+        con_var: str,
+        start: float,
+        stop: float,
+        step: Optional[float] = None,
+        min_step: Optional[float] = None,
+        max_step: Optional[float] = None,
+        tol: float = 0.00002,
+        stab_derivs: bool = False,
+        strip_forces: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """March the value of a constraint of the run case from start to stop, e.g. CL towards CLmax of a trimmed aircraft.
+
+        Each step is predicted along the tangent of the trim curve, which is given by the stability and control
+        surface derivatives of the last converged point, and then corrected by the Newton solver of the trim.
+        The step grows while the corrector converges in few iterations and is halved when it does not converge
+        (e.g. because the trim hits the iteration or angle limit). If the step falls below `min_step`, the sweep
+        ends at the last converged point with a warning, which is then close to the limit of the trim curve.
+
+        Args:
+            con_var: the constraint to sweep, which must have been set for one of the variables with
+                `set_constraint` (e.g. "CL" for `set_constraint("alpha", "CL", 0.5)`). The options are
+                ["alpha", "beta", "roll rate", "pitch rate", "yaw rate", "CL", "CY", "Cl", "Cm", "Cn"] or any control surface
+            start: first value of the constraint
+            stop: last value of the constraint
+            step: initial step size, by default a tenth of the range
+            min_step: smallest step size before the sweep is stopped, by default a thousandth of the range
+            max_step: largest step size, by default the range
+            tol: the tolerace of the Newton solver used for triming the aircraft
+            stab_derivs: if True, the stability and control surface derivatives are included in the output
+            strip_forces: keys of `get_strip_forces` to include in the output for each strip of all the surfaces
+
+        Returns:
+            sweep_data: structured array with one entry per converged point of the sweep, with the same fields
+                as the output of `execute_run_batch`
+        """
+        control_names = self.get_control_names()
+        if con_var in self.con_var_to_icon:
+            icon_sweep = self.con_var_to_icon[con_var]
+        elif con_var in control_names:
+            icon_sweep = len(self.con_var_to_icon) + control_names.index(con_var) + 1
+        else:
+            raise ValueError(
+                f"specified constraint `{con_var}` not a valid option. Must be one of the following {list(self.con_var_to_icon)} or control surface names {control_names}."
+            )
+
+        num_vars = len(self.run_variables) + len(control_names)
+        icon = self.get_avl_fort_arr("CASE_I", "ICON")[0, :num_vars]
+        if icon_sweep not in icon:
+            raise ValueError(f"`{con_var}` is not a constraint of the run case. Set it for a variable with `set_constraint` first")
+        idx_var = int(np.nonzero(icon == icon_sweep)[0][0])
+        var = (self.run_variables + control_names)[idx_var]
+
+        val_range = abs(stop - start)
+        direction = np.sign(stop - start)
+        step = abs(step) if step is not None else 0.1 * val_range
+        min_step = min_step if min_step is not None else 1e-3 * val_range
+        max_step = max_step if max_step is not None else val_range
+
+        self.set_constraint(var, con_var, float(start))
+        self.execute_run(tol=tol)
+        if not self.get_avl_fort_arr("CASE_L", "LSOL"):
+            raise RuntimeError(f"the trim at the start of the sweep did not converge for {con_var} = {start}")
+
+        dtype = self._get_run_data_dtype(stab_derivs, strip_forces)
+        sweep_data = [np.zeros((), dtype=dtype)]
+        self._set_run_data(sweep_data[-1], stab_derivs, strip_forces)
+
+        val = start
+        while direction * (stop - val) > 0:
+            val_new = val + direction * min(step, abs(stop - val))
+
+            # predict the new point along the tangent of the trim curve
+            state = self._get_trim_state()
+            self._set_trim_state(state + self._get_trim_tangent(icon_sweep) * (val_new - val))
+            self.set_constraint(var, con_var, float(val_new))
+
+            self.execute_run(tol=tol)
+            num_iters = self.get_avl_fort_arr("CASE_I", "NITEXEC")
+
+            if self.get_avl_fort_arr("CASE_L", "LSOL"):
+                val = val_new
+                sweep_data.append(np.zeros((), dtype=dtype))
+                self._set_run_data(sweep_data[-1], stab_derivs, strip_forces)
+
+                # a good prediction only needs one Newton step and one to confirm the convergence
+                if num_iters <= 2:
+                    step = min(2 * step, max_step)
+                elif num_iters > 4:
+                    step = max(0.5 * step, min_step)
+            else:
+                step *= 0.5
+                if step < min_step:
+                    warnings.warn(
+                        f"the trim did not converge past {con_var} = {val}, so the sweep ended before {stop}",
+                        stacklevel=2,
+                    )
+                    # leave the solver at the last converged point
+                    self._set_trim_state(state)
+                    self.set_constraint(var, con_var, float(val))
+                    self.execute_run(tol=tol)
+                    break
+
+                self._set_trim_state(state)
+
+        return np.array(sweep_data, dtype=dtype)
+
+    def _get_trim_state(self) -> np.ndarray:
+        """Get the variables of the trim solve: alpha and beta in degrees, the nondimensional rates in the
+        axes of the rate constraints (stability axes by default), and the control surface deflections
+
+        Returns:
+            state: the values of the variables in the order of `run_variables` and the control surfaces
+        """
+        alfa = self.get_avl_fort_arr("CASE_R", "ALFA")[()]
+        wrot = self.get_avl_fort_arr("CASE_R", "WROT")
+        ref_data = self.get_reference_data()
+        ca, sa, sign = self._get_rate_axes(alfa)
+
+        state = np.zeros(len(self.run_variables) + len(self.get_control_names()))
+        state[0] = np.rad2deg(alfa)
+        state[1] = np.rad2deg(self.get_avl_fort_arr("CASE_R", "BETA")[()])
+        state[2] = (wrot[0] * ca + wrot[2] * sa) * sign * ref_data["Bref"] / 2
+        state[3] = wrot[1] * ref_data["Cref"] / 2
+        state[4] = (wrot[2] * ca - wrot[0] * sa) * sign * ref_data["Bref"] / 2
+        state[5:] = self.get_avl_fort_arr("CASE_R", "DELCON", slicer=slice(0, state.size - 5))
+        return state
+
+    def _set_trim_state(self, state: np.ndarray) -> None:
+        """Set the variables of the trim solve, which the next run starts from (see `_get_trim_state`)
+
+        Args:
+            state: the values of the variables in the order of `run_variables` and the control surfaces
+        """
+        alfa = np.deg2rad(state[0])
+        ref_data = self.get_reference_data()
+        ca, sa, sign = self._get_rate_axes(alfa)
+        rate_x = state[2] * 2 / ref_data["Bref"]
+        rate_z = state[4] * 2 / ref_data["Bref"]
+
+        wrot = np.array(
+            [(rate_x * ca - rate_z * sa) * sign, state[3] * 2 / ref_data["Cref"], (rate_x * sa + rate_z * ca) * sign]
+        )
+        self.set_avl_fort_arr("CASE_R", "ALFA", alfa)
+        self.set_avl_fort_arr("CASE_R", "BETA", np.deg2rad(state[1]))
+        self.set_avl_fort_arr("CASE_R", "WROT", wrot)
+        self.set_avl_fort_arr("CASE_R", "DELCON", state[5:], slicer=slice(0, state.size - 5))
+
+    def _get_rate_axes(self, alfa: float) -> Tuple[float, float, float]:
+        """Get the rotation from body axes to the axes of the rate and moment constraints of the trim
+
+        Args:
+            alfa: angle of attack in radians
+
+        Returns:
+            ca: cosine of the rotation angle
+            sa: sine of the rotation angle
+            sign: -1 for NASA standard stability axes (X fwd, Z down) and 1 for geometric ones
+        """
+        if self.get_avl_fort_arr("CASE_L", "LSA_RATES"):
+            ca, sa = np.cos(alfa), np.sin(alfa)
+        else:
+            ca, sa = 1.0, 0.0
+        sign = -1.0 if self.get_avl_fort_arr("CASE_L", "LNASA_SA") else 1.0
+        return ca, sa, sign
+
+    def _get_trim_tangent(self, icon_sweep: int) -> np.ndarray:
+        """Get the change of the trim variables for a unit change of the value of one constraint.
+        The trim Jacobian is assembled from the stability and control surface derivatives of the last run.
+
+        Args:
+            icon_sweep: AVL index of the constraint (see `con_var_to_icon`)
+
+        Returns:
+            tangent: derivative of the variables of `_get_trim_state` with respect to the constraint value
+        """
+        control_names = self.get_control_names()
+        num_vars = len(self.run_variables) + len(control_names)
+        icon = self.get_avl_fort_arr("CASE_I", "ICON")[0, :num_vars]
+        icon_to_func = {self.con_var_to_icon[key]: func for key, func in self.con_var_to_stab_func.items()}
+        stab_derivs = self.get_stab_derivs()
+        con_surf_derivs = self.get_control_stab_derivs()
+        dtr = self.get_avl_fort_arr("CASE_R", "DTR")[()]
+
+        jac = np.zeros((num_vars, num_vars))
+        for idx_var, idx_con in enumerate(icon):
+            if idx_con in icon_to_func:
+                func = icon_to_func[idx_con]
+                jac[idx_var, :5] = [stab_derivs[self._get_deriv_key(var, func)] for var in ["alpha", "beta", "p'", "q'", "r'"]]
+                # the stability derivatives are per radian
+                jac[idx_var, :2] *= dtr
+                jac[idx_var, 5:] = [con_surf_derivs[self._get_deriv_key(control, func)] for control in control_names]
+            elif idx_con <= 5:
+                jac[idx_var, idx_con - 1] = 1.0
+            else:
+                jac[idx_var, idx_con - len(self.con_var_to_icon) + 4] = 1.0
+
+        rhs = (icon == icon_sweep).astype(float)
+        try:
+            return np.linalg.solve(jac, rhs)
+        except np.linalg.LinAlgError:
+            # without a tangent the new point starts from the last one
+            return np.zeros(num_vars)
 
     def set_variable(self, var: str, val: float):
         """set a variable for the run case (equivalent to setting a variable in AVL's OPER menu)
@@ -1643,24 +2447,12 @@ class OVLSolver(object):
 
         """
 
-        options = {
-            "bankAng": ["B"],
-            "CL": ["C"],
-            "velocity": ["V"],
-            "mass": ["M"],
-            "dens": ["D"],
-            "G": ["G"],
-            "X cg": ["X"],
-            "Y cg": ["Y"],
-            "Z cg": ["Z"],
-        }
-
-        if variable not in options:
+        if variable not in self.trim_var_to_avl_cmd:
             raise ValueError(
-                f"constraint variable `{variable}` not a valid option. Must be one of the following {[key for key in options]} "
+                f"constraint variable `{variable}` not a valid option. Must be one of the following {[key for key in self.trim_var_to_avl_cmd]} "
             )
 
-        self.avl.trmset("C1", "1 ", options[variable][0], (str(val) + "  \n"))
+        self.avl.trmset("C1", "1 ", self.trim_var_to_avl_cmd[variable], (str(val) + "  \n"))
 
     def get_total_forces(self) -> Dict[str, float]:
         """Get the aerodynamic data for the last run case and return it as a dictionary.
@@ -1772,6 +2564,46 @@ class OVLSolver(object):
 
         return ref_data
 
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """Get the wall-clock time spent in each phase of the analysis and sensitivity routines.
+        The times and call counts accumulate over all runs since the solver was created or reset_timings was called.
+
+        Returns:
+            timings: Dictionary with the total time in seconds ("time") and the number of runs ("calls") of each phase
+        """
+        times = self.get_avl_fort_arr("TIMING_R", "TPHASE")
+        calls = self.get_avl_fort_arr("TIMING_I", "NPHASE")
+
+        timings = {}
+        for idx_phase, phase in enumerate(self.fort_timed_phases):
+            timings[phase] = {"time": float(times[idx_phase]), "calls": int(calls[idx_phase])}
+
+        for phase, timing in self._py_timings.items():
+            timings[phase] = dict(timing)
+
+        return timings
+
+    def reset_timings(self) -> None:
+        """Reset the accumulated times and call counts returned by get_timings"""
+        self.set_avl_fort_arr("TIMING_R", "TPHASE", 0.0)
+        self.set_avl_fort_arr("TIMING_I", "NPHASE", 0)
+        self._py_timings = {phase: {"time": 0.0, "calls": 0} for phase in self.py_timed_phases}
+
+    def _add_timing(self, phase: str, time_start: float) -> float:
+        """Add the wall-clock time since time_start to a phase timed in python
+
+        Args:
+            phase: name of the phase in py_timed_phases
+            time_start: value of time.perf_counter at the start of the phase
+
+        Returns:
+            time_end: value of time.perf_counter at the end of the phase
+        """
+        time_end = time.perf_counter()
+        self._py_timings[phase]["time"] += time_end - time_start
+        self._py_timings[phase]["calls"] += 1
+        return time_end
+
     def get_avl_fort_arr(self, common_block: str, variable: str, slicer: Optional[slice] = None) -> np.ndarray:
         """Get data from the Fortran level common block data structure. see AVL.INC for all availible variables
 
@@ -1783,17 +2615,8 @@ class OVLSolver(object):
         Returns:
             val: value of variable after applying the slice (if present)
         """
-        # this had to be split up into two steps to work
-
-        # get the corresponding common block object.
-        # it must be lowercase because of f2py
-        common_block = getattr(self.avl, common_block.upper())
-
-        # get the value of the variable from the common block
-        val = getattr(common_block, variable.upper())
-
-        # convert from fortran ordering to c ordering
-        val = val.ravel(order="F").reshape(val.shape[::-1], order="C")
+        # the transpose of the fortran array is a view in c ordering
+        val = self._fort_arr_views[common_block.upper(), variable.upper()]
 
         # Apply slicer if provided
         if slicer is not None:
@@ -1817,16 +2640,13 @@ class OVLSolver(object):
         """
         # convert from c ordering to fortran ordering
         if isinstance(val, np.ndarray):
-            val = val.ravel(order="C").reshape(val.shape[::-1], order="F")
+            val = val.T
 
-        # this had to be split up into two steps to work
-        # get the corresponding common block object.
-        # it must be lowercase because of f2py
-        common_block_obj = getattr(self.avl, common_block.upper())
+        # the values are assigned in place to the array of the common block variable
+        fort_arr = self._fort_arrs[common_block.upper(), variable.upper()]
 
-        # get the value of the variable from the common block
         if slicer is None:
-            setattr(common_block_obj, variable.upper(), val)
+            fort_arr[...] = val
         else:
             if isinstance(slicer, int):
                 if isinstance(val, np.ndarray):
@@ -1846,9 +2666,7 @@ class OVLSolver(object):
                 slicer = slicer[::-1]
                 fort_val = val
 
-            original_val = getattr(common_block_obj, variable.upper())
-            original_val[slicer] = fort_val
-            setattr(common_block_obj, variable.upper(), original_val)
+            fort_arr[slicer] = fort_val
 
         return
 
@@ -2089,12 +2907,13 @@ class OVLSolver(object):
         for surf in self.surface_names:
             strip_data[surf] = {}
 
+        strip_indices = [self._get_surface_strip_indices(idx_surf) for idx_surf in range(len(self.surface_names))]
+
         for key, avl_key in var_to_fort_var.items():
             vals = self.get_avl_fort_arr(*avl_key)
 
             # add the values to corresponding surface dict
-            for idx_surf, surf_name in enumerate(self.surface_names):
-                idx_srp_beg, idx_srp_end = self._get_surface_strip_indices(idx_surf)
+            for surf_name, (idx_srp_beg, idx_srp_end) in zip(self.surface_names, strip_indices):
                 strip_data[surf_name][key] = vals[idx_srp_beg:idx_srp_end]
 
         # process the data
@@ -2151,9 +2970,104 @@ class OVLSolver(object):
         return idx_srp_beg, idx_srp_end
 
     # region --- modal analysis api
-    def execute_eigen_mode_calc(self):
-        """Execute a modal analysis (x from the MODE menu in AVL)"""
-        self.avl.execute_eigenmode_calc()
+    def execute_eigen_mode_calc(self, run: bool = True):
+        """Execute a modal analysis (x from the MODE menu in AVL)
+
+        Args:
+            run: run the analysis first. Otherwise the modes of the current solution are computed
+        """
+        if run:
+            self.avl.execute_eigenmode_calc()
+        else:
+            self.avl.execute_eigensol()
+
+    def execute_eigen_sweep(
+        self, params: Union[Dict[str, Any], np.ndarray], track_modes: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Execute a modal analysis at each point of a sweep over the flight envelope, e.g. for root loci or
+        handling-qualities maps.
+
+        The trim of each point starts from the converged state of the previous point, and the factored AIC
+        is reused as long as the geometry and the Mach number do not change.
+        The run case is left at the state of the last point.
+
+        Args:
+            params: the points of the sweep. Either a structured array or a dictionary whose keys are variables of
+                `set_trim_condition` (e.g. "velocity", "X cg", or "mass") or parameters of `set_parameter`, and
+                whose values are arrays of the values at the points
+            track_modes: order the modes of each point so that they match the modes of the previous point, which
+                are found by the correlation of the eigenvectors. Otherwise the modes are in the order used by AVL
+
+        Returns:
+            eig_vals: 2D array of the eigenvalues of each point, (num_points, num_modes). If a point has
+                fewer modes than the others, the missing entries are NaN
+            eig_vecs: 3D array of the eigenvectors of each point, (num_points, num_modes, nsys)
+        """
+        param_vals, num_points = self._get_batch_points(
+            params, "params", list(self.trim_var_to_avl_cmd) + list(self.param_idx_dict)
+        )
+
+        nsys = self.get_avl_fort_arr("CASE_Z", "EVAL").shape[1]
+        eig_vals = np.full((num_points, nsys), np.nan, dtype=complex)
+        eig_vecs = np.full((num_points, nsys, nsys), np.nan, dtype=complex)
+        num_modes = 0
+
+        for idx_point in range(num_points):
+            for var, vals in param_vals.items():
+                if var in self.trim_var_to_avl_cmd:
+                    self.set_trim_condition(var, vals[idx_point])
+                else:
+                    self.set_parameter(var, vals[idx_point])
+
+            self.execute_eigen_mode_calc()
+            point_vals = self.get_eigenvalues()
+            point_vecs = self.get_eigenvectors()
+            num_eigen = point_vals.size
+            num_modes = max(num_modes, num_eigen)
+
+            if track_modes and idx_point > 0:
+                order = self._match_modes(eig_vecs[idx_point - 1], point_vecs)
+            else:
+                order = np.arange(num_eigen)
+
+            eig_vals[idx_point, order] = point_vals
+            eig_vecs[idx_point, order] = point_vecs
+
+        return eig_vals[:, :num_modes], eig_vecs[:, :num_modes]
+
+    @staticmethod
+    def _match_modes(vecs_prev: np.ndarray, vecs: np.ndarray) -> np.ndarray:
+        """Match modes to the modes of the previous point by the correlation of their eigenvectors, i.e. the magnitude
+        of the normalized inner product. The pairs are taken greedily from the most correlated one down.
+
+        Args:
+            vecs_prev: eigenvectors of the modes of the previous point, (nsys, nsys). Slots without a mode are NaN
+            vecs: eigenvectors of the current point, (num_eigen, nsys)
+
+        Returns:
+            order: slot of each current mode in the mode order of the previous point
+        """
+        num_slots = vecs_prev.shape[0]
+        num_eigen = vecs.shape[0]
+
+        # empty slots are not correlated with any mode
+        vecs_prev = np.nan_to_num(vecs_prev)
+        norm_prev = np.linalg.norm(vecs_prev, axis=1)
+        norm = np.linalg.norm(vecs, axis=1)
+        norm_prev[norm_prev == 0.0] = 1.0
+        norm[norm == 0.0] = 1.0
+        corr = np.abs(vecs_prev.conj() @ vecs.T) / np.outer(norm_prev, norm)
+
+        order = np.full(num_eigen, -1)
+        slot_taken = np.zeros(num_slots, dtype=bool)
+        for idx_flat in np.argsort(corr, axis=None)[::-1]:
+            idx_slot, idx_eig = np.unravel_index(idx_flat, corr.shape)
+            if slot_taken[idx_slot] or order[idx_eig] >= 0:
+                continue
+            order[idx_eig] = idx_slot
+            slot_taken[idx_slot] = True
+
+        return order
 
     def get_eigenvalues(self) -> np.ndarray:
         """After running an eigenmode calculation, this function will return the eigenvalues in the order used by AVL
@@ -2209,7 +3123,6 @@ class OVLSolver(object):
             Bsys: 2D array representing the system matrix for control surfaces
             Rsys: 1D array representing the RHS of the dynamics equation
         """
-        
         # get the dimesion of the A matrix from the eig_vals    
         eig_vals = self.get_avl_fort_arr("CASE_Z", "EVAL")
         jemax = eig_vals.shape[1]
@@ -2225,53 +3138,84 @@ class OVLSolver(object):
         # trim the columns of the Bsys matrix
         Bsys = Bsys[:, 0:num_controls]
         
-        def apply_state_signs(Asys, Bsys, Rsys):
-            """
-            Apply sign changes to the state matrix A and return the modified version.
-            """
-            nsys = Asys.shape[0]
-
-            # Indices for sign flip
-            jeu   = 0
-            jew   = 1
-            jeq   = 2
-            jeth  = 3
-            jev   = 4
-            jep   = 5
-            jer   = 6
-            jeph  = 7
-            jex   = 8
-            jey   = 9
-            jez   = 10
-            jeps  = 11
-
-            usgn = np.ones(nsys)
-            for idx in [jeu, jew, jep, jer, jex, jez]:
-                if 0 <= idx < nsys:
-                    usgn[idx] = -1.0
-
-            # Allocate result
-            Asys_signed = np.zeros_like(Asys)
-            Bsys_signed = np.zeros_like(Bsys)
-            Rsys_signed = np.zeros_like(Rsys)
-
-            # Apply row/column sign flips explicitly
-            for i in range(nsys):
-                for j in range(nsys):
-                    Asys_signed[i, j] = Asys[i, j] * usgn[i] * usgn[j]
-                
-                for j in range(num_controls):
-                    Bsys_signed[i,j] = Bsys[i, j] * usgn[i]
-                
-                Rsys_signed = Rsys[i]*usgn[i]
-
-            return Asys_signed, Bsys_signed, Rsys_signed
-        
         if in_body_axis:
-            Asys, Bsys, Rsys = apply_state_signs(Asys, Bsys, Rsys)
+            Asys, Bsys, Rsys = self._apply_state_signs(Asys, Bsys, Rsys)
         
         return Asys, Bsys, Rsys
 
+    def get_system_matrices_batch(
+        self, trim_points: Union[Dict[str, Any], np.ndarray], in_body_axis=False, tol: float = 0.00002
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the A, B, and R system matrices (see `get_system_matrices`) for a batch of trim points,
+        e.g. to build gain-scheduling tables.
+
+        Each point is trimmed with one run, starting from the converged state of the previous point,
+        and the matrices are formed from its stability derivatives. The run case is left at the state of the last point.
+
+        Args:
+            trim_points: the trim points. Either a structured array or a dictionary whose keys are variables of
+                `set_trim_condition` (e.g. "velocity" or "CL") and whose values are arrays of the values at the points
+            in_body_axis: apply the sign changes to the matrices to put them in the body axis
+            tol: the tolerace of the Newton solver used for triming the aircraft
+
+        Returns:
+            Asys: 3D array of the system matrix of each point, (num_points, nsys, nsys)
+            Bsys: 3D array of the control surface matrix of each point, (num_points, nsys, num_controls)
+            Rsys: 2D array of the RHS of the dynamics equation of each point, (num_points, nsys)
+        """
+        trim_vals, num_points = self._get_batch_points(trim_points, "trim_points")
+
+        Asys_batch = None
+        for idx_point in range(num_points):
+            for var, vals in trim_vals.items():
+                self.set_trim_condition(var, vals[idx_point])
+
+            self.execute_run(tol=tol)
+            Asys, Bsys, Rsys = self.get_system_matrices()
+
+            if Asys_batch is None:
+                Asys_batch = np.zeros((num_points,) + Asys.shape)
+                Bsys_batch = np.zeros((num_points,) + Bsys.shape)
+                Rsys_batch = np.zeros((num_points,) + Rsys.shape)
+            Asys_batch[idx_point] = Asys
+            Bsys_batch[idx_point] = Bsys
+            Rsys_batch[idx_point] = Rsys
+
+        # the sign changes are applied to the whole stack at once
+        if in_body_axis:
+            Asys_batch, Bsys_batch, Rsys_batch = self._apply_state_signs(Asys_batch, Bsys_batch, Rsys_batch)
+
+        return Asys_batch, Bsys_batch, Rsys_batch
+
+    @staticmethod
+    def _apply_state_signs(
+        Asys: np.ndarray, Bsys: np.ndarray, Rsys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flip the signs of the u, w, p, r, x, and z states to go from the stability axes of AVL to the body axes.
+        The matrices may be stacked along leading axes.
+
+        Args:
+            Asys: system matrix, (..., nsys, nsys)
+            Bsys: control surface matrix, (..., nsys, num_controls)
+            Rsys: RHS of the dynamics equation, (..., nsys)
+
+        Returns:
+            Asys_signed: system matrix with the rows and columns of the states flipped
+            Bsys_signed: control surface matrix with the rows of the states flipped
+            Rsys_signed: RHS with the entries of the states flipped
+        """
+        nsys = Asys.shape[-1]
+
+        # indices of jeu, jew, jep, jer, jex, and jez
+        usgn = np.ones(nsys)
+        usgn[[idx for idx in [0, 1, 5, 6, 8, 10] if idx < nsys]] = -1.0
+
+        Asys_signed = Asys * np.outer(usgn, usgn)
+        Bsys_signed = Bsys * usgn[:, np.newaxis]
+        Rsys_signed = Rsys * usgn
+
+        return Asys_signed, Bsys_signed, Rsys_signed
+
     # region --- geometry api
     def get_control_names(self) -> List[str]:
         """Get the names of the control surfaces
@@ -2409,10 +3353,10 @@ class OVLSolver(object):
                 f"param, {param}, not in found for {surf_name}, that has control surface data {self.con_surf_to_fort_var[surf_name].keys()}"
             )
         # param = self.get_avl_fort_arr(fort_var[0], fort_var[1], slicer=fort_var[2][idx_slice])
-        self.set_avl_fort_arr(fort_var[0], fort_var[1], val, slicer=fort_var[2][idx_slice])
+        self.__set_surf_fort_arr(surf_name, fort_var[0], fort_var[1], val, slicer=fort_var[2][idx_slice])
 
         if update_geom:
-            self.avl.update_surfaces()
+            self.avl.update_modified_surfaces()
 
     def get_surface_param(self, surf_name: str, param: str) -> np.ndarray:
         """Get a parameter of a specified surface. Does not get control surface or design variables.
@@ -2495,17 +3439,17 @@ class OVLSolver(object):
             fort_vars = self.surf_section_geom_to_fort_var[surf_name][param]
 
             for idx_sec, slicer in enumerate(fort_vars[2]):
-                self.set_avl_fort_arr(fort_vars[0], fort_vars[1], val[idx_sec], slicer=slicer)
+                self.__set_surf_fort_arr(surf_name, fort_vars[0], fort_vars[1], val[idx_sec], slicer=slicer)
 
         elif param in self.surf_geom_to_fort_var[surf_name].keys():
             # Set basic surface geometry variables
             fort_var = self.surf_geom_to_fort_var[surf_name][param]
-            self.set_avl_fort_arr(fort_var[0], fort_var[1], val, slicer=fort_var[2])
+            self.__set_surf_fort_arr(surf_name, fort_var[0], fort_var[1], val, slicer=fort_var[2])
 
         elif param in self.surf_pannel_to_fort_var[surf_name].keys():
             # Set surface panelling variables
             fort_var = self.surf_pannel_to_fort_var[surf_name][param]
-            self.set_avl_fort_arr(fort_var[0], fort_var[1], val, slicer=fort_var[2])
+            self.__set_surf_fort_arr(surf_name, fort_var[0], fort_var[1], val, slicer=fort_var[2])
         elif param in ["afiles", "airfoils", "naca", "xfminmax"]:
             # Cannot indirectly update the cross sections like this. Would over complicate this function when it can easily be handled by set_section_coordinates
             warnings.warn(
@@ -2528,7 +3472,17 @@ class OVLSolver(object):
             )
 
         if update_geom:
-            self.avl.update_surfaces()
+            self.avl.update_modified_surfaces()
+
+    def __set_surf_fort_arr(self, surf_name: str, common_block: str, variable: str, val: float, slicer=None) -> None:
+        # Set the data of a surface and flag the surface to be remade if the data changed.
+        # Only the flagged surfaces are remade by update_modified_surfaces
+        if np.array_equal(self.get_avl_fort_arr(common_block, variable, slicer=slicer), val):
+            return
+
+        self.set_avl_fort_arr(common_block, variable, val, slicer=slicer)
+        idx_surf = self.surface_names.index(surf_name)
+        self.avl.SURF_GEOM_L.LSURFMOD[idx_surf] = True
 
     def get_surface_params(
         self,
@@ -2638,6 +3592,8 @@ class OVLSolver(object):
         """Set the given data of the current geometry.
         ASSUMES THE CONTROL SURFACE DATA STAYS AT THE SAME LOCATION
         (i.e  you didn't move the control surfaces to new sections or surfaces. If so re-initialize OptVL)
+        Only the surfaces whose data changed are remade. Data changed with set_avl_fort_arr is not tracked,
+        so call `avl.update_surfaces()` to remake every surface after setting the Fortran data directly.
 
         Args:
             surf_data: Nested dictionary where the 1st key is the surface name and the 2nd key is the parameter.
@@ -2674,8 +3630,8 @@ class OVLSolver(object):
                 else:
                     pass
 
-        # update the geometry once at the end
-        self.avl.update_surfaces()
+        # update the geometry once at the end, only the surfaces that changed are remade
+        self.avl.update_modified_surfaces()
 
     def get_body_param(self, body_name: str, param: str) -> np.ndarray:
         """Get a parameter of a specified body
@@ -2751,7 +3707,7 @@ class OVLSolver(object):
 
         # Handle strings differently
         if isinstance(val, str):
-            operator.setitem(getattr(getattr(self.avl, fort_var[0]), fort_var[1]), idx_body, val)
+            self._fort_arrs[fort_var[0], fort_var[1]][idx_body] = val
         else:
             self.set_avl_fort_arr(fort_var[0], fort_var[1], val, slicer=slicer)
 
@@ -3709,15 +4665,17 @@ class OVLSolver(object):
             self.set_avl_fort_arr(blk, var, val, slicer=slicer)
 
     # --- derivative utils
+    def _check_ad_available(self):
+        if self.low_memory:
+            raise RuntimeError(
+                "The derivative routines need the stored velocity influence matrices and are not available "
+                "when the solver is created with `low_memory=True`"
+            )
+
     def clear_ad_seeds(self):
-        for att in dir(self.avl):
-            if att.endswith(self.ad_suffix):
-                # loop over the attributes of the common block
-                diff_blk = getattr(self.avl, att)
-                for _var in dir(diff_blk):
-                    if not (_var.startswith("__") and _var.endswith("__")):
-                        val = getattr(diff_blk, _var)
-                        setattr(diff_blk, _var, val * 0.0)
+        for (blk_name, _var), val in self._fort_arrs.items():
+            if blk_name.endswith(self.ad_suffix):
+                val[...] = 0.0
 
     def clear_ad_seeds_fast(self):
         # use the size information to clear only the part of data that are used
@@ -3751,59 +4709,48 @@ class OVLSolver(object):
         # import psutil
         # process = psutil.Process()
         # mem_before = process.memory_info().rss
-        for att in dir(self.avl):
-            if att.endswith(self.ad_suffix):
-                # loop over the attributes of the common block
-                diff_blk = getattr(self.avl, att)
-                for _var in dir(diff_blk):
-                    if not (_var.startswith("__") and _var.endswith("__")):
-                        val = getattr(diff_blk, _var)
-
-                        # trim sizes set to NVMAX to NVOR
-                        shape = val.shape
-                        slices = []
-                        for idx_dim in range(len(shape)):
-                            dim_size = shape[idx_dim]
-                            if dim_size == num_vor_max:
-                                dim_size = num_vor
-
-                            if dim_size == num_strips_max:
-                                dim_size = num_strips
-
-                            if dim_size == num_sec_max:
-                                dim_size = num_sec
-
-                            if dim_size == num_surfs_max:
-                                dim_size = num_surfs
-
-                            if dim_size == num_airfoil_pts_max:
-                                dim_size = num_airfoil_pts
-
-                            if dim_size == mesh_size_max:
-                                dim_size = mesh_size
-
-                            slices.append(slice(0, dim_size))
-                        slicer = tuple(slices)
-                        val[slicer] = 0.0
-
-                        # mem_now = process.memory_info().rss
-                        # del_mem = mem_now - mem_before
-                        # mem_before = mem_now
-                        # print(f'{att:10}:{_var:15}, {str(slicer):100} Memory usage: {del_mem/1024**2:.2f} MB')
+        for (blk_name, _var), val in self._fort_arrs.items():
+            if blk_name.endswith(self.ad_suffix):
+                # trim sizes set to NVMAX to NVOR
+                shape = val.shape
+                slices = []
+                for idx_dim in range(len(shape)):
+                    dim_size = shape[idx_dim]
+                    if dim_size == num_vor_max:
+                        dim_size = num_vor
+
+                    if dim_size == num_strips_max:
+                        dim_size = num_strips
+
+                    if dim_size == num_sec_max:
+                        dim_size = num_sec
+
+                    if dim_size == num_surfs_max:
+                        dim_size = num_surfs
+
+                    if dim_size == num_airfoil_pts_max:
+                        dim_size = num_airfoil_pts
+
+                    if dim_size == mesh_size_max:
+                        dim_size = mesh_size
+
+                    slices.append(slice(0, dim_size))
+                slicer = tuple(slices)
+                val[slicer] = 0.0
+
+                # mem_now = process.memory_info().rss
+                # del_mem = mem_now - mem_before
+                # mem_before = mem_now
+                # print(f'{blk_name:10}:{_var:15}, {str(slicer):100} Memory usage: {del_mem/1024**2:.2f} MB')
 
     def print_ad_seeds(self, print_non_zero: bool = False):
-        for att in dir(self.avl):
-            if att.endswith(self.ad_suffix):
-                # loop over the attributes of the common block
-                diff_blk = getattr(self.avl, att)
-                for _var in dir(diff_blk):
-                    if not (_var.startswith("__") and _var.endswith("__")):
-                        val = getattr(diff_blk, _var)
-                        norm = np.linalg.norm(val)
-                        if norm == 0.0 and print_non_zero:
-                            continue
+        for (blk_name, _var), val in self._fort_arrs.items():
+            if blk_name.endswith(self.ad_suffix):
+                norm = np.linalg.norm(val)
+                if norm == 0.0 and print_non_zero:
+                    continue
 
-                        print(att, _var, norm)
+                print(blk_name, _var, norm)
 
     # --- jacobian vecotr products ---
     def _execute_jac_vec_prod_fwd(
@@ -3878,6 +4825,8 @@ class OVLSolver(object):
         res_u_slice = (slice(0, self.NUMAX), slice(0, mesh_size))
 
         if mode == "AD":
+            self._check_ad_available()
+
             # set derivative seeds
             # self.clear_ad_seeds()
             self.set_variable_ad_seeds(con_seeds)
@@ -4038,6 +4987,8 @@ class OVLSolver(object):
             param_seeds: Case parameter AD seeds
             ref_seeds: Reference condition AD seeds
         """
+        self._check_ad_available()
+
         # extract derivatives seeds and set the output dict of functions
 
         if print_timings:
@@ -4129,12 +5080,258 @@ class OVLSolver(object):
 
         return con_seeds, geom_seeds, mesh_seeds, gamma_seeds, gamma_d_seeds, gamma_u_seeds, param_seeds, ref_seeds
 
+    def _execute_adjoint_rhs_rev(
+        self,
+        func_seeds: Optional[Dict[str, float]] = None,
+        consurf_derivs_seeds: Optional[Dict[str, float]] = None,
+        stab_derivs_seeds: Optional[Dict[str, float]] = None,
+        body_axis_derivs_seeds: Optional[Dict[str, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the partial derivatives of the outputs with respect to the circulations (the RHS of the adjoint equations).
+
+        Only the part of the reverse sweep that reaches the circulations (aero_b and velsum_b) is run.
+        The rest of the sweep would only propagate these seeds to the inputs, so the partially
+        propagated seeds are cleared instead.
+
+        Args:
+            func_seeds: force coefficient AD seeds
+            consurf_derivs_seeds: Control surface derivatives AD seeds
+            stab_derivs_seeds: Stability derivatives AD seeds
+            body_axis_derivs_seeds: body axis derivatives AD seeds
+
+        Returns:
+            gamma_seeds: Circulation AD seeds
+            gamma_d_seeds: dCirculation/d(Controls Deflection) AD seeds
+            gamma_u_seeds:  dCirculation/d(flight condition) AD seeds
+        """
+        self._check_ad_available()
+
+        self.set_function_ad_seeds(func_seeds or {})
+        self.set_consurf_derivs_ad_seeds(consurf_derivs_seeds or {})
+        self.set_stab_derivs_ad_seeds(stab_derivs_seeds or {})
+        self.set_body_axis_derivs_ad_seeds(body_axis_derivs_seeds or {})
+
+        self.avl.aero_b()
+        self.avl.velsum_b()
+
+        gamma_seeds = self.get_gamma_ad_seeds()
+        gamma_d_seeds = self.get_gamma_d_ad_seeds()
+        gamma_u_seeds = self.get_gamma_u_ad_seeds()
+
+        self.clear_ad_seeds_fast()
+
+        return gamma_seeds, gamma_d_seeds, gamma_u_seeds
+
+    def _get_eig_func_key(self, idx_eig: int, part: str) -> str:
+        return f"eig {idx_eig} {part}"
+
+    def _get_system_matrix_partials(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Get the partial derivatives of the system matrix A (see `get_system_matrices`) with the aerodynamic derivatives
+        held fixed. A is linear in the body axis derivatives, so their partials are exact differences. The partials with
+        respect to the flight condition, the parameters, and the reference values are central differences, which only
+        cost a few calls of SYSMAT each.
+
+        Returns:
+            mat_partials: partials of A by kind of variable ("body_axis_derivs", "con", "param", "ref") and variable
+        """
+        saved = {
+            (blk, var): np.array(self.get_avl_fort_arr(blk, var))
+            for blk, var in [
+                ("CASE_R", "CFTOT_U"),
+                ("CASE_R", "CMTOT_U"),
+                ("CASE_R", "VINF"),
+                ("CASE_R", "WROT"),
+                ("CASE_R", "PARVAL"),
+                ("CASE_R", "SREF"),
+                ("CASE_R", "CREF"),
+                ("CASE_R", "BREF"),
+            ]
+        }
+
+        def restore():
+            for (blk, var), val in saved.items():
+                self.set_avl_fort_arr(blk, var, val)
+
+        def get_mat():
+            return self.get_system_matrices()[0]
+
+        def central_diff(set_val, val, rel_step=1e-6):
+            step = rel_step * max(1.0, abs(val))
+            set_val(val + step)
+            mat_p = get_mat()
+            set_val(val - step)
+            mat_m = get_mat()
+            restore()
+            return (mat_p - mat_m) / (2 * step)
+
+        mat_partials = {"body_axis_derivs": {}, "con": {}, "param": {}, "ref": {}}
+        mat = get_mat()
+
+        bref = saved["CASE_R", "BREF"]
+        cref = saved["CASE_R", "CREF"]
+        dir_sign = -1.0 if self.get_avl_fort_arr("CASE_L", "LNASA_SA") else 1.0
+
+        # the body axis derivatives are scaled copies of the AVL axes derivatives CFTOT_U and CMTOT_U that SYSMAT uses
+        for idx_func, func in enumerate(["CX", "CY", "CZ", "Cl", "Cm", "Cn"]):
+            fort_var = "CFTOT_U" if idx_func < 3 else "CMTOT_U"
+            idx_axis = idx_func % 3
+            for idx_var, var in enumerate(["u", "v", "w", "p", "q", "r"]):
+                if idx_var < 3:
+                    scale = -1.0
+                else:
+                    scale = 2.0 / (cref if idx_var == 4 else bref)
+                if (idx_axis + idx_var % 3) % 2 == 1:
+                    scale *= dir_sign
+
+                fort_val = np.array(saved["CASE_R", fort_var])
+                fort_val[idx_var, idx_axis] += 1.0
+                self.set_avl_fort_arr("CASE_R", fort_var, fort_val)
+                mat_partials["body_axis_derivs"][self._get_deriv_key(var, func)] = (get_mat() - mat) / scale
+                restore()
+
+        # the free stream and the rotation rates follow from the flight condition like in set_par_and_cons
+        alfa = self.get_avl_fort_arr("CASE_R", "ALFA")
+        beta = self.get_avl_fort_arr("CASE_R", "BETA")
+        dtr = np.pi / 180.0
+
+        def set_vinf(alfa, beta):
+            vinf = np.array([np.cos(alfa) * np.cos(beta), -np.sin(beta), np.sin(alfa) * np.cos(beta)])
+            self.set_avl_fort_arr("CASE_R", "VINF", vinf)
+
+        mat_partials["con"]["alpha"] = central_diff(lambda val: set_vinf(val * dtr, beta), alfa / dtr)
+        mat_partials["con"]["beta"] = central_diff(lambda val: set_vinf(alfa, val * dtr), beta / dtr)
+
+        wrot = saved["CASE_R", "WROT"]
+        for idx_rot, (con_key, ref_len) in enumerate([("roll rate", bref), ("pitch rate", cref), ("yaw rate", bref)]):
+
+            def set_rate(val):
+                wrot_new = np.array(wrot)
+                wrot_new[idx_rot] = val * 2.0 / ref_len
+                self.set_avl_fort_arr("CASE_R", "WROT", wrot_new)
+
+            mat_partials["con"][con_key] = central_diff(set_rate, wrot[idx_rot] * ref_len / 2.0)
+
+        # parameters that SYSMAT reads
+        parvals = saved["CASE_R", "PARVAL"]
+        for param_key in [
+            "bank",
+            "elevation",
+            "heading",
+            "velocity",
+            "density",
+            "grav.acc.",
+            "mass",
+            "Ixx",
+            "Iyy",
+            "Izz",
+            "Ixy",
+            "Iyz",
+            "Izx",
+            "visc CL_a",
+            "visc CL_u",
+            "visc Cm_a",
+            "visc Cm_u",
+        ]:
+            idx_param = self.param_idx_dict[param_key]
+
+            def set_param(val):
+                parvals_new = np.array(parvals)
+                parvals_new[0, idx_param] = val
+                self.set_avl_fort_arr("CASE_R", "PARVAL", parvals_new)
+
+            mat_partials["param"][param_key] = central_diff(set_param, parvals[0, idx_param])
+
+        # with the body axis derivatives and the rates held fixed, the AVL axes derivatives of
+        # the rates and the rotation scale with the reference lengths
+        for ref_key, idx_rates in [("Sref", []), ("Cref", [1]), ("Bref", [0, 2])]:
+
+            def set_ref(val):
+                ref_val = saved[self.ref_var_to_fort_var[ref_key][0], self.ref_var_to_fort_var[ref_key][1]]
+                self.set_avl_fort_arr(*self.ref_var_to_fort_var[ref_key], val)
+                for fort_var in ["CFTOT_U", "CMTOT_U"]:
+                    fort_val = np.array(saved["CASE_R", fort_var])
+                    for idx_rot in idx_rates:
+                        fort_val[3 + idx_rot] *= val / ref_val
+                    self.set_avl_fort_arr("CASE_R", fort_var, fort_val)
+                wrot_new = np.array(wrot)
+                for idx_rot in idx_rates:
+                    wrot_new[idx_rot] = wrot[idx_rot] * ref_val / val
+                self.set_avl_fort_arr("CASE_R", "WROT", wrot_new)
+
+            mat_partials["ref"][ref_key] = central_diff(set_ref, saved["CASE_R", self.ref_var_to_fort_var[ref_key][1]])
+
+        return mat_partials
+
+    def _get_eig_partials(self, eig_funcs: List[int]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Get the partial derivatives of the real and imaginary parts of eigenvalues with the aerodynamic derivatives held
+        fixed, from the left and right eigenvectors of the system matrix: d(lambda) = w^T dA v / (w^T v)
+
+        The eigenvectors are found by matching the eigenvalues of AVL to the eigenvalues of the system matrix, so a
+        ValueError is raised for an eigenvalue that is (nearly) repeated. Its eigenvectors, and its derivative, are not unique.
+
+        Args:
+            eig_funcs: indices of the eigenvalues of the last modal analysis (see `get_eigenvalues`)
+
+        Returns:
+            eig_partials: partials of each eigenvalue part by kind of variable (see `_get_system_matrix_partials`) and variable
+        """
+        eig_vals = self.get_eigenvalues()
+        mat = self.get_system_matrices()[0]
+        vals_r, vecs_r = np.linalg.eig(mat)
+        vals_l, vecs_l = np.linalg.eig(mat.T)
+        mat_partials = self._get_system_matrix_partials()
+
+        eig_partials = {}
+        for idx_eig in eig_funcs:
+            if idx_eig >= eig_vals.size:
+                raise ValueError(f"eigenvalue {idx_eig} not found, the last modal analysis has {eig_vals.size} eigenvalues")
+
+            val = eig_vals[idx_eig]
+            vec_r = vecs_r[:, self._match_eigenvalue(vals_r, val, idx_eig)]
+            vec_l = vecs_l[:, self._match_eigenvalue(vals_l, val, idx_eig)]
+            vec_l = vec_l / (vec_l @ vec_r)
+
+            partials = {
+                kind: {key: vec_l @ mat_partial @ vec_r for key, mat_partial in partials_kind.items()}
+                for kind, partials_kind in mat_partials.items()
+            }
+            for part, get_part in [("real", np.real), ("imag", np.imag)]:
+                eig_partials[self._get_eig_func_key(idx_eig, part)] = {
+                    kind: {key: get_part(val) for key, val in partials_kind.items()}
+                    for kind, partials_kind in partials.items()
+                }
+
+        return eig_partials
+
+    @staticmethod
+    def _match_eigenvalue(vals: np.ndarray, val: complex, idx_eig: int, rtol: float = 1e-6) -> int:
+        """Find the index of the eigenvalue in vals that matches val, which must not be repeated
+
+        Args:
+            vals: all the eigenvalues of the system matrix
+            val: eigenvalue to find
+            idx_eig: index of the eigenvalue of the modal analysis, used in the error message
+            rtol: eigenvalues closer than rtol times the largest eigenvalue magnitude are taken as repeated
+
+        Returns:
+            idx: index of the matching eigenvalue in vals
+        """
+        dist = np.abs(vals - val)
+        idx, idx_next = np.argsort(dist)[:2]
+        if dist[idx_next] <= rtol * max(1.0, np.max(np.abs(vals))):
+            raise ValueError(
+                f"eigenvalue {idx_eig} ({val}) is repeated, so the derivatives of its real and imaginary parts are not defined"
+            )
+
+        return idx
+
     def execute_run_sensitivities(
         self,
         funcs: List[str],
         stab_derivs: Optional[List[str]] = None,
         body_axis_derivs: Optional[List[str]] = None,
         consurf_derivs: Optional[List[str]] = None,
+        eig_funcs: Optional[List[int]] = None,
         print_timings: Optional[bool] = False,
     ) -> Dict[str, Dict[str, float]]:
         """Run the sensitivities of the input functionals in adjoint mode
@@ -4144,6 +5341,11 @@ class OVLSolver(object):
             stab_derivs: stability derivatives to compute the sensitivities with respect to
             body_axis_derivs: body axis derivatives to compute the sensitivities with respect to
             consurf_derivs: control surface derivates to compute the sensitivities with respect to
+            eig_funcs: indices of the eigenvalues of the last modal analysis (see `get_eigenvalues`) to compute the
+                sensitivities of the real and imaginary parts of, which are keyed as "eig <index> real" and "eig <index> imag".
+                Only the terms through the aerodynamic derivatives use AD. The partials of the system matrix by the flight
+                condition, the parameters (e.g. mass and inertia), and the reference values are central finite differences of
+                SYSMAT with a relative step of 1e-6. A repeated eigenvalue raises a ValueError
             print_timings: flag to print timing information
 
         Returns:
@@ -4154,182 +5356,86 @@ class OVLSolver(object):
         if self.get_avl_fort_arr("CASE_L", "LTIMING"):
             print_timings = True
 
-        # set up and solve the adjoint for each function
-        for func in funcs:
-            sens[func] = {}
-            # get the RHS of the adjoint equation (pFpU)
-            # TODO: remove seeds if it doesn't effect accuracy
-            # self.clear_ad_seeds()
-            time_last = time.time()
-            _, _, _, pfpU, _, _, _, _ = self._execute_jac_vec_prod_rev(func_seeds={func: 1.0})
-            if print_timings:
-                print(f"Time to get RHS: {time.time() - time_last}")
-                time_last = time.time()
+        # collect every function of interest with the keyword and the values used to seed it
+        adj_funcs = [(func, "func_seeds", {func: 1.0}) for func in funcs]
+        for func_keys, seed_kw in [
+            (consurf_derivs, "consurf_derivs_seeds"),
+            (stab_derivs, "stab_derivs_seeds"),
+            (body_axis_derivs, "body_axis_derivs_seeds"),
+        ]:
+            if func_keys is not None:
+                adj_funcs += [(func_key, seed_kw, {func_key: 1.0}) for func_key in func_keys]
+
+        # the eigenvalues depend on the aerodynamics through the body axis derivatives
+        eig_partials = {}
+        if eig_funcs is not None:
+            eig_partials = self._get_eig_partials(eig_funcs)
+            for func_key, partials in eig_partials.items():
+                adj_funcs.append((func_key, "body_axis_derivs_seeds", partials["body_axis_derivs"]))
+
+        # get the RHS of the adjoint equation (pFpU) for every function.
+        # Each function needs a column for gamma, and the control surface and stability
+        # derivatives need extra columns for gamma_d and gamma_u respectively
+        time_last = time.perf_counter()
+        rhs_cols = []
+        idx_cols = []
+        for func_key, seed_kw, seeds in adj_funcs:
+            pfpU, pf_pU_d, pf_pU_u = self._execute_adjoint_rhs_rev(**{seed_kw: seeds})
+            idx_cols.append(len(rhs_cols))
+            rhs_cols.append(pfpU)
+            if seed_kw == "consurf_derivs_seeds":
+                rhs_cols.extend(pf_pU_d)
+            elif seed_kw in ["stab_derivs_seeds", "body_axis_derivs_seeds"]:
+                rhs_cols.extend(pf_pU_u)
+        time_now = self._add_timing("sens_rhs", time_last)
+        if print_timings:
+            print(f"Time to get RHS: {time_now - time_last}")
+        time_last = time_now
+
+        if len(rhs_cols) == 0:
+            return sens
+
+        # solve the adjoint equations for all the functions at once
+        rhs = np.asfortranarray(-1 * np.array(rhs_cols).T)
+        adj = self.avl.solve_adjoint_mrhs(rhs)
+        self._check_linear_solves("adjoint")
+        time_now = self._add_timing("sens_adjoint", time_last)
+        if print_timings:
+            print(f"Time to solve adjoint: {time_now - time_last}")
+        time_last = time_now
+
+        num_controls = self.get_num_control_surfs()
+        for (func_key, seed_kw, seeds), idx_col in zip(adj_funcs, idx_cols):
+            if func_key not in sens:
+                sens[func_key] = {}
+
+            # the resulting adjoint vectors (dfunc/dRes)
+            res_seeds = {"res_seeds": adj[:, idx_col]}
+            if seed_kw == "consurf_derivs_seeds":
+                res_seeds["res_d_seeds"] = adj[:, idx_col + 1 : idx_col + 1 + num_controls].T
+            elif seed_kw in ["stab_derivs_seeds", "body_axis_derivs_seeds"]:
+                res_seeds["res_u_seeds"] = adj[:, idx_col + 1 : idx_col + 1 + self.NUMAX].T
 
-            # self.clear_ad_seeds()
-            # u solver adjoint equation with RHS
-            self.set_gamma_ad_seeds(-1 * pfpU)
-            solve_gamma_u_adj = False
-            solve_gamma_d_adj = False
-            self.avl.solve_adjoint(solve_gamma_u_adj, solve_gamma_d_adj)
-            if print_timings:
-                print(f"Time to solve adjoint: {time.time() - time_last}")
-                time_last = time.time()
-            # get the resulting adjoint vector (dfunc/dRes) from fortran
-            dfdR = self.get_residual_ad_seeds()
-            # self.clear_ad_seeds()
             con_seeds, geom_seeds, mesh_seeds, _, _, _, param_seeds, ref_seeds = self._execute_jac_vec_prod_rev(
-                func_seeds={func: 1.0}, res_seeds=dfdR
+                **{seed_kw: seeds}, **res_seeds
             )
-            if print_timings:
-                print(f"Time to combine derivs: {time.time() - time_last}")
-                time_last = time.time()
 
-            sens[func].update(con_seeds)
+            # add the dependence of the eigenvalues that does not go through the aerodynamics
+            if func_key in eig_partials:
+                for kind, kind_seeds in [("con", con_seeds), ("param", param_seeds), ("ref", ref_seeds)]:
+                    for key, val in eig_partials[func_key][kind].items():
+                        kind_seeds[key] = kind_seeds.get(key, 0.0) + val
+
+            sens[func_key].update(con_seeds)
             # I don't know if it's worth combining geom_seeds and mesh_seeds into one just to make this one part less nasty
             for key in geom_seeds:
-                sens[func][key] = geom_seeds[key] | mesh_seeds[key]
-            # sens[func].update(geom_seeds)
-            # sens[func].update(mesh_seeds)
-            sens[func].update(param_seeds)
-            sens[func].update(ref_seeds)
-
-        if consurf_derivs is not None:
-            if print_timings:
-                print("Running consurf derivs")
-                time_last = time.time()
-
-            for func_key in consurf_derivs:
-                if func_key not in sens:
-                    sens[func_key] = {}
-
-                # get the RHS of the adjoint equation (pFpU)
-                # TODO: remove seeds if it doesn't effect accuracy
-                _, _, _, pfpU, pf_pU_d, _, _, _ = self._execute_jac_vec_prod_rev(consurf_derivs_seeds={func_key: 1.0})
-                if print_timings:
-                    print(f"Time to get RHS: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # self.clear_ad_seeds()
-                # u solver adjoint equation with RHS
-                self.set_gamma_ad_seeds(-1 * pfpU)
-                self.set_gamma_d_ad_seeds(-1 * pf_pU_d)
-                solve_gamma_u_adj = False
-                solve_gamma_d_adj = True
-                self.avl.solve_adjoint(solve_gamma_u_adj, solve_gamma_d_adj)
-                if print_timings:
-                    print(f"Time to solve adjoint: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # get the resulting adjoint vector (dfunc/dRes) from fortran
-                dfdR = self.get_residual_ad_seeds()
-                dfdR_d = self.get_residual_d_ad_seeds()
-                # self.clear_ad_seeds()
-                con_seeds, geom_seeds, mesh_seeds, _, _, _, param_seeds, ref_seeds = self._execute_jac_vec_prod_rev(
-                    consurf_derivs_seeds={func_key: 1.0}, res_seeds=dfdR, res_d_seeds=dfdR_d
-                )
-                if print_timings:
-                    print(f"Time to combine : {time.time() - time_last}")
-                    time_last = time.time()
-
-                sens[func_key].update(con_seeds)
-                for key in geom_seeds:
-                    sens[func_key][key] = geom_seeds[key] | mesh_seeds[key]
-                # sens[func_key].update(geom_seeds)
-                # sens[func_key].update(mesh_seeds)
-                sens[func_key].update(param_seeds)
-                sens[func_key].update(ref_seeds)
-
-        if stab_derivs is not None:
-            if print_timings:
-                print("Running stab derivs")
-                time_last = time.time()
-
-            for func_key in stab_derivs:
-                if func_key not in sens:
-                    sens[func_key] = {}
-
-                # get the RHS of the adjoint equation (pFpU)
-                # TODO: remove seeds if it doesn't effect accuracy
-                _, _, _, pfpU, _, pf_pU_u, _, _ = self._execute_jac_vec_prod_rev(stab_derivs_seeds={func_key: 1.0})
-                if print_timings:
-                    print(f"Time to get RHS: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # self.clear_ad_seeds()
-                # u solver adjoint equation with RHS
-                self.set_gamma_ad_seeds(-1 * pfpU)
-                self.set_gamma_u_ad_seeds(-1 * pf_pU_u)
-                solve_gamma_u_adj = True
-                solve_gamma_d_adj = False
-                self.avl.solve_adjoint(solve_gamma_u_adj, solve_gamma_d_adj)
-                if print_timings:
-                    print(f"Time to solve adjoint: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # get the resulting adjoint vector (dfunc/dRes) from fortran
-                dfdR = self.get_residual_ad_seeds()
-                dfdR_u = self.get_residual_u_ad_seeds()
-                # self.clear_ad_seeds()
-                con_seeds, geom_seeds, mesh_seeds, _, _, _, param_seeds, ref_seeds = self._execute_jac_vec_prod_rev(
-                    stab_derivs_seeds={func_key: 1.0}, res_seeds=dfdR, res_u_seeds=dfdR_u
-                )
-
-                if print_timings:
-                    print(f"Time to combine : {time.time() - time_last}")
-                    time_last = time.time()
-
-                sens[func_key].update(con_seeds)
-                for surf_key in geom_seeds:
-                    sens[func_key][surf_key] = geom_seeds[surf_key] | mesh_seeds[surf_key]
-                sens[func_key].update(param_seeds)
-                sens[func_key].update(ref_seeds)
-                # sd_deriv_seeds[func_key] = 0.0
-
-        if body_axis_derivs is not None:
-            if print_timings:
-                print("Running stab derivs")
-                time_last = time.time()
-
-            for func_key in body_axis_derivs:
-                if func_key not in sens:
-                    sens[func_key] = {}
-
-                # get the RHS of the adjoint equation (pFpU)
-                # TODO: remove seeds if it doesn't effect accuracy
-                _, _, _, pfpU, _, pf_pU_u, _, _ = self._execute_jac_vec_prod_rev(body_axis_derivs_seeds={func_key: 1.0})
-                if print_timings:
-                    print(f"Time to get RHS: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # self.clear_ad_seeds()
-                # u solver adjoint equation with RHS
-                self.set_gamma_ad_seeds(-1 * pfpU)
-                self.set_gamma_u_ad_seeds(-1 * pf_pU_u)
-                solve_gamma_u_adj = True
-                solve_gamma_d_adj = False
-                self.avl.solve_adjoint(solve_gamma_u_adj, solve_gamma_d_adj)
-                if print_timings:
-                    print(f"Time to solve adjoint: {time.time() - time_last}")
-                    time_last = time.time()
-
-                # get the resulting adjoint vector (dfunc/dRes) from fortran
-                dfdR = self.get_residual_ad_seeds()
-                dfdR_u = self.get_residual_u_ad_seeds()
-                # self.clear_ad_seeds()
-                con_seeds, geom_seeds, mesh_seeds, _, _, _, param_seeds, ref_seeds = self._execute_jac_vec_prod_rev(
-                    body_axis_derivs_seeds={func_key: 1.0}, res_seeds=dfdR, res_u_seeds=dfdR_u
-                )
+                sens[func_key][key] = geom_seeds[key] | mesh_seeds[key]
+            sens[func_key].update(param_seeds)
+            sens[func_key].update(ref_seeds)
 
-                if print_timings:
-                    print(f"Time to combine : {time.time() - time_last}")
-                    time_last = time.time()
-
-                sens[func_key].update(con_seeds)
-                for surf_key in geom_seeds:
-                    sens[func_key][surf_key] = geom_seeds[surf_key] | mesh_seeds[surf_key]
-                sens[func_key].update(param_seeds)
-                sens[func_key].update(ref_seeds)
+        time_now = self._add_timing("sens_combine", time_last)
+        if print_timings:
+            print(f"Time to combine derivs: {time_now - time_last}")
 
         return sens
 
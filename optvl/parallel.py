@@ -0,0 +1,227 @@
+"""
+Run sweeps over a table of cases on a pool of workers.
+
+Every worker loads its own OVLSolver once (MExt gives each one an isolated
+copy of the Fortran library) and then runs the shards of the case table that
+are sent to it with `OVLSolver.execute_run_batch`. The workers are processes
+by default, but they can also be threads because the Fortran kernels release
+the GIL.
+"""
+
+# =============================================================================
+# Standard Python modules
+# =============================================================================
+import multiprocessing
+import multiprocessing.pool
+import os
+import threading
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+
+# =============================================================================
+# External Python modules
+# =============================================================================
+import numpy as np
+
+# =============================================================================
+# Extension modules
+# =============================================================================
+from .optvl_class import OVLSolver
+
+# the solver of this worker, created once by the pool initializer
+_worker = threading.local()
+
+
+def _init_worker(solver_kwargs: Dict[str, Any], parameters: Dict[str, float]):
+    _worker.ovl = OVLSolver(**solver_kwargs)
+    for param_key, param_val in parameters.items():
+        _worker.ovl.set_parameter(param_key, param_val)
+
+
+def _run_shard(shard: Tuple[np.ndarray, Any, Dict[str, np.ndarray], Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    idx_cases, conditions, case_params, run_kwargs = shard
+    ovl = _worker.ovl
+
+    if not case_params:
+        return idx_cases, ovl.execute_run_batch(conditions, **run_kwargs)
+
+    # the parameters are restored after the shard, even if a case fails, so later shards on this worker are not affected
+    base_params = {param_key: ovl.get_parameter(param_key) for param_key in case_params}
+
+    # run each group of consecutive cases that share the same parameters as one batch
+    param_table = np.column_stack([case_params[key] for key in case_params])
+    idx_breaks = np.flatnonzero(np.any(param_table[1:] != param_table[:-1], axis=1)) + 1
+    batches = []
+    try:
+        for idx_group in np.split(np.arange(idx_cases.size), idx_breaks):
+            for param_key, param_vals in case_params.items():
+                ovl.set_parameter(param_key, param_vals[idx_group[0]])
+            batches.append(ovl.execute_run_batch(_slice_conditions(conditions, idx_group), **run_kwargs))
+    finally:
+        for param_key, param_val in base_params.items():
+            ovl.set_parameter(param_key, param_val)
+
+    return idx_cases, np.concatenate(batches)
+
+
+def _slice_conditions(conditions: Union[Dict[str, Any], np.ndarray], idx: np.ndarray) -> Union[Dict[str, Any], np.ndarray]:
+    if isinstance(conditions, np.ndarray):
+        return conditions[idx]
+
+    sliced = {}
+    for var, spec in conditions.items():
+        if isinstance(spec, tuple):
+            sliced[var] = (spec[0], np.atleast_1d(np.asarray(spec[1], dtype=float))[idx])
+        else:
+            sliced[var] = np.atleast_1d(np.asarray(spec, dtype=float))[idx]
+    return sliced
+
+
+def _num_cases(conditions: Union[Dict[str, Any], np.ndarray]) -> int:
+    if isinstance(conditions, np.ndarray):
+        return conditions.size
+
+    for spec in conditions.values():
+        vals = spec[1] if isinstance(spec, tuple) else spec
+        return np.atleast_1d(np.asarray(vals)).size
+
+    raise ValueError("at least one condition must be given")
+
+
+class SweepExecutor:
+    """Pool of workers, each with its own OVLSolver, that runs a table of cases in parallel.
+
+    The workers are processes started with the "spawn" method by default, so scripts that use
+    this class must create it under an `if __name__ == "__main__":` guard. With `start_method="thread"`
+    the workers are threads of this process instead, which avoids the startup cost of the processes.
+
+    Example:
+        ```python
+        with SweepExecutor(geo_file="aircraft.avl", num_workers=4) as executor:
+            data = executor.run({"alpha": np.linspace(0, 10, 100), "Elevator": ("Cm", np.zeros(100))})
+        ```
+    """
+
+    def __init__(
+        self,
+        geo_file: Optional[str] = None,
+        mass_file: Optional[str] = None,
+        input_dict: Optional[dict] = None,
+        num_workers: Optional[int] = None,
+        parameters: Optional[Dict[str, float]] = None,
+        start_method: str = "spawn",
+        low_memory: bool = False,
+        linear_solver: str = "direct",
+    ):
+        """Start the workers and load the geometry in each of them
+
+        Args:
+            geo_file: AVL geometry file
+            mass_file: AVL mass file
+            input_dict: input dictionary used instead of a geometry file
+            num_workers: number of workers. Defaults to the number of cores
+            parameters: parameters (e.g. "Mach", "CD0") set on every worker before any case is run
+            start_method: multiprocessing start method used for the worker processes, or "thread" to use threads
+            low_memory: create the solvers of the workers with `low_memory=True` (see `OVLSolver`)
+            linear_solver: linear solver of the workers, "direct" or "gmres" (see `OVLSolver.set_linear_solver`)
+        """
+        if geo_file is None and input_dict is None:
+            raise ValueError("either `geo_file` or `input_dict` must be given")
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self.num_workers = num_workers
+
+        solver_kwargs = {
+            "geo_file": geo_file,
+            "mass_file": mass_file,
+            "input_dict": input_dict,
+            "low_memory": low_memory,
+            "linear_solver": linear_solver,
+        }
+        if parameters is None:
+            parameters = {}
+
+        if start_method == "thread":
+            self._pool = multiprocessing.pool.ThreadPool(
+                num_workers, initializer=_init_worker, initargs=(solver_kwargs, parameters)
+            )
+        else:
+            ctx = multiprocessing.get_context(start_method)
+            self._pool = ctx.Pool(num_workers, initializer=_init_worker, initargs=(solver_kwargs, parameters))
+
+    def imap(
+        self,
+        conditions: Union[Dict[str, Any], np.ndarray],
+        parameters: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        **run_kwargs,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Split the cases into shards, run them on the workers and yield each shard as soon as it is done.
+
+        Args:
+            conditions: the operating points in the format of `OVLSolver.execute_run_batch`
+            parameters: parameters to set for each case, as a dictionary of parameter keys and arrays of values.
+                Consecutive cases with the same values are run as one batch on a worker
+            chunk_size: number of consecutive cases in each shard. Defaults to an even split over the workers
+            run_kwargs: keyword arguments passed on to `OVLSolver.execute_run_batch`
+
+        Returns:
+            shards: iterator of `(case indices, batch data)` pairs in the order they finish
+        """
+        num_cases = _num_cases(conditions)
+
+        if parameters is None:
+            parameters = {}
+        parameters = {key: np.atleast_1d(np.asarray(vals, dtype=float)) for key, vals in parameters.items()}
+        for key, vals in parameters.items():
+            if vals.size != num_cases:
+                raise ValueError(f"parameter `{key}` has {vals.size} values instead of one for each of the {num_cases} cases")
+
+        if chunk_size is None:
+            chunk_size = int(np.ceil(num_cases / self.num_workers))
+        chunk_size = max(chunk_size, 1)
+
+        shards = []
+        for idx_start in range(0, num_cases, chunk_size):
+            idx_cases = np.arange(idx_start, min(idx_start + chunk_size, num_cases))
+            case_params = {key: vals[idx_cases] for key, vals in parameters.items()}
+            shards.append((idx_cases, _slice_conditions(conditions, idx_cases), case_params, run_kwargs))
+
+        return self._pool.imap_unordered(_run_shard, shards)
+
+    def run(
+        self,
+        conditions: Union[Dict[str, Any], np.ndarray],
+        parameters: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        **run_kwargs,
+    ) -> np.ndarray:
+        """Run all the cases on the workers and gather the results in the order of the cases.
+
+        Args:
+            conditions: the operating points in the format of `OVLSolver.execute_run_batch`
+            parameters: parameters to set for each case, as a dictionary of parameter keys and arrays of values
+            chunk_size: number of consecutive cases in each shard. Defaults to an even split over the workers
+            run_kwargs: keyword arguments passed on to `OVLSolver.execute_run_batch`
+
+        Returns:
+            batch_data: structured array with one entry per case (see `OVLSolver.execute_run_batch`)
+        """
+        batch_data = None
+        for idx_cases, shard_data in self.imap(conditions, parameters=parameters, chunk_size=chunk_size, **run_kwargs):
+            if batch_data is None:
+                batch_data = np.zeros(_num_cases(conditions), dtype=shard_data.dtype)
+            batch_data[idx_cases] = shard_data
+
+        return batch_data
+
+    def close(self):
+        """Stop the workers"""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
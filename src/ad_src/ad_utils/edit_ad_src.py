@@ -120,6 +120,12 @@ if __name__ == "__main__":
             
             }
         }
+        ad_inserted_lines = {
+            'aoper_d.f': {
+            # BUILD_AIC_D writes the AIC, which may be shared with other processes
+            'CALL BUILD_AIC_D()': '      CALL AVLHEAP_UNSHARE()\n',
+            },
+        }
 
         
         # modify the AD'd source
@@ -153,6 +159,14 @@ if __name__ == "__main__":
                                 if bad_line in line:
                                     line = f'c     {line[:-1]} {comment_dict[bad_line]}\n'
                                     break
+
+                        # check for lines to insert before this one
+                        if src_name in ad_inserted_lines:
+                            insert_dict = ad_inserted_lines[src_name]
+                            for next_line in insert_dict:
+                                if next_line in line:
+                                    fid_mod.write(insert_dict[next_line])
+                                    break
                                 
                         if tapenade_include in line:
                             # check to see if the next line is the fake include
@@ -636,6 +636,7 @@ C IF(.NOT.LAIC) THEN
 C      CALL build_AIC
 C end if
 C---  
+      CALL AVLHEAP_UNSHARE()
       CALL BUILD_AIC_D()
       amach_diff = mach_diff
       amach = mach
@@ -72,6 +72,65 @@ C--------------------------------------------------------------------
      &     WC_GAM(3,NCDIM,NCDIM)
       INTEGER NCOMPV(NV), NCOMPC(NC)
       LOGICAL LVTEST
+C     
+      LOGICAL LCOMP
+C     
+C...  The core size depends on the component of the field point only
+C     when the field points are the elements' own control points
+      LCOMP = NC .EQ. NV
+C     
+C...  Loop over all the control points, the influence of all the
+C     vortex elements on each of them is computed by VVOR_ROW
+C$AD II-LOOP
+      DO 200 I = 1, NC
+         CALL VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &        VRCOREC,VRCOREW,
+     &        NV,RV1,RV2,NCOMPV,CHORDV,
+     &        I,RC(1,I),NCOMPC(I),LCOMP,LVTEST,
+     &        WC_GAM(1,I,1),NCDIM)
+ 200  CONTINUE
+C     
+      RETURN
+      END ! VVOR
+
+
+
+      SUBROUTINE VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &     VRCOREC,VRCOREW,
+     &     NV,RV1,RV2,NCOMPV,CHORDV,
+     &     I,RCI,NCOMPI,LCOMP,LVTEST,
+     &     W_GAM,NWDIM)
+C--------------------------------------------------------------------
+C     Calculates the velocity influence of a collection of horseshoe
+C     vortices on one control point, i.e. one row of the influence
+C     matrix computed by VVOR
+C     
+C Input
+C -----
+C     BETM ... CHORDV   same as in VVOR
+C
+C     I         index of the control point
+C     RCI(3)    coordinates of the control point
+C     NCOMPI    index of component containing c.p.
+C     LCOMP     T if the core size depends on the c.p. component
+C     LVTEST    T if core-radius test is to be applied
+C
+C     NWDIM     stride between the vortices in W_GAM
+C     
+C Output
+C ------
+C     W_GAM(3,1,v)  Induced-velocity/gamma influence of each vortex
+C     
+C--------------------------------------------------------------------
+      INCLUDE 'AVL_kinds.INC'
+
+      REAL(kind=avl_real) RV1(3,NV),
+     &     RV2(3,NV),
+     &     CHORDV(NV)
+      REAL(kind=avl_real) RCI(3),
+     &     W_GAM(3,NWDIM,*)
+      INTEGER NCOMPV(NV)
+      LOGICAL LCOMP, LVTEST
 C     
       LOGICAL LBOUND
 C     
@@ -79,119 +138,112 @@ C
       FYSYM = FLOAT(IYSYM)
       FZSYM = FLOAT(IZSYM)
 C     
-C...  Nested pair of loops to calculate the normalwash influence matrix
-C     the outer loop runs over all the control points
-C     the inner loop runs over all the vortex elements 
-C$AD II-LOOP
-      DO 200 I = 1, NC
 C...  Control point location
-         X = RC(1,I)
-         Y = RC(2,I)
-         Z = RC(3,I)
+      X = RCI(1)
+      Y = RCI(2)
+      Z = RCI(3)
 C     
-         U = 0.
-         V = 0.
-         W = 0.
+      U = 0.
+      V = 0.
+      W = 0.
 C     
 C$AD II-LOOP
-         DO 100 J = 1, NV
+      DO 100 J = 1, NV
 C--------- set vortex core
-            DSYZ = SQRT(  (RV2(2,J)-RV1(2,J))**2
-     &                  + (RV2(3,J)-RV1(3,J))**2 )
+         DSYZ = SQRT(  (RV2(2,J)-RV1(2,J))**2
+     &               + (RV2(3,J)-RV1(3,J))**2 )
 C---- default (non-zero) core size based on spanwise lattice spacing
-            RCORE = 0.0001*DSYZ
+         RCORE = 0.0001*DSYZ
 C---- if field point is not on same component use larger core size
-            IF(NC .EQ. NV) THEN
-              IF(NCOMPC(I) .NE. NCOMPV(J)) THEN
-               RCORE = MAX( VRCOREC*CHORDV(J) , VRCOREW*DSYZ )
+         IF(LCOMP) THEN
+           IF(NCOMPI .NE. NCOMPV(J)) THEN
+            RCORE = MAX( VRCOREC*CHORDV(J) , VRCOREW*DSYZ )
 cc             RCORE = VRCORE*DSYZ
-              ENDIF
-            ENDIF
+           ENDIF
+         ENDIF
 C     
-            UI = 0.0
-            VI = 0.0
-            WI = 0.0
+         UI = 0.0
+         VI = 0.0
+         WI = 0.0
 C     
-            YOFF = 2.0* YSYM
-            ZOFF = 2.0* ZSYM
+         YOFF = 2.0* YSYM
+         ZOFF = 2.0* ZSYM
 CCC   ZOFF = 2.0*(ZSYM + ALFA*0.5*(RV1(1,J)+RV2(1,J)) )
 C     
 C...  Calculate the influence of the REAL vortex
 
-            LBOUND = .NOT.(LVTEST .AND. I.EQ.J)
-            CALL VORVELC(X,Y,Z,LBOUND,
-     &           RV1(1,J),RV1(2,J),RV1(3,J),
-     &           RV2(1,J),RV2(2,J),RV2(3,J),
-     &           BETM,U,V,W,RCORE)
+         LBOUND = .NOT.(LVTEST .AND. I.EQ.J)
+         CALL VORVELC(X,Y,Z,LBOUND,
+     &        RV1(1,J),RV1(2,J),RV1(3,J),
+     &        RV2(1,J),RV2(2,J),RV2(3,J),
+     &        BETM,U,V,W,RCORE)
 C     
-            IF(IYSYM.NE.0) THEN
+         IF(IYSYM.NE.0) THEN
 C...  Calculate the influence of the y-IMAGE vortex
-               LBOUND = .TRUE.
+            LBOUND = .TRUE.
 C...  For sym/asym matrices check for vortex midpoints of image vortices
-               IF(IYSYM.EQ.1) THEN
-                  XAVE =        0.5*(RV1(1,J)+RV2(1,J))
-                  YAVE = YOFF - 0.5*(RV1(2,J)+RV2(2,J))
-                  ZAVE =        0.5*(RV1(3,J)+RV2(3,J))
-                  IF(X.EQ.XAVE .AND. 
-     &               Y.EQ.YAVE .AND.
-     &               Z.EQ.ZAVE       ) LBOUND = .FALSE.
+            IF(IYSYM.EQ.1) THEN
+               XAVE =        0.5*(RV1(1,J)+RV2(1,J))
+               YAVE = YOFF - 0.5*(RV1(2,J)+RV2(2,J))
+               ZAVE =        0.5*(RV1(3,J)+RV2(3,J))
+               IF(X.EQ.XAVE .AND. 
+     &            Y.EQ.YAVE .AND.
+     &            Z.EQ.ZAVE       ) LBOUND = .FALSE.
 ccc   IF(.NOT.LBOUND) write(*,*) 'POS self vortex i,j ',i,j
-               ENDIF
+            ENDIF
 
-               CALL VORVELC(X,Y,Z,LBOUND,
-     &              RV2(1,J),YOFF-RV2(2,J),RV2(3,J),
-     &              RV1(1,J),YOFF-RV1(2,J),RV1(3,J),
-     &              BETM,UI,VI,WI,RCORE)
+            CALL VORVELC(X,Y,Z,LBOUND,
+     &           RV2(1,J),YOFF-RV2(2,J),RV2(3,J),
+     &           RV1(1,J),YOFF-RV1(2,J),RV1(3,J),
+     &           BETM,UI,VI,WI,RCORE)
 
 c               CALL VORVEL(X,Y,Z,LBOUND,
 c     &              RV2(1,J),YOFF-RV2(2,J),RV2(3,J),
 c     &              RV1(1,J),YOFF-RV1(2,J),RV1(3,J),
 c     &              BETM,UI,VI,WI)
 
-               UI = UI*FYSYM
-               VI = VI*FYSYM
-               WI = WI*FYSYM 
-            ENDIF
+            UI = UI*FYSYM
+            VI = VI*FYSYM
+            WI = WI*FYSYM 
+         ENDIF
 C     
-            IF(IZSYM.NE.0) THEN
+         IF(IZSYM.NE.0) THEN
 C...  Calculate the influence of the z-IMAGE vortex
+            LBOUND = .TRUE.
+            CALL VORVELC(X,Y,Z,LBOUND,
+     &           RV2(1,J),RV2(2,J),ZOFF-RV2(3,J),
+     &           RV1(1,J),RV1(2,J),ZOFF-RV1(3,J),
+     &           BETM,UII,VII,WII,RCORE)
+            U = U + UII*FZSYM
+            V = V + VII*FZSYM
+            W = W + WII*FZSYM
+C     
+C...  Calculate the influence of the y,z-IMAGE vortex
+            IF(IYSYM.NE.0) THEN
                LBOUND = .TRUE.
                CALL VORVELC(X,Y,Z,LBOUND,
-     &              RV2(1,J),RV2(2,J),ZOFF-RV2(3,J),
-     &              RV1(1,J),RV1(2,J),ZOFF-RV1(3,J),
+     &              RV1(1,J),YOFF-RV1(2,J),ZOFF-RV1(3,J),
+     &              RV2(1,J),YOFF-RV2(2,J),ZOFF-RV2(3,J),
      &              BETM,UII,VII,WII,RCORE)
-               U = U + UII*FZSYM
-               V = V + VII*FZSYM
-               W = W + WII*FZSYM
-C     
-C...  Calculate the influence of the y,z-IMAGE vortex
-               IF(IYSYM.NE.0) THEN
-                  LBOUND = .TRUE.
-                  CALL VORVELC(X,Y,Z,LBOUND,
-     &                 RV1(1,J),YOFF-RV1(2,J),ZOFF-RV1(3,J),
-     &                 RV2(1,J),YOFF-RV2(2,J),ZOFF-RV2(3,J),
-     &                 BETM,UII,VII,WII,RCORE)
 C     
-                  UI = UI + UII*FYSYM*FZSYM
-                  VI = VI + VII*FYSYM*FZSYM
-                  WI = WI + WII*FYSYM*FZSYM
-               ENDIF
+               UI = UI + UII*FYSYM*FZSYM
+               VI = VI + VII*FYSYM*FZSYM
+               WI = WI + WII*FYSYM*FZSYM
             ENDIF
+         ENDIF
 C     
-            US = U + UI
-            VS = V + VI
-            WS = W + WI
+         US = U + UI
+         VS = V + VI
+         WS = W + WI
 C     
-            WC_GAM(1,I,J) = US
-            WC_GAM(2,I,J) = VS
-            WC_GAM(3,I,J) = WS
+         W_GAM(1,1,J) = US
+         W_GAM(2,1,J) = VS
+         W_GAM(3,1,J) = WS
 C     
- 100     CONTINUE
-
- 200  CONTINUE
+ 100  CONTINUE
 C     
       RETURN
-      END
+      END ! VVOR_ROW
 
 
 
@@ -1491,19 +1491,99 @@ c     up the size information as we make each surface
       
 c     reset all the flags related to the analysis pipline      
       LAIC = .FALSE.
+      LAICBLK = .FALSE.
       LSRD = .FALSE.
       LVEL = .FALSE.
       LSOL = .FALSE.
       LSEN = .FALSE.
 
+      do ii=1,NSURF
+            LSURFMOD(ii) = .FALSE.
+      enddo
+
       if (NAIC /= NVOR) then 
             call avlheap_clean()
             call avlheap_diff_clean()
-            call avlheap_init(NVOR)
-            call avlheap_diff_init(NVOR)
+            call avlheap_init(NVOR, LLOWMEM)
+            if (.not. LLOWMEM) call avlheap_diff_init(NVOR)
       endif 
       
       end subroutine update_surfaces
+
+      subroutine update_modified_surfaces()
+c--------------------------------------------------------------
+c     Remakes only the surfaces flagged in LSURFMOD (and their
+c     duplicates), leaving the strips and vortices of the other
+c     surfaces in place. If a remade surface changes its number
+c     of strips or vortices the index ranges of the surfaces 
+c     after it shift, so all surfaces are remade instead.
+c--------------------------------------------------------------
+      include 'AVL.INC'
+      INCLUDE 'AVL_surf.INC'
+      integer ii, NSTRIP0, NVOR0, NJ0, NK0
+      logical lany
+      
+      lany = .FALSE.
+      do ii=1,NSURF
+            lany = lany .or. LSURFMOD(ii)
+      enddo
+      if (.not. lany) return
+      
+c     the surface routines add their strips and vortices to the 
+c     global counts, which do not change here
+      NSTRIP0 = NSTRIP
+      NVOR0 = NVOR
+      
+      ISURF = 1
+      do while (ISURF .le. NSURF)
+            if (LSURFMOD(ISURF)) then
+                  if (lverbose) write(*,*) 'Updating surface ',ISURF
+                  NJ0 = NJ(ISURF)
+                  NK0 = NK(ISURF)
+                  if (lsurfmsh(isurf)) then
+                        call makesurf_mesh(ISURF) 
+                  else
+                        call makesurf(ISURF)
+                  end if
+                  
+                  if ((NJ(ISURF) /= NJ0) .or. (NK(ISURF) /= NK0)) then
+                        call update_surfaces()
+                        return
+                  endif
+                  
+                  LBLKMOD(ISURF) = .TRUE.
+                  
+                  if(ldupl(isurf)) then
+                        if (lverbose) write(*,*) ' reduplicating ',ISURF
+                        call sdupl(isurf,ydupl(isurf),'ydup')
+                        LBLKMOD(ISURF+1) = .TRUE.
+                  endif
+            endif
+            
+            if(ldupl(isurf)) ISURF = ISURF + 1
+            ISURF = ISURF + 1
+      end do 
+      
+      NSTRIP = NSTRIP0
+      NVOR = NVOR0
+      
+      CALL ENCALC
+      
+c     reset all the flags related to the analysis pipline.
+c     If the AIC and h.v. velocity matrices were built, SETUP only 
+c     rebuilds their rows and columns of the remade surfaces
+      LAICBLK = LAICBLK .OR. (LAIC .AND. LVEL)
+      LAIC = .FALSE.
+      LSRD = .FALSE.
+      LVEL = .FALSE.
+      LSOL = .FALSE.
+      LSEN = .FALSE.
+      
+      do ii=1,NSURF
+            LSURFMOD(ii) = .FALSE.
+      enddo
+      
+      end subroutine update_modified_surfaces
             
 
 
@@ -2293,6 +2293,25 @@ C
             
       end subroutine execute_eigenmode_calc
       
+      subroutine execute_eigensol()
+            ! inteded to be called from the f2py interface
+            ! computes the eigenmodes of the current solution,
+            ! which is not run again like in eigenmode_analysis
+            INCLUDE 'AVL.INC'
+            
+            integer :: IR, INFO, NSYS
+            REAL*8 ASYS(JEMAX,JEMAX),BSYS(JEMAX,NDMAX),RSYS(JEMAX)
+            REAL*8 :: ETOL
+            
+            IR = 1 ! for OptVL we always use IR = 1
+            CALL SYSMAT(IR,ASYS,BSYS,RSYS,NSYS)
+            
+            INFO = 1
+            ETOL = 1.0E-5
+            CALL EIGSOL(INFO,IR,ETOL,ASYS,NSYS)
+            
+      end subroutine execute_eigensol
+      
       subroutine get_system_matrices(ir, ASYS, BSYS, RSYS)
             INCLUDE 'AVL.INC'
       
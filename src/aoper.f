@@ -1050,8 +1050,9 @@ C---------------------------------------------------
       INCLUDE 'AVL.INC'
       REAL VSYS(IVMAX,IVMAX), VRES(IVMAX), DDC(NDMAX), WORK(IVMAX)
       INTEGER IVSYS(IVMAX)
-      real t0, t1, t2, t3, t4, t5, t6, t7, t8, t9
-      real t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t99
+      REAL TEXEC, T0
+      REAL WST(IWMAX)
+      LOGICAL LWSTART
 
 C
 C---- convergence epsilon, max angle limit (90 deg in radians)
@@ -1070,96 +1071,103 @@ C----- Geometric Stability axes, X aft, Z up
 C===================================================================
 C---- start a new solution
       LSOL = .FALSE.
+      GMRES_NFAIL = 0
+      NITEXEC = 0
+C
+C---- the last converged trim can be the starting point if its operating
+C     variables were not changed since
+      LWSTART = LWARM .AND. LWSOL .AND. NITER.GT.0
+      IF(LWSTART) THEN
+       CALL GETWST(WST)
+       DO K = 1, IVMAX
+         IF(WST(K).NE.WSTATE(K)) LWSTART = .FALSE.
+       ENDDO
+      ENDIF
+      LWSOL = .FALSE.
 C     
       call set_par_and_cons(NITER, IR)
+C
+C---- ...and if its forces are still valid, i.e. the configuration, the
+C     reference data, and the Mach number are the same
+      IF(LWSTART .AND. LSEN) THEN
+       CALL GETWST(WST)
+       DO K = IVMAX+1, IWMAX
+         IF(WST(K).NE.WSTATE(K)) LWSTART = .FALSE.
+       ENDDO
+      ELSE
+       LWSTART = .FALSE.
+      ENDIF
+C
+      IF(LWSTART) THEN
+C----- keep the trim state instead of the directly constrained values,
+C      the first Newton step then moves all the variables to the new
+C      constraints using the Jacobian of the trim state
+       ALFA = WSTATE(IVALFA)
+       BETA = WSTATE(IVBETA)
+       WROT(1) = WSTATE(IVROTX)
+       WROT(2) = WSTATE(IVROTY)
+       WROT(3) = WSTATE(IVROTZ)
+       DO N = 1, NCONTROL
+         DELCON(N) = WSTATE(IVTOT+N)
+       ENDDO
+      ENDIF
       
-      call cpu_time(t0)
+      CALL SECONDS(TEXEC)
 C
 C---- set, factor AIC matrix and induced-velocity matrix (if they don't exist)
       CALL SETUP
-      if (ltiming) then 
-            call cpu_time(t1)
-            write(*,*) ' SETUP time: ', t1 - t0
-      end if
       IF(.NOT.LAIC) THEN
             call factor_AIC
       ENDIF
-      
-      if (ltiming) then 
-            call cpu_time(t2)
-            write(*,*) ' factorize time: ', t2 - t1
-      end if
 C
 
 C
-C----- set GAM_U
-      if (lverbose) then
-      WRITE(*,*) ' Solving for unit-freestream vortex circulations...'
-      endif
-      CALL GUCALC
-      if (ltiming) then 
-            call cpu_time(t3)
-            write(*,*) ' GUCALC time: ',  t3 - t2
-      end if
+C----- set GAM_U (these do not depend on the operating point, so they
+C      are reused until the AIC or source+doublet data are rebuilt)
+      IF(.NOT.LGAMU) THEN
+       if (lverbose) then
+       WRITE(*,*) ' Solving for unit-freestream vortex circulations...'
+       endif
+       CALL SECONDS(T0)
+       CALL GUCALC
+       CALL TIMACC(ITGUC,T0)
+C----- solved again by the next run if GMRES did not converge
+       LGAMU = GMRES_NFAIL.EQ.0
+      ENDIF
 C
 C-------------------------------------------------------------
 C---- calculate initial operating state
 C
 C---- set VINF() vector from initial ALFA,BETA
       CALL VINFAB
-      if (ltiming) then 
-            call cpu_time(t4)
-            write(*,*) ' VINFAB time: ', t4 - t3
-      end if
 C
-      IF(NCONTROL.GT.0) THEN
-C----- set GAM_D
-       if (lverbose) then
-           WRITE(*,*) ' Solving for vortex control-var sensitivities...'
-       end if 
-       CALL GDCALC(NCONTROL,LCONDEF,ENC_D,GAM_D)
-      ENDIF
-      if (ltiming) then 
-            call cpu_time(t5)  
-            write(*,*) ' GDCALC time: ', t5 - t4
-      end if
-      
+C---- the circulations, velocities, and forces of a warm start are still
+C     those of the trim state
+      IF(.NOT.LWSTART) THEN
 C
-      IF(NDESIGN.GT.0) THEN
-C----- set GAM_G
-      if (lverbose) then
-          WRITE(*,*) ' Solving for vortex  design-var sensitivities...'
-      end if
-       CALL GDCALC(NDESIGN ,LDESDEF,ENC_G,GAM_G)
-      ENDIF
-      if (ltiming) then 
-            call cpu_time(t6)  
-            write(*,*) ' GDCALC time: ', t6 - t5
-      end if
+C---- GAM_D and GAM_G are superposed from the stored GAM_U_D and GAM_U_G
+C     unit solutions in GAMSUM, so no GDCALC back-substitutions are needed
 C
 C---- sum AIC matrices to get GAM,SRC,DBL
+      CALL SECONDS(T0)
       CALL GAMSUM
-      if (ltiming) then 
-            call cpu_time(t7)  
-            write(*,*) ' GAMSUM time: ', t7 - t6   
-      end if
+      CALL TIMACC(ITGAMS,T0)
 C
 C---- sum AIC matrices to get WC,WV
+      CALL SECONDS(T0)
       CALL VELSUM
-      if (ltiming) then 
-            call cpu_time(t8)  
-            write(*,*) ' VELSUM time: ', t8 - t7
-      end if
+      CALL TIMACC(ITVELS,T0)
 C
 C---- compute forces
+      CALL SECONDS(T0)
       CALL AERO
-      if (ltiming) then 
-            call cpu_time(t9)  
-            write(*,*) ' AERO time: ', t9 - t8
-      end if
+      CALL TIMACC(ITAERO,T0)
+C
+      ENDIF
 C
 C---- Newton loop for operating variables
       DO 190 ITER = 1, NITER
+        NITEXEC = ITER
 C
         IF(LSA_RATES) THEN
 C-------- rates specified in NASA stability-axes, transform to body axes
@@ -1175,8 +1183,9 @@ C-------- rates specified in body-axes, no transformation
           SA_A = 0.
         ENDIF
 C
-        DO K=1, IVMAX
-          DO L=1, IVMAX
+C------ only the NVTOT x NVTOT block is used by the LU solve
+        DO L=1, NVTOT
+          DO K=1, NVTOT
             VSYS(K,L) = 0.
           ENDDO
         ENDDO
@@ -1350,17 +1359,10 @@ C        enddo
 C        write(*,*)
 C
 C------ LU-factor,  and back-substitute RHS
+        CALL SECONDS(T0)
         CALL LUDCMP(IVMAX,NVTOT,VSYS,IVSYS,WORK)
-        if (ltiming) then 
-            call cpu_time(t10)  
-            write(*,*) ITER, ' LUDCMP time: ', t10 - t9
-        end if
-
         CALL BAKSUB(IVMAX,NVTOT,VSYS,IVSYS,VRES)
-        if (ltiming) then 
-            call cpu_time(t11)  
-            write(*,*) ITER, ' BAKSUB time: ', t11 - t10
-        end if
+        CALL TIMACC(ITTRIM,T0)
 
 
 C
@@ -1446,38 +1448,21 @@ C
 C------ set VINF() vector from new ALFA,BETA
         CALL VINFAB
 C
-        IF(NCONTROL.GT.0) THEN
-C------- set new GAM_D
-         CALL GDCALC(NCONTROL,LCONDEF,ENC_D,GAM_D)
-        ENDIF
-C
-        IF(NDESIGN.GT.0) THEN
-C------- set new GAM_G
-         CALL GDCALC(NDESIGN ,LDESDEF,ENC_G,GAM_G)
-        ENDIF
-C
-C------ sum AIC matrices to get GAM,SRC,DBL
+C------ sum AIC matrices to get GAM,SRC,DBL (and new GAM_D,GAM_G)
+        CALL SECONDS(T0)
         CALL GAMSUM
-        if (ltiming) then 
-            call cpu_time(t12)  
-            write(*,*) ITER, ' other1 time: ', t12 - t11
-        end if
-
+        CALL TIMACC(ITGAMS,T0)
 C
 C------ sum AIC matrices to get WC,WV
+        CALL SECONDS(T0)
         CALL VELSUM
-        if (ltiming) then 
-            call cpu_time(t13)  
-            write(*,*) ITER, ' VELSUM time: ', t13 - t12
-        end if
+        CALL TIMACC(ITVELS,T0)
 C
 C
 C------ compute forces
+        CALL SECONDS(T0)
         CALL AERO
-        if (ltiming) then 
-            call cpu_time(t14)  
-            write(*,*) ITER, ' other2 time: ', t14 - t13
-        end if
+        CALL TIMACC(ITAERO,T0)
 C
 C
 C------ convergence check
@@ -1491,7 +1476,8 @@ C------ convergence check
         ENDDO
 C
         IF(DELMAX.LT.EXEC_TOL) THEN
-         LSOL = .TRUE.
+C------- the solution is only converged if its linear solves are too
+         LSOL = GMRES_NFAIL.EQ.0
          LOBVEL = .FALSE.
 C------- mark trim case as being converged
          ITRIM(IR) = IABS(ITRIM(IR))
@@ -1513,12 +1499,16 @@ C
       PARVAL(IPROTY,IR) = WROT(2)*0.5*CREF
       PARVAL(IPROTZ,IR) = WROT(3)*0.5*BREF
       PARVAL(IPCL  ,IR) = CLTOT
+C
+C---- store the trim state for warm starting the next solve, but only
+C     if it is a converged solution (not after a GMRES failure)
+      IF(LSOL) THEN
+       CALL GETWST(WSTATE)
+       LWSOL = .TRUE.
+      ENDIF
 C
       LSEN = .TRUE.
-      if (ltiming) then 
-            call cpu_time(t99)
-            write(*,*) ' TOTAL time: ', t99 - t0
-      end if
+      CALL TIMACC(ITEXEC,TEXEC)
 
       RETURN
 C
@@ -1526,6 +1516,73 @@ C
 
 
 
+      SUBROUTINE GETWST(WST)
+C---------------------------------------------------
+C     Gathers the values that the forces of a trim
+C     state depend on, besides the configuration:
+C     the operating variables, the reference data,
+C     and the flags of the force calculation.
+C---------------------------------------------------
+      INCLUDE 'AVL.INC'
+      REAL WST(IWMAX)
+C
+      DO K = 1, IWMAX
+        WST(K) = 0.
+      ENDDO
+C
+      WST(IVALFA) = ALFA
+      WST(IVBETA) = BETA
+      WST(IVROTX) = WROT(1)
+      WST(IVROTY) = WROT(2)
+      WST(IVROTZ) = WROT(3)
+      DO N = 1, NCONTROL
+        WST(IVTOT+N) = DELCON(N)
+      ENDDO
+C
+      WST(IVMAX+1) = XYZREF(1)
+      WST(IVMAX+2) = XYZREF(2)
+      WST(IVMAX+3) = XYZREF(3)
+      WST(IVMAX+4) = CDREF
+      WST(IVMAX+5) = MACH
+      WST(IVMAX+6) = SREF
+      WST(IVMAX+7) = CREF
+      WST(IVMAX+8) = BREF
+      IF(LVISC)    WST(IVMAX+9)  = 1.0
+      IF(LBFORCE)  WST(IVMAX+10) = 1.0
+      IF(LNFLD_WV) WST(IVMAX+11) = 1.0
+C
+      RETURN
+      END ! GETWST
+
+
+
+      SUBROUTINE TIMACC(IT,TSTART)
+C---------------------------------------------------
+C     Adds the wall-clock time elapsed since TSTART
+C     to the accumulated time of timed phase IT,
+C     and counts the run of the phase.
+C     The totals are reset by zeroing TPHASE, NPHASE.
+C---------------------------------------------------
+      INCLUDE 'AVL.INC'
+      REAL TSTART, TNOW
+      CHARACTER*12 PNAME(ITTOT)
+      DATA PNAME / 'SETUP', 'build AIC', 's+doub', 'bo vel mat',
+     &             'factorize', 'GUCALC', 'GAMSUM', 'VELSUM', 'AERO',
+     &             'trim solve', 'adjoint', 'EXEC' /
+C
+      CALL SECONDS(TNOW)
+      TPHASE(IT) = TPHASE(IT) + (TNOW - TSTART)
+      NPHASE(IT) = NPHASE(IT) + 1
+C
+      if (ltiming) then
+        write(*,*) ' ', PNAME(IT), ' time: ', TNOW - TSTART
+      end if
+C
+      RETURN
+      END ! TIMACC
+
+
+
       SUBROUTINE OPTGET
 C-------------------------------------------------
 C     Allows toggling and setting of various 
@@ -1688,6 +1745,7 @@ C---------------------------------
        IZSYM = IZSYMIN
        ZSYM  = ZSYMIN
        LAIC = .FALSE.
+       LAICBLK = .FALSE.
        LSRD = .FALSE.
        LVEL = .FALSE.
        LSOL = .FALSE.
@@ -1732,6 +1790,7 @@ C
         VRCOREC = MAX( 0.0 , MIN(5.0,RINPUT(1)) )
         CALL ENCALC
         LAIC = .FALSE.
+        LAICBLK = .FALSE.
         LSRD = .FALSE.
         LVEL = .FALSE.
         LSOL = .FALSE.
@@ -1755,6 +1814,7 @@ C
         VRCOREW = MAX( 0.0 , MIN(10.0,RINPUT(1)) )
         CALL ENCALC
         LAIC = .FALSE.
+        LAICBLK = .FALSE.
         LSRD = .FALSE.
         LVEL = .FALSE.
         LSOL = .FALSE.
@@ -1778,6 +1838,7 @@ C---- SRCCORE>0 uses body radius, SRCORE<0 uses source line spacing
         SRCORE = SIGN( MIN(5.0,ABS(SRCORE)), SRCORE )
         CALL ENCALC
         LAIC = .FALSE.
+        LAICBLK = .FALSE.
         LSRD = .FALSE.
         LVEL = .FALSE.
         LSOL = .FALSE.
@@ -2205,8 +2266,8 @@ C ============= Added to AVL ===============
             do i = 1,NVOR
                   GAM_U(i,IU) = RHS_U(i, IU)
             enddo
-            CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U(:,IU))
       enddo
+      CALL SOLVE_AIC_MRHS(6,GAM_U,NVMAX)
       
       call set_vel_rhs
       
@@ -2215,7 +2276,7 @@ C---- copy RHS vector into GAM that will be used for soluiton
             GAM(i) = RHS(i)
       enddo
 
-      CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM)
+      CALL SOLVE_AIC('N',GAM)
       
       
       IF(NCONTROL.GT.0) THEN
@@ -2239,14 +2300,17 @@ C---
       ! IF(.NOT.LAIC) THEN
       !      CALL build_AIC
       ! end if
+      CALL AVLHEAP_UNSHARE
       CALL build_AIC
       AMACH = MACH
       BETM = SQRT(1.0 - AMACH**2)
+      IF(.NOT.LLOWMEM) THEN
        CALL VVOR(BETM,IYSYM,YSYM,IZSYM,ZSYM,
      &           VRCOREC,VRCOREW,
      &           NVOR,RV1,RV2,LVCOMP,CHORDV,
      &           NVOR,RV ,    LVCOMP,.TRUE.,
      &           WV_GAM,NVOR)
+      ENDIF
 
       CALL SRDSET(BETM,XYZREF,IYSYM,
      &              NBODY,LFRST,NLMAX,NUMAX,
@@ -2313,6 +2377,37 @@ C------ don't bother if this control variable is undefined
       end !get_res
 
       
+      subroutine set_operating_point
+c--------------------------------------------------------------
+c     Sets the operating variables and the freestream for the 
+c     current run case without solving for the circulations, so 
+c     that VELSUM and AERO can be called with a given GAM. 
+c     Unlike get_res, the AIC and the velocity matrices are only 
+c     rebuilt if they are no longer valid.
+c--------------------------------------------------------------
+      use avl_heap_inc
+      INCLUDE "AVL.INC"
+      call set_par_and_cons(NITMAX, IRUN)
+      CALL SETUP
+C
+C---- the forces will be those of the given GAM, not of the last trim
+      LWSOL = .FALSE.
+      
+C---- set VINF() vector from initial ALFA,BETA
+      CALL VINFAB
+      
+      DO L = 1, NLNODE
+           SRC(L) = SRC_U(L,1)*VINF(1)
+     &            + SRC_U(L,2)*VINF(2)
+     &            + SRC_U(L,3)*VINF(3)
+     &            + SRC_U(L,4)*WROT(1)
+     &            + SRC_U(L,5)*WROT(2)
+     &            + SRC_U(L,6)*WROT(3)
+      enddo 
+      
+      end !set_operating_point
+
+      
       
       subroutine solve_adjoint(solve_stab_deriv_adj, solve_con_surf_adj)
       use avl_heap_inc
@@ -2322,6 +2417,7 @@ C------ don't bother if this control variable is undefined
       integer i 
       logical :: solve_stab_deriv_adj, solve_con_surf_adj
       
+      GMRES_NFAIL = 0
       CALL SETUP
       IF(.NOT.LAIC) THEN
             call factor_AIC
@@ -2332,14 +2428,14 @@ C------ don't bother if this control variable is undefined
             RES_diff(i) = GAM_diff(i)
       enddo
 
-      CALL BAKSUBTRANS(NVOR,NVOR,AICN_LU,IAPIV,RES_diff)
+      CALL SOLVE_AIC('T',RES_diff)
       
       if (solve_con_surf_adj) then 
       DO IC = 1, NCONTROL
             do i =1,NVOR
                   RES_D_diff(i,IC) = GAM_D_diff(i,IC)
             enddo
-            CALL BAKSUBTRANS(NVOR,NVOR,AICN_LU,IAPIV,RES_D_diff(:,IC))
+            CALL SOLVE_AIC('T',RES_D_diff(:,IC))
       enddo
       endif 
 
@@ -2349,8 +2445,203 @@ C------ don't bother if this control variable is undefined
                   RES_U_diff(i,IU) = GAM_U_diff(i,IU)
             enddo
             
-            CALL BAKSUBTRANS(NVOR,NVOR,AICN_LU,IAPIV,RES_U_diff(:,IU))
+            CALL SOLVE_AIC('T',RES_U_diff(:,IU))
       enddo
       endif
       
-      end !subroutine solve_adjoint
\ No newline at end of file
+      end !subroutine solve_adjoint
+      
+      subroutine solve_adjoint_mrhs(ADJ, N, MRHS)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N, MRHS
+      real ADJ(N, MRHS)
+      REAL T0
+C---- solves the adjoint system for a stack of MRHS right-hand sides
+C     (one column each) with a single transposed back-substitution
+      
+      GMRES_NFAIL = 0
+      CALL SETUP
+      IF(.NOT.LAIC) THEN
+            call factor_AIC
+      ENDIF
+      
+      CALL SECONDS(T0)
+      IF(LITSOLV) THEN
+       DO K = 1, MRHS
+         CALL SOLVE_AIC('T',ADJ(1,K))
+       ENDDO
+      ELSE
+       CALL BAKSUBTRANS_MRHS(NVOR,NVOR,AICN_LU,IAPIV,MRHS,ADJ)
+      ENDIF
+      CALL TIMACC(ITADJ,T0)
+      
+      end !subroutine solve_adjoint_mrhs
+      
+      subroutine solve_forward_mrhs(SOL, N, MRHS)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N, MRHS
+      real SOL(N, MRHS)
+C---- solves the linearized (forward) system AICN x = b for a stack of 
+C     MRHS right-hand sides (one column each) 
+      
+      GMRES_NFAIL = 0
+      CALL SETUP
+      IF(.NOT.LAIC) THEN
+            call factor_AIC
+      ENDIF
+      
+      CALL SOLVE_AIC_MRHS(MRHS,SOL,N)
+      
+      end !subroutine solve_forward_mrhs
+      
+      subroutine get_aic(AIC, N)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N
+      real AIC(N, N)
+C---- returns the AIC matrix, which is the jacobian of the residuals 
+C     with respect to the circulations
+      
+      CALL SETUP
+      
+      do j = 1, NVOR
+            do i = 1, NVOR
+                  AIC(i,j) = AICN(i,j)
+            enddo
+      enddo
+      
+      end !subroutine get_aic
+      
+      subroutine get_aic_data(AIC, AIC_LU, N)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N
+      real AIC(N, N), AIC_LU(N, N)
+C---- returns the AIC matrix and its factors, so that they can be 
+C     written to the AIC cache
+      
+      do j = 1, NVOR
+            do i = 1, NVOR
+                  AIC(i,j) = AICN(i,j)
+                  AIC_LU(i,j) = AICN_LU(i,j)
+            enddo
+      enddo
+      
+      end !subroutine get_aic_data
+      
+      subroutine set_aic_data(AIC, AIC_LU, N, AMACH_IN)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N
+      real AIC(N, N), AIC_LU(N, N)
+      real AMACH_IN
+C---- sets the AIC matrix and its factors read from the AIC cache, which 
+C     were built at the Mach number AMACH_IN.  The pivots (IAPIV) and 
+C     the rows with a V.n equation (LVNC) must be set as well.
+      
+      CALL AVLHEAP_UNSHARE
+      do j = 1, NVOR
+            do i = 1, NVOR
+                  AICN(i,j) = AIC(i,j)
+                  AICN_LU(i,j) = AIC_LU(i,j)
+            enddo
+      enddo
+      
+      CALL mark_aic_data(AMACH_IN)
+      
+      end !subroutine set_aic_data
+      
+      subroutine mark_aic_data(AMACH_IN)
+      include "AVL.INC"
+      real AMACH_IN
+C---- marks the AIC and its factors as valid for the Mach number 
+C     AMACH_IN after they were set from outside of SETUP
+      
+      AMACH = AMACH_IN
+      LAIC = .TRUE.
+      LAICBLK = .FALSE.
+      DO L = 1, NSURF
+        LBLKMOD(L) = .FALSE.
+      ENDDO
+C---- the (cheap) source+doublet matrices may be of another Mach number,
+C     and the unit-freestream circulations are solved again with these 
+C     factors
+      LSRD = .FALSE.
+      LGAMU = .FALSE.
+      
+      end !subroutine mark_aic_data
+      
+      subroutine get_vel_data(WCG, WVG, N)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N
+      real WCG(3, N, N), WVG(3, N, N)
+C---- returns the induced-velocity matrices at the control points and 
+C     at the bound vortices, which are not stored in low memory mode
+      
+      do j = 1, NVOR
+            do i = 1, NVOR
+                  do k = 1, 3
+                        WCG(k,i,j) = WC_GAM(k,i,j)
+                        WVG(k,i,j) = WV_GAM(k,i,j)
+                  enddo
+            enddo
+      enddo
+      
+      end !subroutine get_vel_data
+      
+      subroutine set_vel_data(WCG, WVG, N)
+      use avl_heap_inc
+      include "AVL.INC"
+      integer N
+      real WCG(3, N, N), WVG(3, N, N)
+C---- sets the induced-velocity matrices read from the AIC cache, 
+C     which must be of the same Mach number as the AIC (set_aic_data)
+      
+      CALL AVLHEAP_UNSHARE
+      do j = 1, NVOR
+            do i = 1, NVOR
+                  do k = 1, 3
+                        WC_GAM(k,i,j) = WCG(k,i,j)
+                        WV_GAM(k,i,j) = WVG(k,i,j)
+                  enddo
+            enddo
+      enddo
+      LVEL = .TRUE.
+      
+      end !subroutine set_vel_data
+      
+      subroutine attach_aic_data(AIC_ADDR, AIC_LU_ADDR, WC_ADDR, WV_ADDR,
+     &                           N, AMACH_IN, LCOPY)
+      use iso_c_binding
+      include "AVL.INC"
+      integer(c_intptr_t) AIC_ADDR, AIC_LU_ADDR, WC_ADDR, WV_ADDR
+      integer N
+      real AMACH_IN
+      logical LCOPY
+C---- points the AIC matrix, its factors, and the induced-velocity 
+C     matrices to memory shared with other processes (see 
+C     avlheap_attach).  With LCOPY the current matrices are copied 
+C     into the memory, which is how the owner of the memory fills it.
+C     Otherwise the matrices in the memory were built at the Mach 
+C     number AMACH_IN, and the pivots (IAPIV) and the rows with a V.n 
+C     equation (LVNC) must be set as well.
+      
+      CALL avlheap_attach(AIC_ADDR, AIC_LU_ADDR, WC_ADDR, WV_ADDR,
+     &                    N, LCOPY)
+      IF(.NOT.LCOPY) THEN
+       CALL mark_aic_data(AMACH_IN)
+       IF(.NOT.LLOWMEM) LVEL = .TRUE.
+      ENDIF
+      
+      end !subroutine attach_aic_data
+      
+      subroutine unshare_aic_data
+C---- gives the AIC matrices private copies of the shared memory 
+C     before it is released
+      
+      CALL avlheap_unshare
+      
+      end !subroutine unshare_aic_data
\ No newline at end of file
@@ -41,35 +41,41 @@ C...COMMENTS
 C
       use avl_heap_inc  
       INCLUDE 'AVL.INC'
-      real t0, t1, t2, t3, t4, t5
+      REAL TSETP, T0
+C
+      CALL SECONDS(TSETP)
+C
+C---- check the stored AIC data against the current configuration
+      CALL AIC_FINGERPRINT
+C
+C---- unit-freestream circulations are only valid with the current AIC
+      IF(.NOT.LAIC .OR. .NOT.LSRD) LGAMU = .FALSE.
 C
       AMACH = MACH
       BETM = SQRT(1.0 - AMACH**2)
 C
 C
-      if (ltiming) then 
-        call cpu_time(t0)
-      end if
-      CALL build_AIC
-!       IF(.NOT.LAIC) THEN
-!         CALL build_AIC
-!         if (ltiming) then 
-!           call cpu_time(t2)
-!           write(*,*) '  nowake time: ', t2 - t1
-!         end if 
+      IF(.NOT.LAIC) THEN
+C------ the AIC of a shared heap is only ever read
+        CALL AVLHEAP_UNSHARE
+        CALL SECONDS(T0)
+        IF(LAICBLK) THEN
+C------- only the rows and columns of the remade surfaces are out of date
+          CALL build_AIC_blocks(1)
+        ELSE
+          CALL build_AIC
+        ENDIF
+        CALL TIMACC(ITAIC,T0)
 
 CC...Holdover from HPV hydro project for forces near free surface
 CC...Eliminates excluded vortices from eqns which are below z=Zsym 
 C      CALL MUNGEA
 C
-!       ENDIF
-      if (ltiming) then 
-        call cpu_time(t3)
-        write(*,*) '  LUDCMP time: ', t3 - t0
-      end if
+      ENDIF
 C
 C
-      ! IF(.NOT.LSRD) THEN
+      IF(.NOT.LSRD) THEN
+        CALL SECONDS(T0)
         if(lverbose) then
           WRITE(*,*) ' Building source+doublet strength AIC matrix...'
         end if
@@ -87,46 +93,100 @@ C
      &            NU,SRC_U,DBL_U,
      &            NVOR,RC,
      &            WCSRD_U,NVMAX)
-      !   LSRD = .TRUE.
-      ! ENDIF
-      if (ltiming) then 
-        call cpu_time(t4)
-        write(*,*) '  s+doub time: ', t4 - t3
-      end if
+C
+C------ the h.v. velocities also depend on the unit source+doublet strengths
+        CALL VSRD(BETM,IYSYM,YSYM,IZSYM,ZSYM,SRCORE,
+     &            NBODY,LFRST,NLMAX,
+     &            NL,RL,RADL,
+     &            NU,SRC_U,DBL_U,
+     &            NVOR,RV ,
+     &            WVSRD_U,NVOR)
+C
+        XYZSRD(1) = XYZREF(1)
+        XYZSRD(2) = XYZREF(2)
+        XYZSRD(3) = XYZREF(3)
+        LSRD = .TRUE.
+        CALL TIMACC(ITSRD,T0)
+      ENDIF
 
 C
       IF(.NOT.LVEL) THEN
-      if(lverbose) then
+C----- in low memory mode the velocities are computed by VELSUM directly
+       IF(.NOT.LLOWMEM) THEN
+       CALL AVLHEAP_UNSHARE
+       if(lverbose) then
         WRITE(*,*) ' Building bound-vortex velocity matrix...'
        end if 
+       CALL SECONDS(T0)
+       IF(LAICBLK) THEN
+         CALL build_AIC_blocks(2)
+       ELSE
        CALL VVOR(BETM,IYSYM,YSYM,IZSYM,ZSYM,
      &           VRCOREC,VRCOREW,
      &           NVOR,RV1,RV2,LVCOMP,CHORDV,
      &           NVOR,RV ,    LVCOMP,.TRUE.,
      &           WV_GAM,NVOR)
-C
-       NU = 6
-       CALL VSRD(BETM,IYSYM,YSYM,IZSYM,ZSYM,SRCORE,
-     &           NBODY,LFRST,NLMAX,
-     &           NL,RL,RADL,
-     &           NU,SRC_U,DBL_U,
-     &           NVOR,RV ,
-     &           WVSRD_U,NVOR)
+       ENDIF
+       CALL TIMACC(ITVVOR,T0)
+       ENDIF
 C
        LVEL = .TRUE.
       ENDIF
 C
-      if (ltiming) then 
-        call cpu_time(t5)
-        write(*,*) '  bo vel mat time: ', t5 - t4
-      end if
+C---- all the blocks are now up to date
+      LAICBLK = .FALSE.
+      DO N = 1, NSURF
+        LBLKMOD(N) = .FALSE.
+      ENDDO
+C
+      CALL TIMACC(ITSETP,TSETP)
       RETURN
       END ! SETUP
 
 
+      SUBROUTINE AIC_FINGERPRINT
+C
+C...PURPOSE  To invalidate the stored AIC, source+doublet, and
+C            induced-velocity matrices if the flow condition they 
+C            were built for no longer matches the current one.
+C
+C            Geometry changes are flagged directly by the routines
+C            that remake the lattice (update_surfaces, update_bodies,
+C            loadgeo), which clear LAIC, LSRD, and LVEL.
+C            update_modified_surfaces also sets LAICBLK, so that
+C            only the rows and columns of the remade surfaces are 
+C            rebuilt (see build_AIC_blocks).
+C            This routine covers the remaining dependencies:
+C
+C              AMACH   Mach number  -> AIC, s+d strengths, h.v. velocities
+C              XYZSRD  XYZref       -> s+d strengths (unit rotations)
+C
+C            As long as none of these change, SETUP skips build_AIC,
+C            SRDSET, VSRD, and VVOR, and EXEC skips factor_AIC.
+C
+      INCLUDE 'AVL.INC'
+C
+      IF(MACH.NE.AMACH) THEN
+       LAIC = .FALSE.
+       LAICBLK = .FALSE.
+       LSRD = .FALSE.
+       LVEL = .FALSE.
+      ENDIF
+C
+      IF(XYZREF(1).NE.XYZSRD(1) .OR.
+     &   XYZREF(2).NE.XYZSRD(2) .OR.
+     &   XYZREF(3).NE.XYZSRD(3)      ) THEN
+       LSRD = .FALSE.
+      ENDIF
+C
+      RETURN
+      END ! AIC_FINGERPRINT
+
+
       SUBROUTINE build_AIC
       use avl_heap_inc  
       INCLUDE 'AVL.INC'
+      REAL WROW(3,NVOR)
 
       AMACH = MACH
       BETM = SQRT(1.0 - AMACH**2)
@@ -136,6 +196,24 @@ C
           WRITE(*,*) ' Building normalwash AIC matrix...'
         end if
         
+      IF(LLOWMEM) THEN
+C----- form each row of the AIC from the velocities induced at its 
+C      control point, so that WC_GAM is never stored
+       DO I = 1, NVOR
+         CALL VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &        VRCOREC,VRCOREW,
+     &        NVOR,RV1,RV2,LVCOMP,CHORDV,
+     &        I,RC(1,I),LVCOMP(I),.TRUE.,.FALSE.,
+     &        WROW,1)
+         DO J = 1, NVOR
+           AICN(I,J) = WROW(1,J)*ENC(1,I)
+     &               + WROW(2,J)*ENC(2,I)
+     &               + WROW(3,J)*ENC(3,I)
+         ENDDO
+         LVNC(I) = .TRUE.
+       ENDDO
+C
+      ELSE
        CALL VVOR(BETM,IYSYM,YSYM,IZSYM,ZSYM,
      &           VRCOREC,VRCOREW,
      &           NVOR,RV1,RV2,LVCOMP,CHORDV,
@@ -152,6 +230,7 @@ C$AD II-LOOP
            LVNC(I) = .TRUE.
          ENDDO
        ENDDO
+      ENDIF
 
 C----- process each surface which does not shed a wake
 C$AD II-LOOP
@@ -182,16 +261,162 @@ C$AD II-LOOP
          ENDDO
  10    CONTINUE
        end ! build_AIC
+
+
+      SUBROUTINE build_AIC_blocks(IMAT)
+C
+C...PURPOSE  To recompute only the rows and columns of the 
+C            normalwash AIC (IMAT=1) or of the bound-vortex 
+C            velocity matrix (IMAT=2) that belong to the surfaces 
+C            flagged in LBLKMOD. The blocks coupling two surfaces
+C            which were not remade are kept.
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      INTEGER IMAT
+      REAL WROW(3,NVOR)
+      INTEGER JMOD1(NFMAX), JMOD2(NFMAX)
+      LOGICAL LROW
+C
+      AMACH = MACH
+      BETM = SQRT(1.0 - AMACH**2)
+C
+      if (lverbose) then
+        WRITE(*,*) ' Rebuilding AIC blocks of modified surfaces...'
+      end if
+C
+C---- vortex index ranges of the modified surfaces
+      NMOD = 0
+      DO N = 1, NSURF
+        IF(LBLKMOD(N)) THEN
+          NMOD = NMOD + 1
+          JMOD1(NMOD) = IFRST(N)
+          JMOD2(NMOD) = IFRST(N) + NK(N)*NJ(N) - 1
+        ENDIF
+      ENDDO
+C
+      DO I = 1, NVOR
+        LROW = .FALSE.
+        DO K = 1, NMOD
+          IF(I.GE.JMOD1(K) .AND. I.LE.JMOD2(K)) LROW = .TRUE.
+        ENDDO
+C
+        IF(LROW) THEN
+C-------- the point itself moved, so the whole row changes
+          IF(IMAT.EQ.1) LVNC(I) = .TRUE.
+          CALL AIC_BLOCK_ROW(IMAT,I,1,NVOR,BETM,WROW)
+        ELSE
+C-------- only the influence of the moved vortices changes
+          DO K = 1, NMOD
+            CALL AIC_BLOCK_ROW(IMAT,I,JMOD1(K),JMOD2(K),BETM,WROW)
+          ENDDO
+        ENDIF
+      ENDDO
+C
+      IF(IMAT.NE.1) RETURN
+C
+C---- reset the TE rows of the modified surfaces which do not shed a 
+C     wake (the TE rows of the other surfaces were not touched above)
+      DO 10 N = 1, NSURF
+        IF(.NOT.LBLKMOD(N) .OR. LFWAKE(N)) GO TO 10
+C
+        J1 = JFRST(N)
+        JN = JFRST(N) + NJ(N)-1
+        DO J = J1, JN
+          I1 = IJFRST(J)
+          IV = IJFRST(J) + NVSTRP(J) - 1
+          DO JV = 1, NVOR
+            AICN(IV,JV) = 0.
+          ENDDO
+          LVNC(IV) = .FALSE.
+          DO JV = I1, IV
+            AICN(IV,JV) = 1.0
+          ENDDO
+        ENDDO
+ 10   CONTINUE
+C
+      RETURN
+      END ! build_AIC_blocks
+
+
+      SUBROUTINE AIC_BLOCK_ROW(IMAT,I,J1,J2,BETM,WROW)
+C
+C...PURPOSE  To recompute the entries J1..J2 of row I of the
+C            normalwash AIC (IMAT=1) or of the bound-vortex 
+C            velocity matrix (IMAT=2)
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      INTEGER IMAT, I, J1, J2
+      REAL WROW(3,NVOR)
+C
+      NV = J2 - J1 + 1
+C
+C---- the c.p. index is shifted like the vortices, so that VVOR_ROW 
+C     still recognizes the self-induced vortex
+      IF(IMAT.EQ.1) THEN
+       CALL VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &      VRCOREC,VRCOREW,
+     &      NV,RV1(1,J1),RV2(1,J1),LVCOMP(J1),CHORDV(J1),
+     &      I-J1+1,RC(1,I),LVCOMP(I),.TRUE.,.FALSE.,
+     &      WROW(1,J1),1)
+       DO J = J1, J2
+         IF(.NOT.LLOWMEM) THEN
+           WC_GAM(1,I,J) = WROW(1,J)
+           WC_GAM(2,I,J) = WROW(2,J)
+           WC_GAM(3,I,J) = WROW(3,J)
+         ENDIF
+C------- TE rows of surfaces without a wake are not normalwash equations
+         IF(LVNC(I)) THEN
+           AICN(I,J) = WROW(1,J)*ENC(1,I)
+     &               + WROW(2,J)*ENC(2,I)
+     &               + WROW(3,J)*ENC(3,I)
+         ENDIF
+       ENDDO
+C
+      ELSE
+       CALL VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &      VRCOREC,VRCOREW,
+     &      NV,RV1(1,J1),RV2(1,J1),LVCOMP(J1),CHORDV(J1),
+     &      I-J1+1,RV(1,I),LVCOMP(I),.TRUE.,.TRUE.,
+     &      WROW(1,J1),1)
+       DO J = J1, J2
+         WV_GAM(1,I,J) = WROW(1,J)
+         WV_GAM(2,I,J) = WROW(2,J)
+         WV_GAM(3,I,J) = WROW(3,J)
+       ENDDO
+      ENDIF
+C
+      RETURN
+      END ! AIC_BLOCK_ROW
        
       SUBROUTINE factor_AIC
        use avl_heap_inc  
        INCLUDE 'AVL.INC'
        REAL WORK(NVOR)
+       REAL T0
        integer i, j
        
        if(lverbose) then
         WRITE(*,*) ' Factoring normalwash AIC matrix...'
        end if 
+       CALL AVLHEAP_UNSHARE
+       CALL SECONDS(T0)
+       IF(LITSOLV) THEN
+C------ only the diagonal blocks of groups of adjacent strips are
+C       factored, as the block-Jacobi preconditioner of GMRES_AIC
+        JS = 1
+        DO WHILE(JS.LE.NSTRIP)
+          CALL PRECBLK(JS,I1,NB)
+          I2 = I1 + NB - 1
+          do j = I1, I2
+            do i = I1, I2
+              AICN_LU(i,j) = AICN(i,j)
+            enddo
+          enddo
+          CALL LUDCMP(NVOR,NB,AICN_LU(I1,I1),IAPIV(I1),WORK)
+        ENDDO
+       ELSE
        do j = 1, NVOR
          do i = 1, NVOR
             AICN_LU(i,j) = AICN(i,j)
@@ -199,9 +424,286 @@ C$AD II-LOOP
          enddo 
         ENDDO
        CALL LUDCMP(NVOR,NVOR,AICN_LU,IAPIV,WORK)
+       ENDIF
 C
        LAIC = .TRUE.
+       CALL TIMACC(ITFACT,T0)
       END ! factor_AIC
+
+
+      SUBROUTINE SOLVE_AIC(TRANS,B)
+C
+C...PURPOSE  To solve  AICN x = B  (TRANS='N') or  AICN^T x = B 
+C            (TRANS='T') in place, with the LU factors of factor_AIC
+C            or with GMRES_AIC if LITSOLV is set
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      CHARACTER*1 TRANS
+      REAL B(NVOR)
+C
+      IF(LITSOLV) THEN
+       CALL GMRES_AIC(TRANS,B)
+      ELSEIF(TRANS.EQ.'T') THEN
+       CALL BAKSUBTRANS(NVOR,NVOR,AICN_LU,IAPIV,B)
+      ELSE
+       CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,B)
+      ENDIF
+C
+      RETURN
+      END ! SOLVE_AIC
+
+
+      SUBROUTINE SOLVE_AIC_MRHS(MRHS,B,LDB)
+C
+C...PURPOSE  To solve  AICN X = B  in place for the MRHS columns of B
+C            (leading dimension LDB), with a single back-substitution 
+C            or with GMRES_AIC for each column if LITSOLV is set
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      REAL B(LDB,*)
+C
+      IF(MRHS.LE.0) RETURN
+C
+      IF(LITSOLV) THEN
+       DO K = 1, MRHS
+         CALL GMRES_AIC('N',B(1,K))
+       ENDDO
+      ELSE
+       CALL BAKSUB_MRHS(NVOR,NVOR,AICN_LU,IAPIV,MRHS,B,LDB)
+      ENDIF
+C
+      RETURN
+      END ! SOLVE_AIC_MRHS
+
+
+      SUBROUTINE GMRES_AIC(TRANS,B)
+C
+C...PURPOSE  To solve  AICN x = B  (TRANS='N') or  AICN^T x = B 
+C            (TRANS='T') in place with restarted GMRES, 
+C            right-preconditioned with the strip-block LU factors
+C            of factor_AIC.  Iterates until the residual is reduced
+C            by GMRES_TOL or GMRES_MAXIT iterations are taken.
+C            Solves that stop at GMRES_MAXIT are counted in GMRES_NFAIL.
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      CHARACTER*1 TRANS
+      REAL B(NVOR)
+C
+C---- Krylov subspace size between restarts
+      PARAMETER (KDIM=40)
+      REAL HK(KDIM+1,KDIM), CSK(KDIM), SNK(KDIM), GK(KDIM+1), YK(KDIM)
+      REAL, ALLOCATABLE :: VK(:,:), XK(:), WK(:)
+C
+      ALLOCATE(VK(NVOR,KDIM+1), XK(NVOR), WK(NVOR))
+C
+      BNORM = 0.
+      DO I = 1, NVOR
+        XK(I) = 0.
+        VK(I,1) = B(I)
+        BNORM = BNORM + B(I)**2
+      ENDDO
+      BNORM = SQRT(BNORM)
+      RNORM = BNORM
+      TOLG = GMRES_TOL*BNORM
+C
+      NIT = 0
+      IF(RNORM.LE.TOLG .OR. BNORM.EQ.0.0) GO TO 90
+C
+C---- restart cycle, VK(.,1) holds the residual
+ 10   CONTINUE
+      DO I = 1, NVOR
+        VK(I,1) = VK(I,1)/RNORM
+      ENDDO
+      GK(1) = RNORM
+      DO L = 2, KDIM+1
+        GK(L) = 0.
+      ENDDO
+C
+      DO 30 K = 1, KDIM
+        NIT = NIT + 1
+        KK = K
+C
+C------ next Krylov vector  A M^-1 v_k
+        DO I = 1, NVOR
+          WK(I) = VK(I,K)
+        ENDDO
+        CALL PRECON_AIC(TRANS,WK)
+        CALL MATVEC_AIC(TRANS,WK,VK(1,K+1))
+C
+C------ orthogonalize with modified Gram-Schmidt
+        DO L = 1, K
+          HK(L,K) = 0.
+          DO I = 1, NVOR
+            HK(L,K) = HK(L,K) + VK(I,K+1)*VK(I,L)
+          ENDDO
+          DO I = 1, NVOR
+            VK(I,K+1) = VK(I,K+1) - HK(L,K)*VK(I,L)
+          ENDDO
+        ENDDO
+        HK(K+1,K) = 0.
+        DO I = 1, NVOR
+          HK(K+1,K) = HK(K+1,K) + VK(I,K+1)**2
+        ENDDO
+        HK(K+1,K) = SQRT(HK(K+1,K))
+        IF(HK(K+1,K).NE.0.0) THEN
+         DO I = 1, NVOR
+           VK(I,K+1) = VK(I,K+1)/HK(K+1,K)
+         ENDDO
+        ENDIF
+C
+C------ reduce the Hessenberg column with Givens rotations
+        DO L = 1, K-1
+          DTMP      =  CSK(L)*HK(L,K) + SNK(L)*HK(L+1,K)
+          HK(L+1,K) = -SNK(L)*HK(L,K) + CSK(L)*HK(L+1,K)
+          HK(L,K)   = DTMP
+        ENDDO
+        DTMP = SQRT(HK(K,K)**2 + HK(K+1,K)**2)
+        CSK(K) = HK(K,K)/DTMP
+        SNK(K) = HK(K+1,K)/DTMP
+        HK(K,K) = DTMP
+        HK(K+1,K) = 0.
+        GK(K+1) = -SNK(K)*GK(K)
+        GK(K)   =  CSK(K)*GK(K)
+C
+C------ |GK(K+1)| is the residual norm of the current iterate
+        IF(ABS(GK(K+1)).LE.TOLG .OR. NIT.GE.GMRES_MAXIT) GO TO 40
+ 30   CONTINUE
+C
+C---- update the solution with the least-squares Krylov combination
+ 40   CONTINUE
+      DO L = KK, 1, -1
+        YK(L) = GK(L)
+        DO M = L+1, KK
+          YK(L) = YK(L) - HK(L,M)*YK(M)
+        ENDDO
+        YK(L) = YK(L)/HK(L,L)
+      ENDDO
+C
+      DO I = 1, NVOR
+        WK(I) = 0.
+      ENDDO
+      DO L = 1, KK
+        DO I = 1, NVOR
+          WK(I) = WK(I) + YK(L)*VK(I,L)
+        ENDDO
+      ENDDO
+      CALL PRECON_AIC(TRANS,WK)
+      DO I = 1, NVOR
+        XK(I) = XK(I) + WK(I)
+      ENDDO
+C
+C---- true residual for the convergence check and the next restart
+      CALL MATVEC_AIC(TRANS,XK,WK)
+      RNORM = 0.
+      DO I = 1, NVOR
+        VK(I,1) = B(I) - WK(I)
+        RNORM = RNORM + VK(I,1)**2
+      ENDDO
+      RNORM = SQRT(RNORM)
+C
+      IF(RNORM.GT.TOLG .AND. NIT.LT.GMRES_MAXIT) GO TO 10
+C
+      IF(RNORM.GT.TOLG) THEN
+       GMRES_NFAIL = GMRES_NFAIL + 1
+       WRITE(*,1000) NIT, RNORM/BNORM
+ 1000  FORMAT(/' ** GMRES_AIC: not converged after', I6,
+     &        ' iterations,  rel. residual =', E12.4)
+      ENDIF
+C
+ 90   CONTINUE
+      DO I = 1, NVOR
+        B(I) = XK(I)
+      ENDDO
+      GMRES_NIT = NIT
+C
+      DEALLOCATE(VK, XK, WK)
+      RETURN
+      END ! GMRES_AIC
+
+
+      SUBROUTINE PRECON_AIC(TRANS,X)
+C
+C...PURPOSE  To apply the inverse of the strip-block diagonal of AICN
+C            (or of its transpose) to X in place
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      CHARACTER*1 TRANS
+      REAL X(NVOR)
+C
+      JS = 1
+      DO WHILE(JS.LE.NSTRIP)
+        CALL PRECBLK(JS,I1,NB)
+        IF(TRANS.EQ.'T') THEN
+         CALL BAKSUBTRANS(NVOR,NB,AICN_LU(I1,I1),IAPIV(I1),X(I1))
+        ELSE
+         CALL BAKSUB(NVOR,NB,AICN_LU(I1,I1),IAPIV(I1),X(I1))
+        ENDIF
+      ENDDO
+C
+      RETURN
+      END ! PRECON_AIC
+
+
+      SUBROUTINE PRECBLK(JS,I1,NB)
+C
+C...PURPOSE  To get the preconditioner block which starts at strip JS.
+C            The block groups adjacent strips of the same surface,
+C            up to about NBPREC vortices.
+C
+C...OUTPUT   I1   first vortex of the block
+C            NB   number of vortices of the block
+C            JS   first strip of the next block
+C
+      INCLUDE 'AVL.INC'
+      PARAMETER (NBPREC=200)
+C
+      I1 = IJFRST(JS)
+      NB = NVSTRP(JS)
+      JS = JS + 1
+      DO WHILE(JS.LE.NSTRIP)
+        IF(LSSURF(JS).NE.LSSURF(JS-1)) RETURN
+        IF(NB+NVSTRP(JS) .GT. NBPREC) RETURN
+        NB = NB + NVSTRP(JS)
+        JS = JS + 1
+      ENDDO
+C
+      RETURN
+      END ! PRECBLK
+
+
+      SUBROUTINE MATVEC_AIC(TRANS,X,Y)
+C
+C...PURPOSE  To set  Y = AICN X  (TRANS='N') or  Y = AICN^T X  (TRANS='T')
+C
+      use avl_heap_inc  
+      INCLUDE 'AVL.INC'
+      CHARACTER*1 TRANS
+      REAL X(NVOR), Y(NVOR)
+C
+      IF(TRANS.EQ.'T') THEN
+       DO J = 1, NVOR
+         Y(J) = 0.
+         DO I = 1, NVOR
+           Y(J) = Y(J) + AICN(I,J)*X(I)
+         ENDDO
+       ENDDO
+      ELSE
+       DO I = 1, NVOR
+         Y(I) = 0.
+       ENDDO
+       DO J = 1, NVOR
+         DO I = 1, NVOR
+           Y(I) = Y(I) + AICN(I,J)*X(J)
+         ENDDO
+       ENDDO
+      ENDIF
+C
+      RETURN
+      END ! MATVEC_AIC
  
       SUBROUTINE GUCALC
       use avl_heap_inc  
@@ -252,13 +754,6 @@ C--------- just clear r.h.s.
           ENDIF
         ENDDO
 
-        CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_0(1,IU))
-        DO N = 1, NCONTROL
-          CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_D(1,IU,N))
-        ENDDO
-        DO N = 1, NDESIGN
-          CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_G(1,IU,N))
-        ENDDO
  10   CONTINUE
 C
 C---- go over freestream rotation components p,q,r
@@ -303,14 +798,16 @@ C--------- just clear r.h.s.
            ENDDO
           ENDIF
         ENDDO
-        CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_0(1,IU))
-        DO N = 1, NCONTROL
-          CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_D(1,IU,N))
-        ENDDO
-        DO N = 1, NDESIGN
-          CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_U_G(1,IU,N))
-        ENDDO
    20 CONTINUE
+C
+C---- back-substitute all the r.h.s. of each array at once,
+C     the unit-freestream columns of all the controls and design 
+C     variables are contiguous since they are all NUMAX long
+      CALL SOLVE_AIC_MRHS(NUMAX,GAM_U_0,NVMAX)
+      IF(NCONTROL.GT.0) 
+     &  CALL SOLVE_AIC_MRHS(NUMAX*NCONTROL,GAM_U_D,NVMAX)
+      IF(NDESIGN.GT.0)
+     &  CALL SOLVE_AIC_MRHS(NUMAX*NDESIGN,GAM_U_G,NVMAX)
 C
       RETURN
       END ! GUCALC
@@ -371,9 +868,17 @@ C...Holdover from HPV hydro project for forces near free surface
 C...Eliminates excluded vortex equations for strips with z<Zsym 
 ccc      CALL MUNGEB(GAM_Q(1,IQ))
 C********************************************************************
-C
-        CALL BAKSUB(NVOR,NVOR,AICN_LU,IAPIV,GAM_Q(1,IQ))
  100  CONTINUE
+C
+C---- back-substitute each run IQ1..IQ-1 of defined variables at once
+      IQ1 = 1
+      DO IQ = 1, NQDEF
+        IF(.NOT.LQDEF(IQ)) THEN
+         CALL SOLVE_AIC_MRHS(IQ-IQ1,GAM_Q(1,IQ1),NVMAX)
+         IQ1 = IQ + 1
+        ENDIF
+      ENDDO
+      CALL SOLVE_AIC_MRHS(NQDEF+1-IQ1,GAM_Q(1,IQ1),NVMAX)
 C
       RETURN
       END ! GDCALC
@@ -507,6 +1012,7 @@ C
       SUBROUTINE VELSUM()
       use avl_heap_inc  
       INCLUDE 'AVL.INC'
+      REAL WROW(3,NVOR)
       
 C---------------------------------------------------------
 C     Sums AIC components to get induced velocities and
@@ -515,24 +1021,43 @@ C
 C     VC, VV    .h.v. induced at control pts and vortex pts
 C     WC, WV    total induced at control pts and vortex pts
 C     WCSRD, WVSRD  body source/doublet induced velocities
+C
+C     The row of WV_GAM for each vortex point is gathered 
+C     into WROW, or computed directly in low memory mode
 C---------------------------------------------------------
 
+C
+      BETM = SQRT(1.0 - AMACH**2)
 C
       DO I = 1, NVOR
+        IF(LLOWMEM) THEN
+         CALL VVOR_ROW(BETM,IYSYM,YSYM,IZSYM,ZSYM,
+     &        VRCOREC,VRCOREW,
+     &        NVOR,RV1,RV2,LVCOMP,CHORDV,
+     &        I,RV(1,I),LVCOMP(I),.TRUE.,.TRUE.,
+     &        WROW,1)
+        ELSE
+         DO J = 1, NVOR
+           WROW(1,J) = WV_GAM(1,I,J)
+           WROW(2,J) = WV_GAM(2,I,J)
+           WROW(3,J) = WV_GAM(3,I,J)
+         ENDDO
+        ENDIF
+C
         DO K = 1, 3
           ! VC(K,I) = 0.0
           VV(K,I) = 0.0
 C--- h.v. velocity at control points and vortex midpoints
           DO J = 1, NVOR
             ! VC(K,I) = VC(K,I) + WC_GAM(K,I,J)*GAM(J)
-            VV(K,I) = VV(K,I) + WV_GAM(K,I,J)*GAM(J)
+            VV(K,I) = VV(K,I) + WROW(K,J)*GAM(J)
           ENDDO
           DO N = 1, NUMAX
             ! VC_U(K,I,N) = 0.0
             VV_U(K,I,N) = 0.0
             DO J = 1, NVOR
               ! VC_U(K,I,N) = VC_U(K,I,N) + WC_GAM(K,I,J)*GAM_U(J,N)
-              VV_U(K,I,N) = VV_U(K,I,N) + WV_GAM(K,I,J)*GAM_U(J,N)
+              VV_U(K,I,N) = VV_U(K,I,N) + WROW(K,J)*GAM_U(J,N)
             ENDDO
           ENDDO
           DO N = 1, NCONTROL
@@ -540,7 +1065,7 @@ C--- h.v. velocity at control points and vortex midpoints
             VV_D(K,I,N) = 0.0
             DO J = 1, NVOR
               ! VC_D(K,I,N) = VC_D(K,I,N) + WC_GAM(K,I,J)*GAM_D(J,N)
-              VV_D(K,I,N) = VV_D(K,I,N) + WV_GAM(K,I,J)*GAM_D(J,N)
+              VV_D(K,I,N) = VV_D(K,I,N) + WROW(K,J)*GAM_D(J,N)
             ENDDO
           ENDDO
           DO N = 1, NDESIGN
@@ -548,7 +1073,7 @@ C--- h.v. velocity at control points and vortex midpoints
             VV_G(K,I,N) = 0.0
             DO J = 1, NVOR
               ! VC_G(K,I,N) = VC_G(K,I,N) + WC_GAM(K,I,J)*GAM_G(J,N)
-              VV_G(K,I,N) = VV_G(K,I,N) + WV_GAM(K,I,J)*GAM_G(J,N)
+              VV_G(K,I,N) = VV_G(K,I,N) + WROW(K,J)*GAM_G(J,N)
             ENDDO
           ENDDO
 C--- velocity contribution from body sources and doublets
@@ -603,6 +1128,7 @@ C
       IF(MACH.NE.AMACH) THEN
 C----- new Mach number invalidates close to everything that's stored
        LAIC = .FALSE.
+       LAICBLK = .FALSE.
        LSRD = .FALSE.
        LVEL = .FALSE.
        LSOL = .FALSE.
@@ -480,14 +480,16 @@ C----- initialize state
 C        CALL VARINI
 C
        LAIC = .FALSE. ! Tell AVL that the AIC is no longer valid and to regenerate it
+       LAICBLK = .FALSE.
        LSRD = .FALSE. ! Tell AVL that unit source+doublet strengths are no longer valid and to regenerate them
        LVEL = .FALSE. ! Tell AVL that the induced velocity matrix is no longer valid and to regenerate it
        LSOL = .FALSE. ! Tell AVL that a valid solution no longer exists
        LSEN = .FALSE. ! Tell AVL that valid sensitives no longer exists
        
 c---- initialize heap storage arrays for AIC's
-      call avlheap_init(NVOR)
-      call avlheap_diff_init(NVOR)
+      call avlheap_init(NVOR, LLOWMEM)
+c---- the derivative routines are not available in low memory mode
+      if (.not. LLOWMEM) call avlheap_diff_init(NVOR)
 C
        
       END 
@@ -812,6 +814,19 @@ C
       
       LVERBOSE = .FALSE.
       LTIMING = .FALSE.
+      LLOWMEM = .FALSE.
+C
+C---- direct LU solves of the AIC systems by default
+      LITSOLV = .FALSE.
+      GMRES_TOL = 1.0E-10
+      GMRES_MAXIT = 500
+      GMRES_NIT = 0
+C
+C---- clear the accumulated phase timings
+      DO IT = 1, ITTOT
+        TPHASE(IT) = 0.
+        NPHASE(IT) = 0
+      ENDDO
 C
 C---- flag for forces in standard NASA stability axes (as in Etkin)
       LNASA_SA  = .TRUE.
@@ -830,6 +845,7 @@ C
       LENC  = .FALSE.
 C
       LAIC  = .FALSE.
+      LAICBLK = .FALSE.
       LSRD  = .FALSE.
       LVEL  = .FALSE.
       LSOL  = .FALSE.
@@ -1,22 +1,29 @@
 !=============================================================================80
 ! Allocates AIC arrays that may be too big for COMMONS
 !=============================================================================80
-subroutine avlheap_init(n)
+subroutine avlheap_init(n, lowmem)
 
   use avl_heap_inc
   
   integer :: n
+  logical :: lowmem
 
 ! Allocate AIC variable storage
 ! Use heap_allocated flag instead of allocated() to avoid false positives
 ! when Fortran allocatable descriptors contain garbage with -fno-init-global-zero
 
+! In low memory mode the h.v. velocity matrices are not stored, 
+! the induced velocities are computed on the fly instead
+
   if (.not. heap_allocated) then
     allocate(AICN(n,n))
     allocate(AICN_LU(n,n))
-    allocate(WC_GAM(3,n,n))
-    allocate(WV_GAM(3,n,n))
+    if (.not. lowmem) then
+      allocate(WC_GAM(3,n,n))
+      allocate(WV_GAM(3,n,n))
+    endif
     heap_allocated = .TRUE.
+    heap_lowmem = lowmem
   endif
 
   NAIC = n
@@ -32,10 +39,18 @@ subroutine avlheap_clean()
 ! Deallocate heap storage for AIC's 
 
   if (heap_allocated) then
-    deallocate(AICN)
-    deallocate(AICN_LU)
-    deallocate(WC_GAM)
-    deallocate(WV_GAM)
+    if (heap_shared) then
+      ! the shared memory belongs to the process that created it
+      nullify(AICN, AICN_LU, WC_GAM, WV_GAM)
+      heap_shared = .FALSE.
+    else
+      deallocate(AICN)
+      deallocate(AICN_LU)
+      if (.not. heap_lowmem) then
+        deallocate(WC_GAM)
+        deallocate(WV_GAM)
+      endif
+    endif
     heap_allocated = .FALSE.
   endif
 
@@ -43,3 +58,95 @@ subroutine avlheap_clean()
 
 end subroutine avlheap_clean
 
+!=============================================================================80
+! Point the AIC arrays to memory shared with other processes
+!=============================================================================80
+subroutine avlheap_attach(aic_addr, aic_lu_addr, wc_addr, wv_addr, n, copy)
+
+  use iso_c_binding
+  use avl_heap_inc
+
+  integer(c_intptr_t) :: aic_addr, aic_lu_addr, wc_addr, wv_addr
+  integer :: n
+  logical :: copy
+
+! The memory must hold n x n values for AICN and AICN_LU and 3 x n x n values
+! for WC_GAM and WV_GAM (unless in low memory mode, then wc_addr and wv_addr
+! are not used). If copy is set, the current arrays are copied into it
+! first, which is how the process that owns the memory fills it.
+
+  REAL(8), DIMENSION(:,:), POINTER, CONTIGUOUS :: aic_shared, aic_lu_shared
+  REAL(8), DIMENSION(:,:,:), POINTER, CONTIGUOUS :: wc_shared, wv_shared
+
+  if (.not. heap_allocated .or. n .ne. NAIC) then
+    write(*,*) '*** avlheap_attach: size does not match the AIC arrays', n, NAIC
+    return
+  endif
+
+  call c_f_pointer(transfer(aic_addr, c_null_ptr), aic_shared, [n, n])
+  call c_f_pointer(transfer(aic_lu_addr, c_null_ptr), aic_lu_shared, [n, n])
+  if (copy) then
+    aic_shared = AICN
+    aic_lu_shared = AICN_LU
+  endif
+  if (.not. heap_lowmem) then
+    call c_f_pointer(transfer(wc_addr, c_null_ptr), wc_shared, [3, n, n])
+    call c_f_pointer(transfer(wv_addr, c_null_ptr), wv_shared, [3, n, n])
+    if (copy) then
+      wc_shared = WC_GAM
+      wv_shared = WV_GAM
+    endif
+  endif
+
+  ! free the private arrays
+  if (.not. heap_shared) then
+    deallocate(AICN)
+    deallocate(AICN_LU)
+    if (.not. heap_lowmem) then
+      deallocate(WC_GAM)
+      deallocate(WV_GAM)
+    endif
+  endif
+
+  AICN => aic_shared
+  AICN_LU => aic_lu_shared
+  if (.not. heap_lowmem) then
+    WC_GAM => wc_shared
+    WV_GAM => wv_shared
+  endif
+  heap_shared = .TRUE.
+
+end subroutine avlheap_attach
+
+!=============================================================================80
+! Give the AIC arrays private copies of the shared memory
+!=============================================================================80
+subroutine avlheap_unshare()
+
+  use avl_heap_inc
+
+! This is called before any of the arrays is written, so the memory
+! shared with other processes is only ever read
+
+  REAL(8), DIMENSION(:,:), POINTER, CONTIGUOUS :: aic_shared, aic_lu_shared
+  REAL(8), DIMENSION(:,:,:), POINTER, CONTIGUOUS :: wc_shared, wv_shared
+
+  if (.not. heap_shared) return
+
+  aic_shared => AICN
+  aic_lu_shared => AICN_LU
+  allocate(AICN(NAIC,NAIC))
+  allocate(AICN_LU(NAIC,NAIC))
+  AICN = aic_shared
+  AICN_LU = aic_lu_shared
+  if (.not. heap_lowmem) then
+    wc_shared => WC_GAM
+    wv_shared => WV_GAM
+    allocate(WC_GAM(3,NAIC,NAIC))
+    allocate(WV_GAM(3,NAIC,NAIC))
+    WC_GAM = wc_shared
+    WV_GAM = wv_shared
+  endif
+  heap_shared = .FALSE.
+
+end subroutine avlheap_unshare
@@ -9,19 +9,25 @@ module avl_heap_inc
   INTEGER :: NAIC = -1
   ! Explicit init ensures .data section placement (reliable with -fno-init-global-zero)
   LOGICAL :: heap_allocated = .FALSE.
+  ! T if WC_GAM and WV_GAM were not allocated (low memory mode)
+  LOGICAL :: heap_lowmem = .FALSE.
+  ! T if the arrays point to memory shared with other processes (see avlheap_attach)
+  LOGICAL :: heap_shared = .FALSE.
 
+! The arrays are pointers so that they can also be attached to shared memory,
+! they are contiguous either way
 ! All non-constant variables are declared as threadprivate for OpenMP
  ! warning! hardcoding precision!
-  REAL(8), DIMENSION(:,:), ALLOCATABLE :: AICN
+  REAL(8), DIMENSION(:,:), POINTER, CONTIGUOUS :: AICN => NULL()
 !!  !$omp threadprivate(AICN)
 
-  REAL(8), DIMENSION(:,:), ALLOCATABLE :: AICN_LU
+  REAL(8), DIMENSION(:,:), POINTER, CONTIGUOUS :: AICN_LU => NULL()
 !!  !$omp threadprivate(AICN_LU)
 
-  REAL(8), DIMENSION(:,:,:), ALLOCATABLE :: WC_GAM
+  REAL(8), DIMENSION(:,:,:), POINTER, CONTIGUOUS :: WC_GAM => NULL()
 !!  !$omp threadprivate(WC_GAM)
 
-  REAL(8), DIMENSION(:,:,:), ALLOCATABLE :: WV_GAM
+  REAL(8), DIMENSION(:,:,:), POINTER, CONTIGUOUS :: WV_GAM => NULL()
 !!  !$omp threadprivate(WV_GAM)
   
 
@@ -0,0 +1,40 @@
+/* Runtime control of the number of threads used by the BLAS/LAPACK library
+ * that optvl is linked with (see the `blas` and `lapack` meson options).
+ * The reference LAPACK routines in src/lapack are single threaded,
+ * so the calls do nothing when no optimized library was found. */
+
+#if defined(OPTVL_OPENBLAS)
+void openblas_set_num_threads(int num_threads);
+int openblas_get_num_threads(void);
+#elif defined(OPTVL_MKL)
+void MKL_Set_Num_Threads(int num_threads);
+int MKL_Get_Max_Threads(void);
+#endif
+
+void set_blas_threads_(int *num_threads) {
+#if defined(OPTVL_OPENBLAS)
+  openblas_set_num_threads(*num_threads);
+#elif defined(OPTVL_MKL)
+  MKL_Set_Num_Threads(*num_threads);
+#else
+  (void)num_threads;
+#endif
+}
+
+void get_blas_threaded_(int *threaded) {
+#if defined(OPTVL_OPENBLAS) || defined(OPTVL_MKL)
+  *threaded = 1;
+#else
+  *threaded = 0;
+#endif
+}
+
+void get_blas_threads_(int *num_threads) {
+#if defined(OPTVL_OPENBLAS)
+  *num_threads = openblas_get_num_threads();
+#elif defined(OPTVL_MKL)
+  *num_threads = MKL_Get_Max_Threads();
+#else
+  *num_threads = 1;
+#endif
+}
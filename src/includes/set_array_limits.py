@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Write ADIMEN.INC with the static array limits (NVMAX, NSMAX, NFMAX) of the build.
+
+All of the common blocks in AVL.INC and their _DIFF twins are dimensioned with these limits,
+so models larger than the defaults need a build with larger values. The AIC matrices in
+avl_heap_inc are already allocated from the actual number of vortices and do not depend on them,
+but the NVMAX literal repeated in the heap modules is kept in sync.
+
+This is called by meson.build with the values of the `nvmax`, `nsmax` and `nfmax` build options, e.g.
+
+    pip install . -Csetup-args=-Dnvmax=20000 -Csetup-args=-Dnsmax=2000
+
+The committed files are only read. The files with the new limits are written to the output
+directory (the build directory), which is searched for include files before src/includes.
+A value of 0 keeps the limit of the committed ADIMEN.INC.
+"""
+
+import argparse
+import os
+import re
+
+
+def read_limits(adimen_file):
+    limits = {}
+    with open(adimen_file, "r") as fid:
+        for line in fid:
+            match = re.match(r"\s*PARAMETER\s*\(\s*(\w+)\s*=\s*(\d+)\s*\)", line, re.IGNORECASE)
+            if match:
+                limits[match.group(1).upper()] = int(match.group(2))
+    return limits
+
+
+def check_limits(limits):
+    # clear_ad_seeds_fast in optvl_class.py finds the vortex, strip, section, surface, and
+    # airfoil point dimensions of the seed arrays by their size, so these must all be different
+    sizes = {
+        "NVMAX": limits["NVMAX"],
+        "4*NVMAX": 4 * limits["NVMAX"],
+        "NSMAX": limits["NSMAX"],
+        "NSECMAX": limits["NSECMAX"],
+        "NFMAX": limits["NFMAX"],
+        "NASMAX": limits["NASMAX"],
+    }
+    for key1, val1 in sizes.items():
+        for key2, val2 in sizes.items():
+            if key1 < key2 and val1 == val2:
+                raise ValueError(f"{key1} and {key2} are both {val1}. The array limits must all have different values")
+
+
+def set_limits(contents, new_limits, file_name):
+    for key, val in new_limits.items():
+        contents, num_subs = re.subn(
+            rf"(PARAMETER\s*\(\s*{key}\s*=\s*)\d+", rf"\g<1>{val}", contents, flags=re.IGNORECASE
+        )
+        if num_subs != 1:
+            raise ValueError(f"could not find the PARAMETER statement for {key} in {file_name}")
+
+    return contents
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("adimen_file", help="committed ADIMEN.INC to take the other limits from")
+    parser.add_argument("heap_files", nargs="*", help="heap modules with a copy of NVMAX")
+    parser.add_argument("--nvmax", type=int, default=0, help="max number of horseshoe vortices")
+    parser.add_argument("--nsmax", type=int, default=0, help="max number of chord strips")
+    parser.add_argument("--nfmax", type=int, default=0, help="max number of surfaces")
+    parser.add_argument("--outdir", required=True, help="directory to write ADIMEN.INC and the heap modules to")
+    args = parser.parse_args()
+
+    new_limits = {"NVMAX": args.nvmax, "NSMAX": args.nsmax, "NFMAX": args.nfmax}
+    new_limits = {key: val for key, val in new_limits.items() if val > 0}
+
+    limits = read_limits(args.adimen_file)
+    limits.update(new_limits)
+    check_limits(limits)
+
+    with open(args.adimen_file, "r") as fid:
+        contents = set_limits(fid.read(), new_limits, args.adimen_file)
+    with open(os.path.join(args.outdir, "ADIMEN.INC"), "w") as fid:
+        fid.write(contents)
+
+    for heap_file in args.heap_files:
+        with open(heap_file, "r") as fid:
+            contents = re.sub(r"(NVX\s*=\s*)\d+", rf"\g<1>{limits['NVMAX']}", fid.read())
+        with open(os.path.join(args.outdir, os.path.basename(heap_file)), "w") as fid:
+            fid.write(contents)
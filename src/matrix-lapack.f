@@ -45,4 +45,33 @@ C
       END ! BAKSUB
 
 
+      SUBROUTINE BAKSUB_MRHS(NSIZ,N,A,INDX,MRHS,B,LDB)
+      DIMENSION A(NSIZ,NSIZ), B(LDB,MRHS), INDX(NSIZ)
+C     *******************************************************
+C     *   Back-substitution of MRHS right-hand sides, the   *
+C     *   columns of B with leading dimension LDB, at once  *
+C     *   using stored LU decomposition.                    *
+C     *   Uses LAPACK routines for linear algebra           *
+C     *******************************************************
+C
+      CALL SGETRS('N',N,MRHS,A,NSIZ,INDX,B,LDB,INFO)
+C
+      RETURN
+      END ! BAKSUB_MRHS
+
+
+      SUBROUTINE BAKSUBTRANS_MRHS(NSIZ,N,A,INDX,MRHS,B)
+      DIMENSION A(NSIZ,NSIZ), B(NSIZ,MRHS), INDX(NSIZ)
+C     *******************************************************
+C     *   Transposed back-substitution of MRHS right-hand   *
+C     *   sides at once using stored LU decomposition.      *
+C     *   Uses LAPACK routines for linear algebra           *
+C     *******************************************************
+C
+      CALL SGETRS('T',N,MRHS,A,NSIZ,INDX,B,NSIZ,INFO)
+C
+      RETURN
+      END ! BAKSUBTRANS_MRHS
+
+
 
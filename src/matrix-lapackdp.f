@@ -49,4 +49,35 @@ C
       END ! BAKSUB
 
 
+      SUBROUTINE BAKSUB_MRHS(NSIZ,N,A,INDX,MRHS,B,LDB)
+      REAL A(NSIZ,NSIZ), B(LDB,MRHS)
+      INTEGER INDX(NSIZ)
+C     *******************************************************
+C     *   Back-substitution of MRHS right-hand sides, the   *
+C     *   columns of B with leading dimension LDB, at once  *
+C     *   using stored LU decomposition.                    *
+C     *   Uses LAPACK routines for linear algebra           *
+C     *******************************************************
+C
+      CALL DGETRS('N',N,MRHS,A,NSIZ,INDX,B,LDB,INFO)
+C
+      RETURN
+      END ! BAKSUB_MRHS
+
+
+      SUBROUTINE BAKSUBTRANS_MRHS(NSIZ,N,A,INDX,MRHS,B)
+      REAL A(NSIZ,NSIZ), B(NSIZ,MRHS)
+      INTEGER INDX(NSIZ)
+C     *******************************************************
+C     *   Transposed back-substitution of MRHS right-hand   *
+C     *   sides at once using stored LU decomposition.      *
+C     *   Uses LAPACK routines for linear algebra           *
+C     *******************************************************
+C
+      CALL DGETRS('T',N,MRHS,A,NSIZ,INDX,B,NSIZ,INFO)
+C
+      RETURN
+      END ! BAKSUBTRANS_MRHS
+
+
 
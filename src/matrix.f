@@ -163,3 +163,29 @@ C
       RETURN
       END ! BAKSUBTRANS
 
+
+      SUBROUTINE BAKSUB_MRHS(NSIZ,N,A,INDX,MRHS,B,LDB)
+        REAL A(NSIZ,NSIZ), B(LDB,MRHS)
+        INTEGER INDX(NSIZ)
+C
+        ! Solve A * X = B for each of the MRHS columns of B
+        do k = 1, MRHS
+            call BAKSUB(NSIZ,N,A,INDX,B(1,k))
+        enddo
+C
+      RETURN
+      END ! BAKSUB_MRHS
+
+
+      SUBROUTINE BAKSUBTRANS_MRHS(NSIZ,N,A,INDX,MRHS,B)
+        REAL A(NSIZ,NSIZ), B(NSIZ,MRHS)
+        INTEGER INDX(NSIZ)
+C
+        ! Solve A**T * X = B for each of the MRHS columns of B
+        do k = 1, MRHS
+            call BAKSUBTRANS(NSIZ,N,A,INDX,B(1,k))
+        enddo
+C
+      RETURN
+      END ! BAKSUBTRANS_MRHS
+
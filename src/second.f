@@ -4,7 +4,8 @@ C
 C...Returns elapsed wall-clock time in seconds
 C   Replacement for non-standard SECNDS intrinsic
 C
-      INTEGER COUNT, COUNT_RATE
+C   (8-byte counts give the finest resolution the system clock has)
+      INTEGER*8 COUNT, COUNT_RATE
       CALL SYSTEM_CLOCK(COUNT, COUNT_RATE)
       TSEC = DBLE(COUNT) / DBLE(COUNT_RATE)
       END
\ No newline at end of file
@@ -5,6 +5,7 @@ from ovl_avl_comparison_utils import run_comparison, set_inputs, get_avl_output_
 # Standard Python modules
 import os
 import json
+import tempfile
 
 # External Python modules
 import unittest
@@ -97,5 +98,564 @@ class TestConstrained(unittest.TestCase):
             run_comparison(ovl, ref_data_cases, rtol=avl_match_rtol, atol=avl_match_atol)
 
 
+class TestAICReuse(unittest.TestCase):
+    """Sequential runs reuse the factored AIC until the geometry, Mach, or Xref change"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=os.path.join(geom_dir, "rect_with_body.avl"))
+
+    def run_fresh(self, alpha, params):
+        ovl = OVLSolver(geo_file=os.path.join(geom_dir, "rect_with_body.avl"))
+        for key, val in params.items():
+            ovl.set_parameter(key, val)
+        ovl.set_variable("alpha", alpha)
+        ovl.execute_run()
+        return ovl.get_total_forces(), ovl.get_stab_derivs()
+
+    def check_against_fresh(self, alpha, params):
+        force_data = self.ovl.get_total_forces()
+        stab_derivs = self.ovl.get_stab_derivs()
+        force_data_ref, stab_derivs_ref = self.run_fresh(alpha, params)
+        for key in force_data:
+            np.testing.assert_allclose(force_data[key], force_data_ref[key], rtol=1e-14, atol=1e-14, err_msg=key)
+        for key in stab_derivs:
+            np.testing.assert_allclose(stab_derivs[key], stab_derivs_ref[key], rtol=1e-14, atol=1e-14, err_msg=key)
+
+    def test_alpha_sweep(self):
+        self.ovl.execute_run()
+        for alpha in [1.0, 3.0, 5.0]:
+            self.ovl.set_variable("alpha", alpha)
+            self.ovl.execute_run()
+            self.assertTrue(self.ovl.get_avl_fort_arr("CASE_L", "LAIC"))
+            self.check_against_fresh(alpha, {})
+
+    def test_param_change(self):
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+        params = {}
+        for key, val in [("Mach", 0.3), ("X cg", 0.4)]:
+            params[key] = val
+            self.ovl.set_parameter(key, val)
+            self.ovl.execute_run()
+            self.check_against_fresh(3.0, params)
+
+    def test_geom_change(self):
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+        self.ovl.set_surface_param("Wing", "aincs", self.ovl.get_surface_param("Wing", "aincs") + 1.0)
+        self.assertFalse(self.ovl.get_avl_fort_arr("CASE_L", "LAIC"))
+        self.ovl.execute_run()
+        CL_mod = self.ovl.get_total_forces()["CL"]
+        force_data_ref, _ = self.run_fresh(3.0, {})
+        self.assertGreater(CL_mod, force_data_ref["CL"])
+
+
+class TestRunBatch(unittest.TestCase):
+    """A batch of operating points gives the same results as running the points one at a time"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        self.alphas = np.array([-2.0, 1.0, 4.0, 7.0])
+
+    def check_point(self, batch_data, idx_point):
+        force_data = self.ovl_ref.get_total_forces()
+        for key in force_data:
+            np.testing.assert_allclose(batch_data[key][idx_point], force_data[key], rtol=1e-14, atol=1e-14, err_msg=key)
+        stab_derivs = self.ovl_ref.get_stab_derivs()
+        stab_derivs.update(self.ovl_ref.get_control_stab_derivs())
+        for key in stab_derivs:
+            np.testing.assert_allclose(batch_data[key][idx_point], stab_derivs[key], rtol=1e-14, atol=1e-14, err_msg=key)
+        for con_surf, val in self.ovl_ref.get_control_deflections().items():
+            np.testing.assert_allclose(batch_data[con_surf][idx_point], val, rtol=1e-14, atol=1e-14, err_msg=con_surf)
+
+    def test_unconstrained(self):
+        elev = np.array([0.0, 2.0, -3.0, 1.0])
+        batch_data = self.ovl.execute_run_batch(
+            {"alpha": self.alphas, "beta": np.full(4, 1.0), "elevator": elev}, stab_derivs=True, strip_forces=["CL"]
+        )
+        self.assertEqual(batch_data.shape, (4,))
+        for idx_point, alpha in enumerate(self.alphas):
+            self.ovl_ref.set_variable("alpha", alpha)
+            self.ovl_ref.set_variable("beta", 1.0)
+            self.ovl_ref.set_control_deflection("elevator", elev[idx_point])
+            self.ovl_ref.execute_run()
+            self.check_point(batch_data, idx_point)
+
+            strip_data = self.ovl_ref.get_strip_forces()
+            strip_cl = np.concatenate([strip_data[surf]["CL"] for surf in self.ovl_ref.surface_names])
+            np.testing.assert_allclose(batch_data["strips"]["CL"][idx_point], strip_cl, rtol=1e-14, atol=1e-14)
+
+    def test_trimmed(self):
+        batch_data = self.ovl.execute_run_batch(
+            {"alpha": self.alphas, "elevator": ("Cm", np.zeros(4))}, stab_derivs=True
+        )
+        self.assertTrue(np.all(batch_data["converged"]))
+        np.testing.assert_allclose(batch_data["Cm"], 0.0, atol=1e-8)
+        for idx_point, alpha in enumerate(self.alphas):
+            self.ovl_ref.set_variable("alpha", alpha)
+            self.ovl_ref.set_constraint("elevator", "Cm", 0.0)
+            self.ovl_ref.execute_run()
+            self.check_point(batch_data, idx_point)
+
+    def test_structured_input(self):
+        conditions = np.zeros(2, dtype=[("alpha", float), ("pitch rate", float)])
+        conditions["alpha"] = [1.0, 3.0]
+        conditions["pitch rate"] = [0.0, 0.05]
+        batch_data = self.ovl.execute_run_batch(conditions)
+        np.testing.assert_allclose(batch_data["alpha"], conditions["alpha"], rtol=1e-14)
+        np.testing.assert_allclose(batch_data["pitch rate"], conditions["pitch rate"], rtol=1e-14)
+
+        with self.assertRaises(ValueError):
+            self.ovl.execute_run_batch({"alpha": [1.0, 2.0], "beta": [0.0]})
+
+
+class TestWarmStart(unittest.TestCase):
+    """Warm started runs reuse the forces of the last converged trim and give the same results"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        for ovl in [self.ovl, self.ovl_ref]:
+            ovl.set_constraint("elevator", "Cm", 0.0)
+
+    def run_point(self, ovl, CL, warm_start):
+        ovl.set_constraint("alpha", "CL", CL)
+        ovl.reset_timings()
+        ovl.execute_run(tol=1e-10, warm_start=warm_start)
+        self.assertTrue(ovl.get_avl_fort_arr("CASE_L", "LSOL"))
+        return ovl.get_timings()["aero"]["calls"]
+
+    def is_warm_started(self):
+        # a warm started run does not evaluate the forces before the first Newton step
+        timings = self.ovl.get_timings()
+        return timings["aero"]["calls"] == timings["trim_solve"]["calls"]
+
+    def check_against_ref(self):
+        force_data = self.ovl.get_total_forces()
+        force_data_ref = self.ovl_ref.get_total_forces()
+        for key in force_data_ref:
+            np.testing.assert_allclose(force_data[key], force_data_ref[key], rtol=1e-10, atol=1e-10, err_msg=key)
+        np.testing.assert_allclose(
+            self.ovl.get_variable("alpha"), self.ovl_ref.get_variable("alpha"), rtol=1e-10, atol=1e-10
+        )
+        np.testing.assert_allclose(
+            self.ovl.get_control_deflections()["elevator"],
+            self.ovl_ref.get_control_deflections()["elevator"],
+            rtol=1e-10,
+            atol=1e-10,
+        )
+
+    def test_cl_sweep(self):
+        num_calls = 0
+        num_calls_ref = 0
+        for idx_point, CL in enumerate(np.linspace(0.6, 0.8, 5)):
+            num_calls += self.run_point(self.ovl, CL, True)
+            num_calls_ref += self.run_point(self.ovl_ref, CL, False)
+            self.assertEqual(self.is_warm_started(), idx_point > 0)
+            self.check_against_ref()
+
+        self.assertLess(num_calls, num_calls_ref)
+
+    def test_invalid_state(self):
+        self.run_point(self.ovl, 0.6, True)
+
+        # a new cg location changes the moments
+        self.ovl.set_parameter("X cg", self.ovl.get_parameter("X cg") + 0.01)
+        self.run_point(self.ovl, 0.6, True)
+        self.assertFalse(self.is_warm_started())
+
+        # so does a new geometry
+        self.ovl.set_surface_param("Inner Wing", "aincs", self.ovl.get_surface_param("Inner Wing", "aincs") + 0.5)
+        self.run_point(self.ovl, 0.6, True)
+        self.assertFalse(self.is_warm_started())
+
+        # the velocity does not change the forces
+        self.ovl.set_parameter("velocity", 20.0)
+        self.run_point(self.ovl, 0.65, True)
+        self.assertTrue(self.is_warm_started())
+
+        self.run_point(self.ovl, 0.65, False)
+        self.assertFalse(self.is_warm_started())
+
+
+class TestContinuationSweep(unittest.TestCase):
+    """The points of a continuation sweep match separate runs at the same constraint values"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        for ovl in [self.ovl, self.ovl_ref]:
+            ovl.set_constraint("elevator", "Cm", 0.0)
+
+    def check_points(self, sweep_data, var, con_var):
+        self.assertTrue(np.all(sweep_data["converged"]))
+        for point_data in sweep_data:
+            self.ovl_ref.set_constraint(var, con_var, float(point_data[con_var]))
+            self.ovl_ref.execute_run(tol=1e-10)
+            force_data = self.ovl_ref.get_total_forces()
+            for key in ["CL", "CD", "Cm"]:
+                np.testing.assert_allclose(point_data[key], force_data[key], rtol=1e-8, atol=1e-8, err_msg=key)
+            np.testing.assert_allclose(point_data["alpha"], self.ovl_ref.get_variable("alpha"), rtol=1e-8)
+            np.testing.assert_allclose(
+                point_data["elevator"], self.ovl_ref.get_control_deflections()["elevator"], rtol=1e-8, atol=1e-8
+            )
+
+    def test_cl_sweep(self):
+        self.ovl.set_constraint("alpha", "CL", 0.4)
+        sweep_data = self.ovl.continuation_sweep("CL", 0.4, 1.2, step=0.05, tol=1e-10)
+
+        # CL is summed from the forces of the trim, so it only matches the target to round-off
+        np.testing.assert_allclose(sweep_data["CL"][[0, -1]], [0.4, 1.2], rtol=1e-14)
+        self.assertTrue(np.all(np.diff(sweep_data["CL"]) > 0))
+        # the step grows along the nearly linear trim curve
+        self.assertLess(len(sweep_data), 16)
+        self.check_points(sweep_data, "alpha", "CL")
+
+    def test_alpha_sweep(self):
+        sweep_data = self.ovl.continuation_sweep("alpha", 6.0, -2.0, tol=1e-10)
+        np.testing.assert_allclose(sweep_data["alpha"][[0, -1]], [6.0, -2.0], rtol=1e-14)
+        self.check_points(sweep_data, "alpha", "alpha")
+
+    def test_limit(self):
+        # without the elevator, CL can only be reached by alpha, which is limited to 90 deg
+        self.ovl.set_constraint("elevator", "elevator", 0.0)
+        self.ovl.set_constraint("alpha", "CL", 1.0)
+        with self.assertWarns(UserWarning):
+            sweep_data = self.ovl.continuation_sweep("CL", 1.0, 100.0)
+
+        self.assertTrue(np.all(sweep_data["converged"]))
+        self.assertLess(sweep_data["CL"][-1], 100.0)
+        # the solver is left at the last converged point
+        np.testing.assert_allclose(self.ovl.get_total_forces()["CL"], sweep_data["CL"][-1], rtol=1e-8)
+
+    def test_bad_constraint(self):
+        with self.assertRaises(ValueError):
+            self.ovl.continuation_sweep("CD", 0.0, 1.0)
+        with self.assertRaises(ValueError):
+            self.ovl.continuation_sweep("CL", 0.4, 1.0)
+
+
+class TestLowMemory(unittest.TestCase):
+    """The low memory mode gives the same results without storing the velocity influence matrices"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, low_memory=True)
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+
+    def test_trimmed(self):
+        for ovl in [self.ovl, self.ovl_ref]:
+            ovl.set_variable("alpha", 4.0)
+            ovl.set_variable("beta", 2.0)
+            ovl.set_constraint("elevator", "Cm", 0.0)
+            ovl.execute_run()
+
+        for getter in ["get_total_forces", "get_stab_derivs", "get_control_stab_derivs"]:
+            data = getattr(self.ovl, getter)()
+            data_ref = getattr(self.ovl_ref, getter)()
+            for key in data_ref:
+                np.testing.assert_allclose(data[key], data_ref[key], rtol=1e-12, atol=1e-12, err_msg=key)
+
+    def test_no_derivs(self):
+        self.ovl.execute_run()
+        with self.assertRaises(RuntimeError):
+            self.ovl.execute_run_sensitivities(["CL"])
+
+
+class TestIterativeSolver(unittest.TestCase):
+    """The GMRES solver gives the same results as the dense LU factorization"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, linear_solver="gmres")
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+
+    def test_trimmed(self):
+        for ovl in [self.ovl, self.ovl_ref]:
+            ovl.set_variable("alpha", 4.0)
+            ovl.set_variable("beta", 2.0)
+            ovl.set_constraint("elevator", "Cm", 0.0)
+            ovl.execute_run()
+
+        self.assertGreater(self.ovl.get_avl_fort_arr("GMRES_I", "GMRES_NIT"), 0)
+        for getter in ["get_total_forces", "get_stab_derivs", "get_control_stab_derivs"]:
+            data = getattr(self.ovl, getter)()
+            data_ref = getattr(self.ovl_ref, getter)()
+            for key in data_ref:
+                np.testing.assert_allclose(data[key], data_ref[key], rtol=1e-7, atol=1e-8, err_msg=key)
+
+    def test_sensitivities(self):
+        funcs = ["CL", "CD", "Cm"]
+        sens = {}
+        for ovl in [self.ovl, self.ovl_ref]:
+            ovl.set_variable("alpha", 4.0)
+            ovl.execute_run()
+            sens[ovl] = ovl.execute_run_sensitivities(funcs)
+
+        for func in funcs:
+            for key, val in sens[self.ovl_ref][func].items():
+                if isinstance(val, dict):
+                    for sub_key in val:
+                        np.testing.assert_allclose(
+                            sens[self.ovl][func][key][sub_key], val[sub_key], rtol=1e-6, atol=1e-8, err_msg=sub_key
+                        )
+                else:
+                    np.testing.assert_allclose(sens[self.ovl][func][key], val, rtol=1e-6, atol=1e-8, err_msg=key)
+
+    def test_switch_solver(self):
+        self.ovl.set_variable("alpha", 4.0)
+        self.ovl.execute_run()
+        CL = self.ovl.get_total_forces()["CL"]
+
+        self.ovl.set_linear_solver("direct")
+        self.assertFalse(self.ovl.get_avl_fort_arr("CASE_L", "LAIC"))
+        self.ovl.execute_run()
+        np.testing.assert_allclose(self.ovl.get_total_forces()["CL"], CL, rtol=1e-8)
+
+        with self.assertRaises(ValueError):
+            self.ovl.set_linear_solver("cholesky")
+
+    def test_not_converged(self):
+        self.ovl.set_linear_solver("gmres", maxiter=1)
+        self.ovl.set_variable("alpha", 4.0)
+        with self.assertWarns(UserWarning):
+            self.ovl.execute_run()
+        self.assertGreater(self.ovl.get_avl_fort_arr("GMRES_I", "GMRES_NFAIL"), 0)
+        self.assertFalse(self.ovl.get_avl_fort_arr("CASE_L", "LSOL"))
+        # the unconverged solution is not used to warm start the next run
+        self.assertFalse(self.ovl.get_avl_fort_arr("CASE_L", "LWSOL"))
+
+        with self.assertWarns(UserWarning):
+            self.ovl.execute_run_sensitivities(["CL"])
+
+        # the unit solutions are solved again once GMRES can converge
+        self.ovl.set_linear_solver("gmres")
+        self.ovl.execute_run()
+        self.assertEqual(self.ovl.get_avl_fort_arr("GMRES_I", "GMRES_NFAIL"), 0)
+        self.assertTrue(self.ovl.get_avl_fort_arr("CASE_L", "LSOL"))
+        self.ovl_ref.set_variable("alpha", 4.0)
+        self.ovl_ref.execute_run()
+        np.testing.assert_allclose(self.ovl.get_total_forces()["CL"], self.ovl_ref.get_total_forces()["CL"], rtol=1e-7)
+
+
+class TestNumThreads(unittest.TestCase):
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, num_threads=1)
+
+    def test_set(self):
+        if not self.ovl.is_blas_threaded():
+            self.skipTest("the reference LAPACK routines are single threaded")
+
+        self.assertEqual(self.ovl.get_num_threads(), 1)
+        self.ovl.set_num_threads(2)
+        self.assertEqual(self.ovl.get_num_threads(), 2)
+        self.ovl.set_num_threads(1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.ovl.set_num_threads(0)
+
+
+class TestTimings(unittest.TestCase):
+    """The phase timings accumulate across runs and can be reset"""
+
+    def setUp(self):
+        self.ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+
+    def test_accumulate(self):
+        self.ovl.set_variable("alpha", 3.0)
+        self.ovl.execute_run()
+        self.ovl.execute_run()
+        self.ovl.execute_run_sensitivities(["CL"])
+
+        timings = self.ovl.get_timings()
+        self.assertEqual(timings["exec"]["calls"], 2)
+        # the AIC is only built and factored once
+        self.assertEqual(timings["build_aic"]["calls"], 1)
+        self.assertEqual(timings["factor_aic"]["calls"], 1)
+        self.assertEqual(timings["adjoint_solve"]["calls"], 1)
+        self.assertEqual(timings["sens_combine"]["calls"], 1)
+        self.assertGreater(timings["exec"]["time"], 0.0)
+        self.assertGreaterEqual(timings["exec"]["time"], timings["factor_aic"]["time"])
+
+    def test_reset(self):
+        self.ovl.execute_run()
+        self.ovl.reset_timings()
+        for phase, timing in self.ovl.get_timings().items():
+            self.assertEqual(timing["calls"], 0, msg=phase)
+            self.assertEqual(timing["time"], 0.0, msg=phase)
+
+        self.ovl.execute_run()
+        self.assertEqual(self.ovl.get_timings()["exec"]["calls"], 1)
+
+
+class TestAICCache(unittest.TestCase):
+    """Solvers with a cache directory read the AIC of a lattice back instead of rebuilding it"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_trimmed(self, **kwargs):
+        ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, **kwargs)
+        ovl.set_variable("alpha", 4.0)
+        ovl.set_variable("beta", 2.0)
+        ovl.set_constraint("elevator", "Cm", 0.0)
+        ovl.execute_run()
+        return ovl
+
+    def check_against_ref(self, ovl, ovl_ref):
+        for getter in ["get_total_forces", "get_stab_derivs", "get_control_stab_derivs"]:
+            data = getattr(ovl, getter)()
+            data_ref = getattr(ovl_ref, getter)()
+            for key in data_ref:
+                np.testing.assert_allclose(data[key], data_ref[key], rtol=1e-14, atol=1e-14, err_msg=key)
+
+    def test_reuse(self):
+        ovl_ref = self.run_trimmed()
+        self.run_trimmed(cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        ovl = self.run_trimmed(cache_dir=self.cache_dir)
+        timings = ovl.get_timings()
+        self.assertEqual(timings["build_aic"]["calls"], 0)
+        self.assertEqual(timings["velocity_matrix"]["calls"], 0)
+        self.assertEqual(timings["factor_aic"]["calls"], 0)
+        self.check_against_ref(ovl, ovl_ref)
+
+        # the derivative routines work from the loaded matrices as well
+        sens = ovl.execute_run_sensitivities(["CL", "Cm"])
+        sens_ref = ovl_ref.execute_run_sensitivities(["CL", "Cm"])
+        for func in sens_ref:
+            for key, val in sens_ref[func].items():
+                if isinstance(val, dict):
+                    for sub_key in val:
+                        np.testing.assert_allclose(sens[func][key][sub_key], val[sub_key], rtol=1e-12, atol=1e-14)
+                else:
+                    np.testing.assert_allclose(sens[func][key], val, rtol=1e-12, atol=1e-14, err_msg=key)
+
+    def test_mach_change(self):
+        ovl = self.run_trimmed(cache_dir=self.cache_dir)
+        ovl.set_parameter("Mach", 0.3)
+        ovl.execute_run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        ovl_ref = self.run_trimmed()
+        ovl_ref.set_parameter("Mach", 0.3)
+        ovl_ref.execute_run()
+
+        ovl = self.run_trimmed(cache_dir=self.cache_dir)
+        ovl.set_parameter("Mach", 0.3)
+        ovl.execute_run()
+        self.assertEqual(ovl.get_timings()["factor_aic"]["calls"], 0)
+        self.check_against_ref(ovl, ovl_ref)
+
+    def test_geom_change(self):
+        ovl = self.run_trimmed(cache_dir=self.cache_dir)
+        surf = ovl.get_surface_names()[0]
+        ovl.set_surface_param(surf, "aincs", ovl.get_surface_param(surf, "aincs") + 1.0)
+        ovl.execute_run()
+        # the incidence only changes the normals, which the AIC depends on
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_low_memory(self):
+        ovl_ref = self.run_trimmed(low_memory=True)
+        self.run_trimmed(cache_dir=self.cache_dir, low_memory=True)
+        ovl = self.run_trimmed(cache_dir=self.cache_dir, low_memory=True)
+        self.assertEqual(ovl.get_timings()["factor_aic"]["calls"], 0)
+        self.check_against_ref(ovl, ovl_ref)
+
+        # the entries of the two modes hold different matrices
+        self.run_trimmed(cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+
+class TestSharedAIC(unittest.TestCase):
+    """Solvers attached to the AIC shared by another solver do not build or factor it themselves"""
+
+    def setUp(self):
+        self.ovl_owner = self.run_trimmed()
+        self.shared_aic = self.ovl_owner.share_aic()
+
+    def tearDown(self):
+        self.ovl_owner.release_shared_aic()
+
+    def run_trimmed(self, ovl=None, **kwargs):
+        if ovl is None:
+            ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, **kwargs)
+        ovl.set_variable("alpha", 4.0)
+        ovl.set_variable("beta", 2.0)
+        ovl.set_constraint("elevator", "Cm", 0.0)
+        ovl.execute_run()
+        return ovl
+
+    def check_against_ref(self, ovl, ovl_ref):
+        for getter in ["get_total_forces", "get_stab_derivs", "get_control_stab_derivs"]:
+            data = getattr(ovl, getter)()
+            data_ref = getattr(ovl_ref, getter)()
+            for key in data_ref:
+                np.testing.assert_allclose(data[key], data_ref[key], rtol=1e-14, atol=1e-14, err_msg=key)
+
+    def test_attach(self):
+        ovl_ref = self.run_trimmed()
+
+        ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        ovl.attach_shared_aic(self.shared_aic)
+        self.run_trimmed(ovl)
+        timings = ovl.get_timings()
+        self.assertEqual(timings["build_aic"]["calls"], 0)
+        self.assertEqual(timings["factor_aic"]["calls"], 0)
+        self.check_against_ref(ovl, ovl_ref)
+
+        # the owner keeps using the matrices it shared
+        self.ovl_owner.set_variable("alpha", 5.0)
+        self.ovl_owner.execute_run()
+        ovl.set_variable("alpha", 5.0)
+        ovl.execute_run()
+        self.check_against_ref(ovl, self.ovl_owner)
+
+    def test_geom_change(self):
+        ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        ovl.attach_shared_aic(self.shared_aic)
+        self.run_trimmed(ovl)
+
+        # the attached solver rebuilds the AIC in its own memory, which leaves the shared one as it was
+        surf = ovl.get_surface_names()[0]
+        aincs = ovl.get_surface_param(surf, "aincs") + 1.0
+        ovl.set_surface_param(surf, "aincs", aincs)
+        ovl.execute_run()
+
+        ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        ovl_ref.set_surface_param(surf, "aincs", aincs)
+        self.run_trimmed(ovl_ref)
+        self.check_against_ref(ovl, ovl_ref)
+
+        ovl_attached = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        ovl_attached.attach_shared_aic(self.shared_aic)
+        self.run_trimmed(ovl_attached)
+        self.check_against_ref(ovl_attached, self.ovl_owner)
+
+    def test_mismatch(self):
+        ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        ovl.set_parameter("Mach", 0.3)
+        with self.assertRaises(ValueError):
+            ovl.attach_shared_aic(self.shared_aic)
+
+        ovl = OVLSolver(geo_file=geom_file, mass_file=mass_file, low_memory=True)
+        with self.assertRaises(ValueError):
+            ovl.attach_shared_aic(self.shared_aic)
+
+    def test_release(self):
+        ovl_ref = self.run_trimmed()
+
+        # the owner gets a private copy of the matrices back
+        self.ovl_owner.release_shared_aic()
+        self.run_trimmed(self.ovl_owner)
+        self.assertEqual(self.ovl_owner.get_timings()["factor_aic"]["calls"], 1)
+        self.check_against_ref(self.ovl_owner, ovl_ref)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -200,14 +200,16 @@ class TestConSurfDerivsPartials(unittest.TestCase):
         for con_key in self.ovl_solver.con_var_to_fort_var:
             cs_d = self.ovl_solver._execute_jac_vec_prod_fwd(con_seeds={con_key: 1.0})[2]
 
-            cs_d_fd = self.ovl_solver._execute_jac_vec_prod_fwd(con_seeds={con_key: 1.0}, mode="FD", step=1e-8)[2]
+            # some of the derivatives are small (e.g. ~1e-8 for dCD/dElevator wrt beta), so a smaller step
+            # would only measure round-off, which also depends on the BLAS/LAPACK library
+            cs_d_fd = self.ovl_solver._execute_jac_vec_prod_fwd(con_seeds={con_key: 1.0}, mode="FD", step=1e-5)[2]
 
             for deriv_func in cs_d:
                 sens_label = f"d{deriv_func} wrt {con_key}"
                 np.testing.assert_allclose(
                     cs_d[deriv_func],
                     cs_d_fd[deriv_func],
-                    rtol=1e-3,
+                    rtol=1e-5,
                     err_msg=sens_label,
                 )
 
@@ -20,6 +20,7 @@ geom_dir = os.path.join(base_dir, '..', 'geom_files')
 
 geom_file = os.path.join(geom_dir, "aircraft.avl")
 mass_file = os.path.join(geom_dir, "aircraft.mass")
+geom_file_small = os.path.join(geom_dir, "aircraft_L1.avl")
 
 class TestEigenAnalysis(unittest.TestCase):
     def setUp(self):
@@ -108,6 +109,137 @@ class TestEigenAnalysis(unittest.TestCase):
                 # eigen vectors are realy not that accurate, only use ~5e-7
                 np.testing.assert_allclose(compute_vals[mask_small], vals_avl_sorted[idx_eig,], atol=5e-7, rtol=5e-7)
 
+    def test_body_axis_signs(self):
+        self.ovl_solver.set_trim_condition("velocity", 10)
+        self.ovl_solver.set_constraint("Elevator", "Cm", 0.00)
+        self.ovl_solver.execute_eigen_mode_calc()
+        Asys, Bsys, Rsys = self.ovl_solver.get_system_matrices()
+        Asys_body, Bsys_body, Rsys_body = self.ovl_solver.get_system_matrices(in_body_axis=True)
+
+        # u, w, p, r, x, z
+        usgn = np.array([-1, -1, 1, 1, 1, -1, -1, 1, -1, 1, -1, 1], dtype=float)
+        for i in range(Asys.shape[0]):
+            for j in range(Asys.shape[1]):
+                self.assertEqual(Asys_body[i, j], Asys[i, j] * usgn[i] * usgn[j])
+            np.testing.assert_array_equal(Bsys_body[i], Bsys[i] * usgn[i])
+        np.testing.assert_array_equal(Rsys_body, Rsys * usgn)
+
+    def test_batch(self):
+        vels = np.array([10.0, 12.0, 15.0])
+        self.ovl_solver.set_constraint("Elevator", "Cm", 0.00)
+        Asys_batch, Bsys_batch, Rsys_batch = self.ovl_solver.get_system_matrices_batch(
+            {"velocity": vels}, in_body_axis=True
+        )
+        self.assertEqual(Asys_batch.shape, (3, 12, 12))
+        self.assertEqual(Bsys_batch.shape, (3, 12, self.ovl_solver.get_num_control_surfs()))
+        self.assertEqual(Rsys_batch.shape, (3, 12))
+
+        for idx, vel in enumerate(vels):
+            ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+            ovl_ref.set_trim_condition("velocity", vel)
+            ovl_ref.set_constraint("Elevator", "Cm", 0.00)
+            ovl_ref.execute_eigen_mode_calc()
+            Asys, Bsys, Rsys = ovl_ref.get_system_matrices(in_body_axis=True)
+
+            np.testing.assert_allclose(Asys_batch[idx], Asys, rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(Bsys_batch[idx], Bsys, rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(Rsys_batch[idx], Rsys, rtol=1e-10, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            self.ovl_solver.get_system_matrices_batch({"velocity": vels, "CL": [0.5, 0.6]})
+
+    def test_eigen_sweep(self):
+        vels = np.linspace(10.0, 20.0, 6)
+        self.ovl_solver.set_constraint("Elevator", "Cm", 0.00)
+        eig_vals, eig_vecs = self.ovl_solver.execute_eigen_sweep({"velocity": vels})
+        self.assertEqual(eig_vals.shape[0], vels.size)
+        self.assertEqual(eig_vecs.shape[:2], eig_vals.shape)
+
+        # the AIC is only factored for the first point
+        self.assertEqual(self.ovl_solver.get_timings()["factor_aic"]["calls"], 1)
+
+        for idx, vel in enumerate(vels):
+            ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+            ovl_ref.set_trim_condition("velocity", vel)
+            ovl_ref.set_constraint("Elevator", "Cm", 0.00)
+            ovl_ref.execute_eigen_mode_calc()
+            vals_ref = ovl_ref.get_eigenvalues()
+            np.testing.assert_allclose(np.sort_complex(eig_vals[idx]), np.sort_complex(vals_ref), rtol=1e-8, atol=1e-10)
+
+        # each mode changes little between the points of the sweep, so it keeps its slot
+        rel_change = np.abs(np.diff(eig_vals, axis=0)) / np.abs(eig_vals[:-1])
+        np.testing.assert_array_less(rel_change, 0.5)
+
+    def test_match_modes(self):
+        rng = np.random.default_rng(0)
+        vecs = rng.random((4, 6)) + 1j * rng.random((4, 6))
+        vecs_prev = np.full((6, 6), np.nan, dtype=complex)
+        vecs_prev[:4] = vecs
+
+        perm = np.array([2, 0, 3, 1])
+        order = OVLSolver._match_modes(vecs_prev, 1.1 * vecs[perm] + 1e-3)
+        np.testing.assert_array_equal(order, perm)
+
+
+class TestEigenSensitivities(unittest.TestCase):
+    def setUp(self):
+        self.ovl_solver = self.make_solver()
+
+    @staticmethod
+    def make_solver():
+        ovl = OVLSolver(geo_file=geom_file_small, mass_file=mass_file)
+        ovl.set_parameter("velocity", 10.0)
+        ovl.set_variable("alpha", 5.0)
+        return ovl
+
+    @staticmethod
+    def get_eigenvalues(ovl):
+        ovl.execute_run()
+        ovl.execute_eigen_mode_calc(run=False)
+        return ovl.get_eigenvalues()
+
+    def check_fd(self, sens, idxs, setter, get_sens, step):
+        ovl_p = self.make_solver()
+        setter(ovl_p, step)
+        ovl_m = self.make_solver()
+        setter(ovl_m, -step)
+        eig_fd = (self.get_eigenvalues(ovl_p) - self.get_eigenvalues(ovl_m)) / (2 * step)
+
+        for idx in idxs:
+            eig_ad = get_sens(sens[f"eig {idx} real"]) + 1j * get_sens(sens[f"eig {idx} imag"])
+            np.testing.assert_allclose(eig_ad, eig_fd[idx], rtol=1e-5, atol=1e-8, err_msg=f"eig {idx}")
+
+    def test_eig_sens(self):
+        eig_vals = self.get_eigenvalues(self.ovl_solver)
+        idxs = list(range(len(eig_vals)))
+        sens = self.ovl_solver.execute_run_sensitivities([], eig_funcs=idxs)
+
+        self.check_fd(sens, idxs, lambda ovl, h: ovl.set_variable("alpha", 5.0 + h), lambda s: s["alpha"], 1e-4)
+        self.check_fd(sens, idxs, lambda ovl, h: ovl.set_parameter("velocity", 10.0 + h), lambda s: s["velocity"], 1e-5)
+        mass = self.ovl_solver.get_parameter("mass")
+        self.check_fd(sens, idxs, lambda ovl, h: ovl.set_parameter("mass", mass + h), lambda s: s["mass"], 1e-5)
+
+        surf = self.ovl_solver.get_surface_names()[0]
+        aincs = self.ovl_solver.get_surface_param(surf, "aincs")
+
+        def set_aincs(ovl, h):
+            aincs_pert = aincs.copy()
+            aincs_pert[0] += h
+            ovl.set_surface_param(surf, "aincs", aincs_pert)
+
+        self.check_fd(sens, idxs, set_aincs, lambda s: s[surf]["aincs"][0], 1e-4)
+
+    def test_bad_index(self):
+        self.get_eigenvalues(self.ovl_solver)
+        with self.assertRaises(ValueError):
+            self.ovl_solver.execute_run_sensitivities([], eig_funcs=[100])
+
+    def test_repeated_eigenvalue(self):
+        vals = np.array([-1.0 + 2.0j, -1.0 - 2.0j, -0.5, -0.5 + 1e-9])
+        self.assertEqual(OVLSolver._match_eigenvalue(vals, -1.0 - 2.0j + 1e-12, 1), 1)
+        with self.assertRaises(ValueError):
+            OVLSolver._match_eigenvalue(vals, -0.5, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
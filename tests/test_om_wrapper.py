@@ -1,7 +1,7 @@
 # =============================================================================
 # Extension modules
 # =============================================================================
-from optvl import OVLSolver, OVLGroup
+from optvl import OVLSolver, OVLGroup, OVLMultipointGroup
 
 # =============================================================================
 # Standard Python Modules
@@ -12,6 +12,7 @@ import os
 # External Python modules
 # =============================================================================
 import unittest
+from unittest import mock
 import numpy as np
 import openmdao.api as om
 import warnings
@@ -27,6 +28,7 @@ geom_dir = os.path.join(base_dir, "..", "geom_files")
 
 geom_file = os.path.join(geom_dir, "aircraft.avl")
 mass_file = os.path.join(geom_dir, "aircraft.mass")
+geom_file_small = os.path.join(geom_dir, "aircraft_L1.avl")
 
 
 class TestOMWrapper(unittest.TestCase):
@@ -129,6 +131,69 @@ class TestOMWrapper(unittest.TestCase):
                 om_val = prob.get_val(f"ovlsolver.{func}")
                 assert om_val == body_axis_derivs[func]
 
+    def test_funcs_reuse_solve(self):
+        prob = self.prob
+        prob.setup(mode="rev")
+        prob.set_val("ovlsolver.alpha", 3.0)
+        prob.run_model()
+
+        funcs = prob.model.ovlsolver.funcs
+        outputs = {func: prob.get_val(f"ovlsolver.{func}").copy() for func in funcs.ovl.case_var_to_fort_var}
+
+        avl = funcs.ovl.avl
+        with mock.patch.object(avl, "get_res", wraps=avl.get_res) as get_res, mock.patch.object(
+            avl, "velsum", wraps=avl.velsum
+        ) as velsum, mock.patch.object(avl, "aero", wraps=avl.aero) as aero:
+            # the forces come from the converged solve
+            funcs.run_solve_nonlinear()
+            get_res.assert_not_called()
+            velsum.assert_not_called()
+            aero.assert_not_called()
+
+            # recomputing them from the circulations gives the same values
+            funcs.ovl._om_state_hash = None
+            funcs.run_solve_nonlinear()
+            get_res.assert_not_called()
+            velsum.assert_called_once()
+            aero.assert_called_once()
+
+        for func in outputs:
+            np.testing.assert_allclose(prob.get_val(f"ovlsolver.{func}"), outputs[func], rtol=1e-14, err_msg=func)
+
+        # new inputs are not taken from the cache
+        prob.set_val("ovlsolver.alpha", 5.0)
+        prob.run_model()
+        self.ovl_solver.set_variable("alpha", 5.0)
+        self.ovl_solver.execute_run()
+        run_data = self.ovl_solver.get_total_forces()
+        for func in run_data:
+            np.testing.assert_allclose(prob.get_val(f"ovlsolver.{func}"), run_data[func], rtol=1e-14, err_msg=func)
+
+    def test_geom_reuse(self):
+        prob = self.prob
+        prob.setup(mode="rev")
+        prob.run_model()
+
+        ovl = prob.model.ovlsolver.solver.ovl
+        with mock.patch.object(ovl, "set_surface_params", wraps=ovl.set_surface_params) as set_surface_params:
+            # the geometry did not change, so it is not set again
+            prob.set_val("ovlsolver.alpha", 5.0)
+            prob.run_model()
+            set_surface_params.assert_not_called()
+
+            # the new geometry is set once and shared by the components
+            aincs = prob.get_val("ovlsolver.Wing:aincs") + 0.5
+            prob.set_val("ovlsolver.Wing:aincs", aincs)
+            prob.run_model()
+            set_surface_params.assert_called_once()
+
+        self.ovl_solver.set_surface_param("Wing", "aincs", aincs)
+        self.ovl_solver.set_variable("alpha", 5.0)
+        self.ovl_solver.execute_run()
+        run_data = self.ovl_solver.get_total_forces()
+        for func in run_data:
+            np.testing.assert_allclose(prob.get_val(f"ovlsolver.{func}"), run_data[func], rtol=1e-14, err_msg=func)
+
     def test_CL_solve(self):
         prob = self.prob
         cl_star = 1.5
@@ -220,6 +285,291 @@ class TestOMWrapper(unittest.TestCase):
                 err_msg=f"deriv of {key[0]} wrt {key[1]} does not agree with FD to rtol={rtol}",
             )
 
+    def test_OM_total_derivs_fwd(self):
+        prob = self.prob
+        prob.model.add_design_var("ovlsolver.Wing:aincs")
+        prob.model.add_design_var("ovlsolver.Elevator", lower=-10, upper=10)
+        prob.model.add_design_var("ovlsolver.alpha", lower=-10, upper=10)
+        prob.model.add_design_var("ovlsolver.Mach")
+        prob.model.add_constraint("ovlsolver.CL", equals=1.5)
+        prob.model.add_constraint("ovlsolver.Cm", equals=0.0)
+        prob.model.add_constraint("ovlsolver.dCL/dalpha", upper=0.0)
+        prob.model.add_objective("ovlsolver.CD", scaler=1e3)
+
+        totals = {}
+        for mode in ["rev", "fwd"]:
+            prob.setup(mode=mode)
+            prob.set_val("ovlsolver.alpha", 3.0)
+            prob.set_val("ovlsolver.Elevator", 2.0)
+            prob.run_model()
+            totals[mode] = prob.compute_totals()
+
+        for key, deriv in totals["rev"].items():
+            if key[0] == "ovlsolver.dCL/dalpha":
+                # the reverse AD of the stability derivatives only agrees with FD to about 1e-3
+                rtol = 5e-3
+                atol = 2e-5
+            else:
+                rtol = 1e-10
+                atol = 1e-12
+            np.testing.assert_allclose(
+                totals["fwd"][key], deriv, rtol=rtol, atol=atol, err_msg=f"deriv of {key[0]} wrt {key[1]}"
+            )
+
+
+
+class TestOMMultipoint(unittest.TestCase):
+    def setUp(self):
+        self.alphas = [1.0, 5.0]
+        self.machs = [0.1, 0.3]
+
+        model = om.Group()
+        model.add_subsystem(
+            "ovlsolver",
+            OVLMultipointGroup(
+                geom_file=geom_file,
+                mass_file=mass_file,
+                num_points=len(self.alphas),
+                output_stability_derivs=True,
+                input_param_vals=True,
+            ),
+        )
+        model.add_design_var("ovlsolver.Wing:aincs")
+        model.add_design_var("ovlsolver.point_1:alpha")
+        model.add_design_var("ovlsolver.point_1:Mach")
+        model.add_constraint("ovlsolver.point_0:CL", equals=0.5)
+        model.add_constraint("ovlsolver.point_1:dCm/dalpha", upper=0.0)
+        model.add_objective("ovlsolver.point_1:CD")
+
+        self.prob = om.Problem(model)
+        self.prob.setup(mode="rev")
+        for idx_point, (alpha, mach) in enumerate(zip(self.alphas, self.machs)):
+            self.prob.set_val(f"ovlsolver.point_{idx_point}:alpha", alpha)
+            self.prob.set_val(f"ovlsolver.point_{idx_point}:Mach", mach)
+
+    def test_aero_coef(self):
+        prob = self.prob
+        prob.run_model()
+
+        for idx_point, (alpha, mach) in enumerate(zip(self.alphas, self.machs)):
+            ovl_solver = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+            ovl_solver.set_variable("alpha", alpha)
+            ovl_solver.set_parameter("Mach", mach)
+            ovl_solver.execute_run()
+
+            run_data = ovl_solver.get_total_forces()
+            for func in run_data:
+                om_val = prob.get_val(f"ovlsolver.point_{idx_point}:{func}")
+                np.testing.assert_allclose(om_val, run_data[func], rtol=1e-14, atol=1e-15, err_msg=func)
+
+            stab_derivs = ovl_solver.get_stab_derivs()
+            for func in stab_derivs:
+                om_val = prob.get_val(f"ovlsolver.point_{idx_point}:{func}")
+                np.testing.assert_allclose(om_val, stab_derivs[func], rtol=1e-14, atol=1e-15, err_msg=func)
+
+    def test_OM_total_derivs(self):
+        prob = self.prob
+        prob.run_model()
+        totals = prob.compute_totals()
+
+        # the same problem with a separate OVLGroup for each point
+        model = om.Group()
+        geom_dvs = model.add_subsystem("geom_dvs", om.IndepVarComp())
+        geom_dvs.add_output("Wing:aincs", val=prob.get_val("ovlsolver.Wing:aincs"))
+        for idx_point in range(len(self.alphas)):
+            model.add_subsystem(
+                f"point_{idx_point}",
+                OVLGroup(geom_file=geom_file, mass_file=mass_file, output_stability_derivs=True, input_param_vals=True),
+            )
+            model.connect("geom_dvs.Wing:aincs", f"point_{idx_point}.Wing:aincs")
+        model.add_design_var("geom_dvs.Wing:aincs")
+        model.add_design_var("point_1.alpha")
+        model.add_design_var("point_1.Mach")
+        model.add_constraint("point_0.CL", equals=0.5)
+        model.add_constraint("point_1.dCm/dalpha", upper=0.0)
+        model.add_objective("point_1.CD")
+
+        prob_ref = om.Problem(model)
+        prob_ref.setup(mode="rev")
+        for idx_point, (alpha, mach) in enumerate(zip(self.alphas, self.machs)):
+            prob_ref.set_val(f"point_{idx_point}.alpha", alpha)
+            prob_ref.set_val(f"point_{idx_point}.Mach", mach)
+        prob_ref.run_model()
+        totals_ref = prob_ref.compute_totals()
+
+        def ref_key(key):
+            if key.startswith("ovlsolver.point_"):
+                return key.replace("ovlsolver.", "").replace(":", ".", 1)
+            return key.replace("ovlsolver.", "geom_dvs.")
+
+        for (of, wrt), deriv in totals.items():
+            deriv_ref = totals_ref[ref_key(of), ref_key(wrt)]
+            np.testing.assert_allclose(deriv, deriv_ref, rtol=1e-12, atol=1e-15, err_msg=f"d{of}/d{wrt}")
+
+    def test_OM_total_derivs_fwd(self):
+        prob = self.prob
+        prob.run_model()
+        totals = prob.compute_totals()
+
+        prob.setup(mode="fwd")
+        for idx_point, (alpha, mach) in enumerate(zip(self.alphas, self.machs)):
+            prob.set_val(f"ovlsolver.point_{idx_point}:alpha", alpha)
+            prob.set_val(f"ovlsolver.point_{idx_point}:Mach", mach)
+        prob.run_model()
+        totals_fwd = prob.compute_totals()
+
+        for (of, wrt), deriv in totals.items():
+            if of == "ovlsolver.point_1:dCm/dalpha":
+                # the reverse AD of the stability derivatives only agrees with FD to about 1e-3
+                rtol = 5e-3
+                atol = 2e-5
+            else:
+                rtol = 1e-10
+                atol = 1e-12
+            np.testing.assert_allclose(totals_fwd[of, wrt], deriv, rtol=rtol, atol=atol, err_msg=f"d{of}/d{wrt}")
+
+    def test_aic_reuse(self):
+        # the linear solves switch between the points, but the factored AIC of each Mach number is kept
+        alphas = [1.0, 3.0, 5.0]
+        machs = [0.1, 0.1, 0.3]
+        for mode in ["rev", "fwd"]:
+            model = om.Group()
+            model.add_subsystem(
+                "ovlsolver", OVLMultipointGroup(geom_file=geom_file_small, num_points=3, input_param_vals=True)
+            )
+            model.add_design_var("ovlsolver.Wing:aincs")
+            model.add_design_var("ovlsolver.point_1:alpha")
+            for idx_point in range(len(alphas)):
+                model.add_constraint(f"ovlsolver.point_{idx_point}:CL", equals=0.5)
+            model.add_objective("ovlsolver.point_1:CD")
+
+            prob = om.Problem(model)
+            prob.setup(mode=mode)
+            for idx_point, (alpha, mach) in enumerate(zip(alphas, machs)):
+                prob.set_val(f"ovlsolver.point_{idx_point}:alpha", alpha)
+                prob.set_val(f"ovlsolver.point_{idx_point}:Mach", mach)
+            prob.run_model()
+
+            ovl = prob.model.ovlsolver.ovl
+            ovl.reset_timings()
+            prob.compute_totals()
+            timings = ovl.get_timings()
+            self.assertEqual(timings["build_aic"]["calls"], 0, msg=mode)
+            self.assertEqual(timings["factor_aic"]["calls"], 0, msg=mode)
+
+    def test_newton(self):
+        # a Newton solver without solve_subsystems only evaluates the residuals of the solver component
+        def get_prob(newton):
+            model = om.Group()
+            group = model.add_subsystem(
+                "ovlsolver", OVLMultipointGroup(geom_file=geom_file_small, num_points=2, input_param_vals=True)
+            )
+            if newton:
+                group.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-12, rtol=1e-14, iprint=-1)
+                group.nonlinear_solver.options["err_on_non_converge"] = True
+            model.add_design_var("ovlsolver.Wing:aincs")
+            model.add_design_var("ovlsolver.point_1:alpha")
+            model.add_constraint("ovlsolver.point_0:CL", equals=0.5)
+            model.add_objective("ovlsolver.point_1:CD")
+
+            prob = om.Problem(model)
+            prob.setup(mode="rev")
+            for idx_point, (alpha, mach) in enumerate(zip(self.alphas, self.machs)):
+                prob.set_val(f"ovlsolver.point_{idx_point}:alpha", alpha)
+                prob.set_val(f"ovlsolver.point_{idx_point}:Mach", mach)
+            prob.run_model()
+            return prob
+
+        prob_ref = get_prob(False)
+        prob = get_prob(True)
+        for idx_point in range(len(self.alphas)):
+            for func in ["CL", "CD", "Cm"]:
+                name = f"ovlsolver.point_{idx_point}:{func}"
+                np.testing.assert_allclose(prob.get_val(name), prob_ref.get_val(name), rtol=1e-10, atol=1e-14, err_msg=name)
+
+        totals_ref = prob_ref.compute_totals()
+        totals = prob.compute_totals()
+        for key, deriv in totals_ref.items():
+            np.testing.assert_allclose(totals[key], deriv, rtol=1e-10, atol=1e-14, err_msg=f"d{key[0]}/d{key[1]}")
+
+
+class TestOMAssembledPartials(unittest.TestCase):
+    """The assembled partials of the solver must give the same totals as the matrix-vector products"""
+
+    def get_totals(self, mode, assemble_partials):
+        model = om.Group()
+        model.add_subsystem(
+            "ovlsolver",
+            OVLGroup(geom_file=geom_file_small, input_param_vals=True, assemble_partials=assemble_partials),
+        )
+        model.add_design_var("ovlsolver.Wing:aincs")
+        model.add_design_var("ovlsolver.Wing:chords")
+        model.add_design_var("ovlsolver.Elevator")
+        model.add_design_var("ovlsolver.alpha")
+        model.add_design_var("ovlsolver.Mach")
+        model.add_constraint("ovlsolver.CL", equals=0.5)
+        model.add_constraint("ovlsolver.Cm", equals=0.0)
+        model.add_objective("ovlsolver.CD")
+
+        prob = om.Problem(model)
+        prob.setup(mode=mode)
+        prob.set_val("ovlsolver.alpha", 5.0)
+        prob.set_val("ovlsolver.Elevator", 2.0)
+        prob.set_val("ovlsolver.Mach", 0.3)
+        prob.run_model()
+        return prob.compute_totals()
+
+    def test_OM_total_derivs(self):
+        totals_ref = self.get_totals("rev", False)
+        for mode in ["rev", "fwd"]:
+            totals = self.get_totals(mode, True)
+            for key, deriv in totals_ref.items():
+                np.testing.assert_allclose(
+                    totals[key], deriv, rtol=1e-10, atol=1e-12, err_msg=f"deriv of {key[0]} wrt {key[1]} in {mode}"
+                )
+
+
+class TestOMEigenvalues(unittest.TestCase):
+    """The totals of the eigenvalue outputs must match finite differences of the whole analysis"""
+
+    def setUp(self):
+        model = om.Group()
+        model.add_subsystem(
+            "ovlsolver",
+            OVLGroup(geom_file=geom_file_small, mass_file=mass_file, input_param_vals=True, output_eig_funcs=[0, 4, 6]),
+        )
+        model.add_design_var("ovlsolver.Wing:aincs")
+        model.add_design_var("ovlsolver.alpha")
+        model.add_design_var("ovlsolver.X cg")
+        model.add_design_var("ovlsolver.velocity")
+        model.add_constraint("ovlsolver.eig 4 real", upper=0.0)
+        model.add_constraint("ovlsolver.eig 6 imag", lower=0.0)
+        model.add_objective("ovlsolver.eig 0 real")
+        self.model = model
+
+    def test_OM_total_derivs(self):
+        for mode in ["rev", "fwd"]:
+            prob = om.Problem(self.model, reports=False)
+            prob.setup(mode=mode)
+            prob.set_val("ovlsolver.alpha", 5.0)
+            prob.set_val("ovlsolver.velocity", 10.0)
+            prob.run_model()
+
+            ovl = prob.model.ovlsolver.ovl
+            eig_vals = ovl.get_eigenvalues()
+            np.testing.assert_allclose(prob.get_val("ovlsolver.eig 4 real"), eig_vals[4].real, rtol=1e-14)
+            np.testing.assert_allclose(prob.get_val("ovlsolver.eig 6 imag"), eig_vals[6].imag, rtol=1e-14)
+
+            data = prob.check_totals(method="fd", step=1e-6, form="central", out_stream=None)
+            for key, deriv in data.items():
+                np.testing.assert_allclose(
+                    deriv["J_fwd"] if mode == "fwd" else deriv["J_rev"],
+                    deriv["J_fd"],
+                    rtol=1e-5,
+                    atol=1e-7,
+                    err_msg=f"deriv of {key[0]} wrt {key[1]} in {mode}",
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+# =============================================================================
+# Extension modules
+# =============================================================================
+from optvl import OVLSolver
+from optvl.parallel import SweepExecutor
+
+# =============================================================================
+# Standard Python Modules
+# =============================================================================
+import os
+
+# =============================================================================
+# External Python modules
+# =============================================================================
+import unittest
+import numpy as np
+
+
+base_dir = os.path.dirname(os.path.abspath(__file__))  # Path to current folder
+geom_dir = os.path.join(base_dir, "..", "geom_files")
+
+geom_file = os.path.join(geom_dir, "aircraft.avl")
+
+
+class TestSweepExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = SweepExecutor(geo_file=geom_file, num_workers=2, parameters={"Mach": 0.3})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def setUp(self):
+        self.ovl_solver = OVLSolver(geo_file=geom_file)
+        self.ovl_solver.set_parameter("Mach", 0.3)
+        self.alphas = np.linspace(-2.0, 8.0, 7)
+
+    def test_trimmed_sweep(self):
+        conditions = {"alpha": self.alphas, "Elevator": ("Cm", np.zeros(self.alphas.size))}
+        sweep_data = self.executor.run(conditions, chunk_size=3, stab_derivs=True)
+        ref_data = self.ovl_solver.execute_run_batch(conditions, stab_derivs=True)
+
+        self.assertEqual(sweep_data.dtype, ref_data.dtype)
+        for key in ["alpha", "Elevator", "CL", "CD", "Cm", "dCm/dalpha"]:
+            np.testing.assert_allclose(sweep_data[key], ref_data[key], rtol=1e-8, atol=1e-10, err_msg=key)
+
+    def test_parameter_sweep(self):
+        machs = np.repeat([0.0, 0.3, 0.5], 2)
+        alphas = np.tile([1.0, 4.0], 3)
+        sweep_data = self.executor.run({"alpha": alphas}, parameters={"Mach": machs})
+
+        for idx_case, (mach, alpha) in enumerate(zip(machs, alphas)):
+            self.ovl_solver.set_parameter("Mach", mach)
+            self.ovl_solver.set_variable("alpha", alpha)
+            self.ovl_solver.execute_run()
+            force_data = self.ovl_solver.get_total_forces()
+            for key in ["CL", "CD", "Cm"]:
+                np.testing.assert_allclose(sweep_data[key][idx_case], force_data[key], rtol=1e-12, err_msg=key)
+
+    def test_imap(self):
+        shards = list(self.executor.imap({"alpha": self.alphas}, chunk_size=2))
+        self.assertEqual(len(shards), 4)
+        idx_cases = np.sort(np.concatenate([idx for idx, _ in shards]))
+        np.testing.assert_equal(idx_cases, np.arange(self.alphas.size))
+
+
+class TestThreadSweep(unittest.TestCase):
+    def test_failed_shard(self):
+        # a shard that raises must not leave its parameters on the worker for the next shard
+        with SweepExecutor(geo_file=geom_file, num_workers=1, start_method="thread", parameters={"Mach": 0.3}) as executor:
+            with self.assertRaises(ValueError):
+                executor.run({"bogus": np.zeros(2)}, parameters={"Mach": np.full(2, 0.5)})
+            sweep_data = executor.run({"alpha": np.array([4.0])})
+
+        ovl_solver = OVLSolver(geo_file=geom_file)
+        ovl_solver.set_parameter("Mach", 0.3)
+        ref_data = ovl_solver.execute_run_batch({"alpha": np.array([4.0])})
+        np.testing.assert_allclose(sweep_data["CL"], ref_data["CL"], rtol=1e-12)
+
+    def test_thread_workers(self):
+        # each thread has its own solver and the Fortran kernels release the GIL
+        conditions = {"alpha": np.linspace(-2.0, 8.0, 6), "Elevator": ("Cm", np.zeros(6))}
+        with SweepExecutor(geo_file=geom_file, num_workers=3, start_method="thread") as executor:
+            sweep_data = executor.run(conditions, chunk_size=2)
+
+        ref_data = OVLSolver(geo_file=geom_file).execute_run_batch(conditions)
+        for key in ["alpha", "Elevator", "CL", "CD", "Cm"]:
+            np.testing.assert_allclose(sweep_data[key], ref_data[key], rtol=1e-8, atol=1e-10, err_msg=key)
+
+
+if __name__ == "__main__":
+    unittest.main()
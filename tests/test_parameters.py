@@ -13,6 +13,7 @@ import copy
 # External Python modules
 # =============================================================================
 import unittest
+import numpy as np
 
 
 base_dir = os.path.dirname(os.path.abspath(__file__))  # Path to current folder
@@ -120,5 +121,35 @@ class TestReferenceAPI(unittest.TestCase):
             self.assertEqual(param_updated[key], new_data[key], msg=key)
 
 
+class TestFortArrAPI(unittest.TestCase):
+    """get/set_avl_fort_arr read and write the common block variables in place, in C ordering"""
+
+    def setUp(self):
+        self.ovl_solver = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+
+    def test_get_view(self):
+        self.ovl_solver.execute_run()
+        cfstrp = self.ovl_solver.get_avl_fort_arr("STRP_R", "CFSTRP")
+        np.testing.assert_array_equal(cfstrp, self.ovl_solver.avl.STRP_R.CFSTRP.T)
+
+        # the returned array is a view of the common block
+        cfstrp[0, 1] = 12.5
+        self.assertEqual(self.ovl_solver.avl.STRP_R.CFSTRP[1, 0], 12.5)
+
+    def test_set_slices(self):
+        rle = np.arange(6, dtype=float).reshape(2, 3)
+        self.ovl_solver.set_avl_fort_arr("STRP_R", "RLE", rle, slicer=(slice(0, 2), slice(None)))
+        np.testing.assert_array_equal(self.ovl_solver.avl.STRP_R.RLE[:, :2], rle.T)
+
+        self.ovl_solver.set_avl_fort_arr("STRP_R", "CHORD", 3.0, slicer=4)
+        self.assertEqual(self.ovl_solver.get_avl_fort_arr("STRP_R", "CHORD", slicer=4), 3.0)
+
+        self.ovl_solver.set_avl_fort_arr("STRP_R", "WSTRIP", 0.0)
+        self.assertFalse(np.any(self.ovl_solver.get_avl_fort_arr("STRP_R", "WSTRIP")))
+
+        self.ovl_solver.set_avl_fort_arr("CASE_R", "XYZREF", np.array([0.1, 0.2, 0.3]))
+        np.testing.assert_array_equal(self.ovl_solver.get_avl_fort_arr("CASE_R", "XYZREF"), [0.1, 0.2, 0.3])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -103,5 +103,60 @@ class TestGeom(unittest.TestCase):
         )
 
 
+class TestModifiedSurfaces(unittest.TestCase):
+    """Only the surfaces that were changed are remade, which must match remaking every surface"""
+
+    def setUp(self):
+        self.ovl_solver = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        self.ovl_ref = OVLSolver(geo_file=geom_file, mass_file=mass_file)
+        for ovl in [self.ovl_solver, self.ovl_ref]:
+            ovl.set_variable("alpha", 3.0)
+            ovl.execute_run()
+
+    def check_against_full_update(self, surf_data):
+        self.ovl_solver.set_surface_params(surf_data)
+        for surf, data in surf_data.items():
+            for key, val in data.items():
+                self.ovl_ref.set_surface_param(surf, key, val, update_geom=False)
+        self.ovl_ref.avl.update_surfaces()
+
+        for ovl in [self.ovl_solver, self.ovl_ref]:
+            ovl.execute_run()
+
+        run_data = self.ovl_solver.get_total_forces()
+        run_data_ref = self.ovl_ref.get_total_forces()
+        for key in run_data_ref:
+            np.testing.assert_allclose(run_data[key], run_data_ref[key], rtol=1e-14, atol=1e-14, err_msg=key)
+
+    def test_geom_change(self):
+        self.check_against_full_update({"Wing": {"aincs": np.array([1.0, 1.0, 0.5, 0.5, 0.0])}})
+        self.assertFalse(any(self.ovl_solver.get_avl_fort_arr("SURF_GEOM_L", "LSURFMOD")))
+
+    def test_size_change(self):
+        # changing the number of vortices shifts the surfaces after the wing, so all are remade
+        self.check_against_full_update({"Wing": {"nchordwise": 9}, "Horizontal Tail": {"scale": np.array([1.1, 1.0, 1.0])}})
+
+    def test_aic_blocks(self):
+        # only the AIC rows and columns of the tail are rebuilt
+        surf_data = {"Horizontal Tail": {"translate": np.array([0.1, 0.0, 0.05])}}
+        self.ovl_solver.set_surface_params(surf_data)
+        self.assertTrue(self.ovl_solver.get_avl_fort_arr("CASE_L", "LAICBLK"))
+
+        self.check_against_full_update(surf_data)
+        self.assertFalse(self.ovl_solver.get_avl_fort_arr("CASE_L", "LAICBLK"))
+
+        stab_derivs = self.ovl_solver.get_stab_derivs()
+        stab_derivs_ref = self.ovl_ref.get_stab_derivs()
+        for key in stab_derivs_ref:
+            np.testing.assert_allclose(
+                stab_derivs[key], stab_derivs_ref[key], rtol=1e-14, atol=1e-14, err_msg=key
+            )
+
+    def test_no_change(self):
+        # setting the current values does not invalidate the factored AIC
+        self.ovl_solver.set_surface_params(self.ovl_solver.get_surface_params())
+        self.assertTrue(self.ovl_solver.get_avl_fort_arr("CASE_L", "LAIC"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -477,6 +477,40 @@ class TestTotals(unittest.TestCase):
                         err_msg=f"{func_key}  wrt {ref_key}",
                     )
 
+    def test_stacked_adjoint(self):
+        # the adjoints of all the functions are solved together, so check that
+        # stacking them gives the same result as solving for each one alone
+        funcs = ["CL", "CD", "Cm"]
+        stab_derivs = ["dCm/dalpha", "static margin"]
+        body_axis_derivs = ["dCm/dq"]
+        consurf_derivs = [self.ovl_solver._get_deriv_key(self.ovl_solver.get_control_names()[0], "CL")]
+
+        sens = self.ovl_solver.execute_run_sensitivities(
+            funcs, stab_derivs=stab_derivs, body_axis_derivs=body_axis_derivs, consurf_derivs=consurf_derivs
+        )
+
+        sens_single = {}
+        for func_key in funcs:
+            sens_single.update(self.ovl_solver.execute_run_sensitivities([func_key]))
+        for func_key in stab_derivs:
+            sens_single.update(self.ovl_solver.execute_run_sensitivities([], stab_derivs=[func_key]))
+        for func_key in body_axis_derivs:
+            sens_single.update(self.ovl_solver.execute_run_sensitivities([], body_axis_derivs=[func_key]))
+        for func_key in consurf_derivs:
+            sens_single.update(self.ovl_solver.execute_run_sensitivities([], consurf_derivs=[func_key]))
+
+        for func_key in sens_single:
+            for dv_key, val in sens_single[func_key].items():
+                if isinstance(val, dict):
+                    for key in val:
+                        np.testing.assert_allclose(
+                            sens[func_key][dv_key][key], val[key], rtol=1e-12, atol=1e-14, err_msg=f"{func_key} wrt {dv_key} {key}"
+                        )
+                else:
+                    np.testing.assert_allclose(
+                        sens[func_key][dv_key], val, rtol=1e-12, atol=1e-14, err_msg=f"{func_key} wrt {dv_key}"
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()